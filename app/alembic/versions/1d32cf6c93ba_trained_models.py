@@ -0,0 +1,36 @@
+"""trained models
+
+Revision ID: 1d32cf6c93ba
+Revises: 4aa52d55c274
+Create Date: 2026-10-18 12:04:31.127554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d32cf6c93ba'
+down_revision: Union[str, None] = '4aa52d55c274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('trained_models',
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('path', sa.String(), nullable=False),
+    sa.Column('synthesizer_type', sa.String(), nullable=False),
+    sa.Column('augmentation_factor', sa.Integer(), nullable=False),
+    sa.Column('features', sa.String(), nullable=False),
+    sa.Column('accuracy', sa.Float(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['task_id'], ['task_status.id'], ),
+    sa.PrimaryKeyConstraint('task_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('trained_models')
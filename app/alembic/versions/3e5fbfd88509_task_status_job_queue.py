@@ -0,0 +1,42 @@
+"""task status job queue
+
+Revision ID: 3e5fbfd88509
+Revises: cf3c1ee79679
+Create Date: 2026-10-18 11:02:47.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e5fbfd88509'
+down_revision: Union[str, None] = 'cf3c1ee79679'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('task_status', sa.Column('job_type', sa.String(), nullable=True))
+    op.add_column('task_status', sa.Column('payload', sa.String(), nullable=True))
+    op.add_column('task_status', sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('task_status', sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='1'))
+    op.add_column('task_status', sa.Column('available_at', sa.DateTime(), nullable=True))
+    op.add_column('task_status', sa.Column('locked_by', sa.String(), nullable=True))
+    op.add_column('task_status', sa.Column('locked_at', sa.DateTime(), nullable=True))
+    op.add_column('task_status', sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_task_status_status_available_at', 'task_status', ['status', 'available_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_status_status_available_at', table_name='task_status')
+    op.drop_column('task_status', 'heartbeat_at')
+    op.drop_column('task_status', 'locked_at')
+    op.drop_column('task_status', 'locked_by')
+    op.drop_column('task_status', 'available_at')
+    op.drop_column('task_status', 'max_attempts')
+    op.drop_column('task_status', 'attempts')
+    op.drop_column('task_status', 'payload')
+    op.drop_column('task_status', 'job_type')
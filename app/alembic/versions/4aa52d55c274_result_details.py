@@ -0,0 +1,29 @@
+"""result details
+
+Revision ID: 4aa52d55c274
+Revises: 3e5fbfd88509
+Create Date: 2026-10-18 11:31:05.642980
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4aa52d55c274'
+down_revision: Union[str, None] = '3e5fbfd88509'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('results', sa.Column('details', sa.String(), nullable=True))
+    op.alter_column('results', 'accuracy', existing_type=sa.Float(), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM results WHERE accuracy IS NULL")
+    op.alter_column('results', 'accuracy', existing_type=sa.Float(), nullable=False)
+    op.drop_column('results', 'details')
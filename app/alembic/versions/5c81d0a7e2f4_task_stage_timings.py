@@ -0,0 +1,26 @@
+"""task stage timings
+
+Revision ID: 5c81d0a7e2f4
+Revises: 1d32cf6c93ba
+Create Date: 2026-10-18 15:42:17.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c81d0a7e2f4'
+down_revision: Union[str, None] = '1d32cf6c93ba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('task_status', sa.Column('stage_timings', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('task_status', 'stage_timings')
@@ -0,0 +1,41 @@
+"""evaluation results
+
+Revision ID: 8b2f6d41c9a3
+Revises: 5c81d0a7e2f4
+Create Date: 2026-10-18 17:21:48.605193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2f6d41c9a3'
+down_revision: Union[str, None] = '5c81d0a7e2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('evaluation_results',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('synthetic_data_id', sa.Integer(), nullable=False),
+    sa.Column('real_data_fingerprint', sa.String(), nullable=False),
+    sa.Column('suite_version', sa.String(), nullable=False),
+    sa.Column('options', sa.String(), nullable=False),
+    sa.Column('scores', sa.String(), nullable=False),
+    sa.Column('details', sa.String(), nullable=False),
+    sa.Column('evaluation_seconds', sa.Float(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['synthetic_data_id'], ['synthetic_data_titanic.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('synthetic_data_id', 'real_data_fingerprint', 'suite_version', 'options')
+    )
+    op.create_index(op.f('ix_evaluation_results_synthetic_data_id'), 'evaluation_results', ['synthetic_data_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_evaluation_results_synthetic_data_id'), table_name='evaluation_results')
+    op.drop_table('evaluation_results')
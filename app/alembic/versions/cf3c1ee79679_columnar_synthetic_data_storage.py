@@ -0,0 +1,125 @@
+"""columnar synthetic data storage
+
+Revision ID: cf3c1ee79679
+Revises: 86372e4ac629
+Create Date: 2026-10-18 10:40:12.318042
+
+"""
+import io
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cf3c1ee79679'
+down_revision: Union[str, None] = '86372e4ac629'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the encoding used by app.persistence.columnar_codec at the time of this migration
+CHUNK_ROWS = 50_000
+
+synthetic_data = sa.table(
+    'synthetic_data_titanic',
+    sa.column('id', sa.Integer),
+    sa.column('data', sa.String),
+    sa.column('row_count', sa.Integer),
+    sa.column('data_schema', sa.String),
+    sa.column('chunk_rows', sa.Integer),
+    sa.column('chunk_offsets', sa.String),
+)
+
+synthetic_data_chunks = sa.table(
+    'synthetic_data_chunks',
+    sa.column('synthetic_data_id', sa.Integer),
+    sa.column('chunk_index', sa.Integer),
+    sa.column('row_offset', sa.Integer),
+    sa.column('row_count', sa.Integer),
+    sa.column('payload', sa.LargeBinary),
+)
+
+
+def upgrade() -> None:
+    op.add_column('synthetic_data_titanic', sa.Column('row_count', sa.Integer(), nullable=True))
+    op.add_column('synthetic_data_titanic', sa.Column('data_schema', sa.String(), nullable=True))
+    op.add_column('synthetic_data_titanic', sa.Column('chunk_rows', sa.Integer(), nullable=True))
+    op.add_column('synthetic_data_titanic', sa.Column('chunk_offsets', sa.String(), nullable=True))
+    op.add_column('synthetic_data_titanic', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.create_table('synthetic_data_chunks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('synthetic_data_id', sa.Integer(), nullable=False),
+    sa.Column('chunk_index', sa.Integer(), nullable=False),
+    sa.Column('row_offset', sa.Integer(), nullable=False),
+    sa.Column('row_count', sa.Integer(), nullable=False),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.ForeignKeyConstraint(['synthetic_data_id'], ['synthetic_data_titanic.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('synthetic_data_id', 'chunk_index')
+    )
+    op.create_index(op.f('ix_synthetic_data_chunks_synthetic_data_id'), 'synthetic_data_chunks', ['synthetic_data_id'], unique=False)
+
+    # Convert every JSON blob into Parquet chunks, one dataset at a time to keep memory bounded
+    connection = op.get_bind()
+    ids = [row.id for row in connection.execute(sa.select(synthetic_data.c.id).order_by(synthetic_data.c.id))]
+    for synthetic_data_id in ids:
+        blob = connection.execute(
+            sa.select(synthetic_data.c.data).where(synthetic_data.c.id == synthetic_data_id)
+        ).scalar()
+        frame = pd.read_json(io.StringIO(blob)) if blob else pd.DataFrame()
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+
+        offsets = []
+        for chunk_index, offset in enumerate(range(0, max(table.num_rows, 1), CHUNK_ROWS)):
+            chunk = table.slice(offset, CHUNK_ROWS)
+            buffer = io.BytesIO()
+            pq.write_table(chunk, buffer, compression='zstd')
+            connection.execute(synthetic_data_chunks.insert().values(
+                synthetic_data_id=synthetic_data_id, chunk_index=chunk_index, row_offset=offset,
+                row_count=chunk.num_rows, payload=buffer.getvalue(),
+            ))
+            offsets.append(offset)
+
+        connection.execute(synthetic_data.update().where(synthetic_data.c.id == synthetic_data_id).values(
+            row_count=table.num_rows,
+            data_schema=json.dumps([{"name": field.name, "type": str(field.type)} for field in table.schema]),
+            chunk_rows=CHUNK_ROWS,
+            chunk_offsets=json.dumps(offsets),
+        ))
+
+    op.alter_column('synthetic_data_titanic', 'row_count', nullable=False)
+    op.alter_column('synthetic_data_titanic', 'data_schema', nullable=False)
+    op.alter_column('synthetic_data_titanic', 'chunk_rows', nullable=False)
+    op.alter_column('synthetic_data_titanic', 'chunk_offsets', nullable=False)
+    op.drop_column('synthetic_data_titanic', 'data')
+
+
+def downgrade() -> None:
+    op.add_column('synthetic_data_titanic', sa.Column('data', sa.String(), nullable=True))
+
+    connection = op.get_bind()
+    ids = [row.id for row in connection.execute(sa.select(synthetic_data.c.id).order_by(synthetic_data.c.id))]
+    for synthetic_data_id in ids:
+        payloads = connection.execute(
+            sa.select(synthetic_data_chunks.c.payload)
+            .where(synthetic_data_chunks.c.synthetic_data_id == synthetic_data_id)
+            .order_by(synthetic_data_chunks.c.chunk_index)
+        ).scalars().all()
+        tables = [pq.read_table(pa.BufferReader(payload)) for payload in payloads]
+        frame = pa.concat_tables(tables).to_pandas() if tables else pd.DataFrame()
+        connection.execute(synthetic_data.update().where(synthetic_data.c.id == synthetic_data_id).values(
+            data=frame.to_json(orient='records'),
+        ))
+
+    op.drop_index(op.f('ix_synthetic_data_chunks_synthetic_data_id'), table_name='synthetic_data_chunks')
+    op.drop_table('synthetic_data_chunks')
+    op.drop_column('synthetic_data_titanic', 'created_at')
+    op.drop_column('synthetic_data_titanic', 'chunk_offsets')
+    op.drop_column('synthetic_data_titanic', 'chunk_rows')
+    op.drop_column('synthetic_data_titanic', 'data_schema')
+    op.drop_column('synthetic_data_titanic', 'row_count')
@@ -0,0 +1,106 @@
+"""
+Pluggable key-value caches used in front of the API's repositories.
+
+``InMemoryCache`` is a per-process LRU; ``RedisCache`` is shared by every uvicorn worker and is the one
+to use when more than one API process runs. Values are strings, and every lookup is counted in the
+``cache_requests_total`` metric, so the hit rate of each cache can be graphed.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.core.metrics import CACHE_REQUESTS
+
+
+class Cache:
+    """
+        Interface of the caches.
+
+        Methods:
+            get(key): Returns the cached value, or None.
+            set(key, value, ttl_seconds): Caches a value, forever when ``ttl_seconds`` is None.
+            delete(*keys): Drops entries.
+    """
+    def __init__(self, name: str):
+        self.name = name
+
+    async def get(self, key: str) -> str | None:
+        value = await self._get(key)
+        CACHE_REQUESTS.labels(cache=self.name, result="miss" if value is None else "hit").inc()
+        return value
+
+    async def _get(self, key: str) -> str | None:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: str, ttl_seconds: float | None = None):
+        raise NotImplementedError
+
+    async def delete(self, *keys: str):
+        raise NotImplementedError
+
+
+class InMemoryCache(Cache):
+    """Bounded LRU cache private to the process, with per-entry expiry."""
+
+    def __init__(self, name: str, max_entries: int):
+        super().__init__(name)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def _get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: str, ttl_seconds: float | None = None):
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+class RedisCache(Cache):
+    """Cache shared by every API process, stored in Redis under ``<prefix><name>:<key>``."""
+
+    def __init__(self, name: str, url: str, prefix: str = "app:"):
+        super().__init__(name)
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url, decode_responses=True)
+        self._prefix = f"{prefix}{name}:"
+
+    async def _get(self, key: str) -> str | None:
+        return await self._redis.get(self._prefix + key)
+
+    async def set(self, key: str, value: str, ttl_seconds: float | None = None):
+        ttl_ms = int(ttl_seconds * 1000) if ttl_seconds is not None else None
+        await self._redis.set(self._prefix + key, value, px=ttl_ms)
+
+    async def delete(self, *keys: str):
+        if keys:
+            await self._redis.delete(*(self._prefix + key for key in keys))
+
+
+def build_cache(name: str) -> Cache:
+    """Cache of the backend selected by ``settings.cache_backend``."""
+    if settings.cache_backend == "redis":
+        if not settings.cache_redis_url:
+            raise ValueError("cache_redis_url must be set to use the redis cache backend")
+        return RedisCache(name, settings.cache_redis_url)
+    return InMemoryCache(name, settings.cache_max_entries)
@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 import os
@@ -7,14 +9,132 @@ class Settings(BaseSettings):
        Settings class to handle environment variables using the Pydantic library.
        Attributes:
            database_url (str): The URL of the database.
+           async_database_url (str | None): URL used by the async API path; derived from ``database_url``
+               with the asyncpg (or aiosqlite) driver when unset.
+           db_pool_size (int): Connections kept open in the pool of each process.
+           db_max_overflow (int): Extra connections opened on demand above ``db_pool_size``.
+           db_pool_timeout_seconds (float): How long a request waits for a free connection before failing.
+           db_pool_recycle_seconds (int): Age after which a pooled connection is replaced.
+           db_pool_pre_ping (bool): Whether connections are tested before they are handed out.
            secret_key (str): Secret key for JWT encoding.
            algorithm (str): Algorithm used for JWT encoding, default is "HS256".
+           auth_token_cache_max_entries (int): Verified JWTs kept by the auth middleware of each process.
+           auth_token_cache_ttl_seconds (float): How long a verified JWT is trusted without decoding it again;
+               never longer than its ``exp`` claim.
            csv (str): Path to the CSV file used for synthetic data.
+           synthesizer_cache_dir (str): Directory where fitted synthesizers are cached.
+           synthesizer_cache_max_bytes (int): Size cap of the on-disk synthesizer cache.
+           synthesizer_cache_max_memory_entries (int): Number of fitted synthesizers kept in memory.
+           incremental_refit_enabled (bool): Whether a synthesizer is updated with the rows appended to its source
+               CSV instead of being fitted from scratch.
+           incremental_refit_block_rows (int): Number of rows per hashed block when detecting appended rows.
+           incremental_refit_max_delta_ratio (float): Rows that may be added incrementally since the last full fit,
+               relative to its rows, before fitting from scratch again.
+           incremental_refit_gan_epochs (int): Fine-tuning epochs of CTGAN and CopulaGAN on appended rows.
+           incremental_refit_replay_ratio (float): Earlier rows replayed per appended row when fine-tuning a GAN.
+           stream_batch_size (int): Default number of rows sampled per batch when streaming synthetic data.
+           stream_max_rows (int): Maximum number of rows a single streaming request may ask for.
+           stream_max_batch_size (int): Largest batch a streaming request may ask for; bounds its peak memory.
+           synthetic_data_chunk_rows (int): Number of rows per stored Parquet chunk of a synthetic dataset.
+           worker_concurrency (int): Number of job-executing processes started by the worker.
+           worker_poll_interval_seconds (float): How long an idle worker process waits before polling for jobs again.
+           worker_preload_ml_modules (bool): Whether worker processes import sdv, sdmetrics and sklearn when they
+               start rather than on their first job.
+           job_heartbeat_interval_seconds (float): How often a running job records a heartbeat.
+           job_heartbeat_timeout_seconds (float): Heartbeat age after which a running job is considered orphaned.
+           job_max_attempts (int): Number of times a job is attempted before it is marked as failed.
+           job_retry_backoff_seconds (float): Delay before the first retry; doubled on every further attempt.
+           job_retry_backoff_max_seconds (float): Upper bound of the retry delay.
+           compare_max_workers (int): Maximum number of processes used to compare synthesizers in parallel.
+           dataset_cache_dir (str): Directory of the memory-mapped preprocessed dataset variants.
+           anonymization_key (str | None): Secret for HMAC-SHA256 anonymization; plain SHA-256 when unset.
+           anonymization_max_workers (int): Number of workers hashing a large column in parallel.
+           anonymization_parallel_threshold (int): Distinct values in a column above which hashing is parallelized.
+           anonymization_executor (str): "process" or "thread" pool used for parallel hashing.
+           trained_model_dir (str): Directory where trained model artifacts are stored.
+           trained_model_max_loaded (int): Number of models kept loaded for inference.
+           blocking_executor_max_workers (int): Threads running blocking DataService calls for the API.
+           bcrypt_rounds (int): Cost factor of new bcrypt password hashes; older hashes are upgraded on login.
+           password_hashing_max_workers (int): Threads hashing and verifying passwords in each API process.
+           password_hashing_max_queue (int): Password hashing calls allowed to wait for a thread before
+               login and register answer 503.
+           password_hashing_retry_after_seconds (int): Retry-After sent with that 503.
+           training_cpu_budget (int | None): Cores a worker process may use for training; defaults to its share
+               of the host's CPUs (CPUs / worker_concurrency).
+           cache_backend (str): "memory" for a per-process LRU, or "redis" to share cached task statuses and
+               results between API processes.
+           cache_redis_url (str | None): URL of the Redis server used by the "redis" cache backend.
+           cache_max_entries (int): Entries kept by each in-memory cache.
+           status_cache_in_flight_ttl_seconds (float): How long a queued or running task's status is cached;
+               completed and failed tasks are cached until they are updated.
+           synthetic_data_page_max_rows (int): Rows a single read of a stored synthetic dataset may return.
+           batch_sample_max_workers (int): Processes sampling the datasets of a batch generation job in parallel.
+           batch_max_total_rows (int): Total rows a batch generation request may ask for.
+           profile_dir (str): Directory of the cProfile dumps of runs started with the ``profile`` flag.
+           progress_channel (str): PostgreSQL NOTIFY channel carrying job progress from workers to the API.
+           progress_epoch_poll_seconds (float): How often a worker checks the epoch of a GAN being fitted.
+           progress_keepalive_seconds (float): Interval of the keep-alive comments sent on idle event streams.
+           progress_subscriber_queue_size (int): Events buffered per event stream; the oldest are dropped
+               when a client falls behind.
        """
     database_url: str = Field(..., env='DATABASE_URL')
+    async_database_url: Optional[str] = Field(default=None)
+    db_pool_size: int = Field(default=10)
+    db_max_overflow: int = Field(default=20)
+    db_pool_timeout_seconds: float = Field(default=30.0)
+    db_pool_recycle_seconds: int = Field(default=1800)
+    db_pool_pre_ping: bool = Field(default=True)
     secret_key: str = Field(..., env='SECRET_KEY')
     algorithm: str = Field(default="HS256")
+    auth_token_cache_max_entries: int = Field(default=10_000)
+    auth_token_cache_ttl_seconds: float = Field(default=300.0)
     csv: str = Field(default=os.path.join(os.path.dirname(__file__), "../../tested.csv"))
+    synthesizer_cache_dir: str = Field(default=os.path.join(os.path.dirname(__file__), "../../.cache/synthesizers"))
+    synthesizer_cache_max_bytes: int = Field(default=2 * 1024 ** 3)
+    synthesizer_cache_max_memory_entries: int = Field(default=8)
+    incremental_refit_enabled: bool = Field(default=True)
+    incremental_refit_block_rows: int = Field(default=10_000)
+    incremental_refit_max_delta_ratio: float = Field(default=0.5)
+    incremental_refit_gan_epochs: int = Field(default=20)
+    incremental_refit_replay_ratio: float = Field(default=1.0)
+    stream_batch_size: int = Field(default=10_000)
+    stream_max_rows: int = Field(default=10_000_000)
+    stream_max_batch_size: int = Field(default=100_000)
+    synthetic_data_chunk_rows: int = Field(default=50_000)
+    worker_concurrency: int = Field(default=2)
+    worker_poll_interval_seconds: float = Field(default=2.0)
+    worker_preload_ml_modules: bool = Field(default=True)
+    job_heartbeat_interval_seconds: float = Field(default=15.0)
+    job_heartbeat_timeout_seconds: float = Field(default=120.0)
+    job_max_attempts: int = Field(default=3)
+    job_retry_backoff_seconds: float = Field(default=30.0)
+    job_retry_backoff_max_seconds: float = Field(default=900.0)
+    compare_max_workers: int = Field(default=3)
+    dataset_cache_dir: str = Field(default=os.path.join(os.path.dirname(__file__), "../../.cache/datasets"))
+    anonymization_key: Optional[str] = Field(default=None)
+    anonymization_max_workers: int = Field(default=4)
+    anonymization_parallel_threshold: int = Field(default=200_000)
+    anonymization_executor: Literal["process", "thread"] = Field(default="process")
+    trained_model_dir: str = Field(default=os.path.join(os.path.dirname(__file__), "../../models"))
+    trained_model_max_loaded: int = Field(default=4)
+    blocking_executor_max_workers: int = Field(default=8)
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
+    password_hashing_max_workers: int = Field(default=2)
+    password_hashing_max_queue: int = Field(default=32)
+    password_hashing_retry_after_seconds: int = Field(default=1)
+    training_cpu_budget: Optional[int] = Field(default=None)
+    cache_backend: Literal["memory", "redis"] = Field(default="memory")
+    cache_redis_url: Optional[str] = Field(default=None)
+    cache_max_entries: int = Field(default=10_000)
+    status_cache_in_flight_ttl_seconds: float = Field(default=2.0)
+    synthetic_data_page_max_rows: int = Field(default=10_000)
+    batch_sample_max_workers: int = Field(default=4)
+    batch_max_total_rows: int = Field(default=1_000_000)
+    profile_dir: str = Field(default=os.path.join(os.path.dirname(__file__), "../../.cache/profiles"))
+    progress_channel: str = Field(default="task_progress")
+    progress_epoch_poll_seconds: float = Field(default=1.0)
+    progress_keepalive_seconds: float = Field(default=15.0)
+    progress_subscriber_queue_size: int = Field(default=100)
     class Config:
         # Specify the path to the .env file
         env_file = os.path.join(os.path.dirname(__file__), '../../.env')
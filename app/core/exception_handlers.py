@@ -25,6 +25,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
             "status_code": exc.status_code,
             "error": "HTTPException"
         },
+        # e.g. Retry-After of a 503, or WWW-Authenticate of a 401
+        headers=getattr(exc, "headers", None),
     )
 
 async def validation_exception_handler(request: Request, exc):
@@ -0,0 +1,85 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import EXECUTOR_CALL_SECONDS, EXECUTOR_PENDING, EXECUTOR_QUEUE_SECONDS, EXECUTOR_REJECTED
+
+T = TypeVar("T")
+
+# Bounded, so a burst of heavy requests queues here instead of starving the event loop's default pool
+blocking_executor = ThreadPoolExecutor(
+    max_workers=settings.blocking_executor_max_workers, thread_name_prefix="blocking"
+)
+
+
+async def run_blocking(fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking or CPU-bound call (pandas, SDV, synchronous DB access) off the event loop.
+
+    Args:
+        fn (Callable): The function to call.
+        *args, **kwargs: Its arguments.
+
+    Returns:
+        The function's return value.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(blocking_executor, functools.partial(fn, *args, **kwargs))
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when a ``BoundedExecutor`` already has as many calls pending as it accepts."""
+
+
+class BoundedExecutor:
+    """
+    Thread pool with a limit on the calls running or waiting for a thread.
+
+    Calls beyond ``max_workers + max_queue`` are rejected with ``ExecutorSaturatedError`` right away,
+    so a burst is shed instead of queuing without bound behind slow work.
+
+    Methods:
+        run(operation, fn, *args): Runs ``fn`` on the pool and records its latency under ``operation``.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_pending = max_workers + max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    async def run(self, operation: str, fn: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                EXECUTOR_REJECTED.labels(self.name).inc()
+                raise ExecutorSaturatedError(f"{self._pending} calls already pending")
+            self._pending += 1
+            EXECUTOR_PENDING.labels(self.name).set(self._pending)
+
+        submitted = time.perf_counter()
+
+        def timed():
+            started = time.perf_counter()
+            EXECUTOR_QUEUE_SECONDS.labels(self.name).observe(started - submitted)
+            try:
+                return fn(*args)
+            finally:
+                EXECUTOR_CALL_SECONDS.labels(self.name, operation).observe(time.perf_counter() - started)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                EXECUTOR_PENDING.labels(self.name).set(self._pending)
+
+
+# bcrypt is deliberately slow; its own small pool keeps a login burst from taking every blocking thread
+password_hashing_executor = BoundedExecutor(
+    "password_hashing", settings.password_hashing_max_workers, settings.password_hashing_max_queue
+)
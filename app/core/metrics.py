@@ -0,0 +1,52 @@
+"""
+Prometheus metrics of the application, served by the /metrics endpoint.
+
+Each uvicorn worker keeps its own registry; scrape every worker, or set PROMETHEUS_MULTIPROC_DIR to
+aggregate them.
+"""
+from prometheus_client import Counter, Gauge, Histogram
+
+EXECUTOR_CALL_SECONDS = Histogram(
+    "executor_call_seconds",
+    "Time spent running a call on a bounded executor, e.g. hashing or verifying a password.",
+    ["executor", "operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+EXECUTOR_QUEUE_SECONDS = Histogram(
+    "executor_queue_seconds",
+    "Time a call waited for a free thread of a bounded executor.",
+    ["executor"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EXECUTOR_PENDING = Gauge(
+    "executor_pending",
+    "Calls running on or waiting for a bounded executor.",
+    ["executor"],
+)
+EXECUTOR_REJECTED = Counter(
+    "executor_rejected_total",
+    "Calls rejected because a bounded executor's queue was full.",
+    ["executor"],
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups, by cache and by outcome (hit or miss).",
+    ["cache", "result"],
+)
+PIPELINE_STAGE_SECONDS = Histogram(
+    "pipeline_stage_seconds",
+    "Wall time of a stage of a DataService pipeline, e.g. the fit of augment_and_train.",
+    ["pipeline", "stage"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+PIPELINE_STAGE_CPU_SECONDS = Histogram(
+    "pipeline_stage_cpu_seconds",
+    "CPU time of the process during a stage of a DataService pipeline.",
+    ["pipeline", "stage"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+PIPELINE_PEAK_RSS_BYTES = Gauge(
+    "pipeline_peak_rss_bytes",
+    "Peak resident memory of the process at the end of the last stage of a DataService pipeline.",
+    ["pipeline"],
+)
@@ -1,4 +1,6 @@
 from app.db.models.user import DBUser
-from app.db.models.synthetic_data import DBSyntheticData
+from app.db.models.synthetic_data import DBSyntheticData, DBSyntheticDataChunk
 from app.db.models.task_status import DBTaskStatus
-from app.db.models.result import DBResult
\ No newline at end of file
+from app.db.models.result import DBResult
+from app.db.models.trained_model import DBTrainedModel
+from app.db.models.evaluation_result import DBEvaluationResult
@@ -0,0 +1,26 @@
+import datetime
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, UniqueConstraint
+
+from app.db.base import Base
+
+class DBEvaluationResult(Base):
+    """
+    Scores of a stored synthetic dataset against one version of the real data.
+
+    Both are immutable, so a row is valid for as long as the metric suite that computed it is in use.
+    """
+    __tablename__ = "evaluation_results"
+    __table_args__ = (UniqueConstraint('synthetic_data_id', 'real_data_fingerprint', 'suite_version', 'options'),)
+
+    id = Column(Integer, primary_key=True)
+    synthetic_data_id = Column(Integer, ForeignKey('synthetic_data_titanic.id', ondelete='CASCADE'), index=True,
+                               nullable=False)
+    real_data_fingerprint = Column(String, nullable=False)
+    suite_version = Column(String, nullable=False)
+    # Canonical JSON of the evaluation options the scores depend on
+    options = Column(String, nullable=False)
+    scores = Column(String, nullable=False)
+    details = Column(String, nullable=False)
+    evaluation_seconds = Column(Float, nullable=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Float, ForeignKey, Integer
+from sqlalchemy import Column, Float, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -7,6 +7,7 @@ class DBResult(Base):
     __tablename__ = "results"
 
     task_id = Column(Integer, ForeignKey('task_status.id'), primary_key=True)
-    accuracy = Column(Float, nullable=False)
+    accuracy = Column(Float, nullable=True)
+    details = Column(String, nullable=True)
 
     task_status = relationship("DBTaskStatus", back_populates="result")
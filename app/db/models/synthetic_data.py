@@ -1,9 +1,37 @@
-from sqlalchemy import Column, Integer, String
+import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary, String, UniqueConstraint
+from sqlalchemy.orm import relationship
+
 from app.db.base import Base
 
 class DBSyntheticData(Base):
+    """Manifest of a stored synthetic dataset. The rows themselves live in ``synthetic_data_chunks``."""
     __tablename__ = 'synthetic_data_titanic'
     id = Column(Integer, primary_key=True, index=True)
     synthesizer_type = Column(String, index=True)
-    data = Column(String)
     original_data_ids = Column(String)
+    row_count = Column(Integer, nullable=False, default=0)
+    data_schema = Column(String, nullable=False)
+    chunk_rows = Column(Integer, nullable=False)
+    chunk_offsets = Column(String, nullable=False)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+    chunks = relationship("DBSyntheticDataChunk", back_populates="synthetic_data", cascade="all, delete-orphan",
+                          order_by="DBSyntheticDataChunk.chunk_index", lazy="noload")
+
+
+class DBSyntheticDataChunk(Base):
+    """A compressed Parquet slice of a synthetic dataset, covering ``row_count`` rows from ``row_offset``."""
+    __tablename__ = 'synthetic_data_chunks'
+    __table_args__ = (UniqueConstraint('synthetic_data_id', 'chunk_index'),)
+
+    id = Column(Integer, primary_key=True)
+    synthetic_data_id = Column(Integer, ForeignKey('synthetic_data_titanic.id', ondelete='CASCADE'), index=True,
+                               nullable=False)
+    chunk_index = Column(Integer, nullable=False)
+    row_offset = Column(Integer, nullable=False)
+    row_count = Column(Integer, nullable=False)
+    payload = Column(LargeBinary, nullable=False)
+
+    synthetic_data = relationship("DBSyntheticData", back_populates="chunks")
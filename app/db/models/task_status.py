@@ -1,6 +1,6 @@
 import datetime
 
-from sqlalchemy import Column, String, DateTime, Integer
+from sqlalchemy import Column, String, DateTime, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -9,6 +9,7 @@ from app.entities.task_status import TaskStatusEnum
 
 class DBTaskStatus(Base):
     __tablename__ = "task_status"
+    __table_args__ = (Index("ix_task_status_status_available_at", "status", "available_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     status = Column(String, default=TaskStatusEnum.QUEUED)
@@ -18,4 +19,16 @@ class DBTaskStatus(Base):
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
 
+    # Job queue bookkeeping, only set for tasks executed by the worker
+    job_type = Column(String, nullable=True)
+    payload = Column(String, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=1)
+    available_at = Column(DateTime, default=datetime.datetime.utcnow)
+    locked_by = Column(String, nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    # JSON of the wall time, CPU time and memory of each stage of the job's last attempt
+    stage_timings = Column(String, nullable=True)
+
     result = relationship("DBResult", uselist=False, back_populates="task_status")
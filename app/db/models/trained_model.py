@@ -0,0 +1,16 @@
+import datetime
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+
+from app.db.base import Base
+
+class DBTrainedModel(Base):
+    __tablename__ = "trained_models"
+
+    task_id = Column(Integer, ForeignKey('task_status.id'), primary_key=True)
+    path = Column(String, nullable=False)
+    synthesizer_type = Column(String, nullable=False)
+    augmentation_factor = Column(Integer, nullable=False)
+    features = Column(String, nullable=False)
+    accuracy = Column(Float, nullable=False)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
@@ -1,12 +1,49 @@
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import DeclarativeMeta, declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def engine_options(database_url: str) -> dict:
+    """Connection pool options of the engine; SQLite uses its own single-file pools."""
+    if database_url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        # Recycle connections before the server or a proxy drops them, and test them on checkout
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+# Objects stay usable after their session is closed, since sessions now end with each operation
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base: DeclarativeMeta = declarative_base()
 
+_pool_events = {"connects": 0, "checkouts": 0, "invalidations": 0}
+
+
+@event.listens_for(engine, "connect")
+def _count_connect(dbapi_connection, connection_record):
+    _pool_events["connects"] += 1
+
+
+@event.listens_for(engine, "checkout")
+def _count_checkout(dbapi_connection, connection_record, connection_proxy):
+    _pool_events["checkouts"] += 1
+
+
+@event.listens_for(engine, "invalidate")
+def _count_invalidate(dbapi_connection, connection_record, exception):
+    _pool_events["invalidations"] += 1
+
+
 def get_db():
     """
     Provides a database session for use in routes and services.
@@ -16,3 +53,29 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Provides a session for one unit of work: rolled back if the block raises, always closed.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def get_pool_status() -> dict:
+    """Current usage of the connection pool and the number of pool events since startup."""
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__, **_pool_events}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            status[name] = method()
+    return status
@@ -0,0 +1,52 @@
+import enum
+import json
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+
+class EvaluationMode(str, enum.Enum):
+    FULL = "full"
+    SAMPLED = "sampled"
+
+class EvaluationOptions(BaseModel):
+    """
+    Options of a synthetic data evaluation.
+
+    Attributes:
+        mode (EvaluationMode): Full sdmetrics QualityReport, or the bounded sampled evaluation.
+        max_rows (int): Rows of each table used in sampled mode.
+        max_column_pairs (int): Column pairs scored in sampled mode; a seeded random subset when there are more.
+        seed (int): Seed of the row and column pair sampling.
+        n_jobs (int | None): Threads computing column and pair metrics in sampled mode.
+    """
+    mode: EvaluationMode = EvaluationMode.FULL
+    max_rows: int = Field(default=5_000, ge=1)
+    max_column_pairs: int = Field(default=50, ge=1)
+    seed: int = 42
+    n_jobs: Optional[int] = Field(default=None, ge=1)
+
+    def result_key(self) -> str:
+        """Canonical JSON of the options the scores depend on, under which they are stored."""
+        if self.mode == EvaluationMode.FULL:
+            return self.model_dump_json(include={"mode"})
+        return self.model_dump_json(include={"mode", "max_rows", "max_column_pairs", "seed"})
+
+class EvaluationResult(BaseModel):
+    id: int
+    synthetic_data_id: int
+    real_data_fingerprint: str
+    suite_version: str
+    options: dict
+    scores: dict
+    details: dict
+    evaluation_seconds: Optional[float] = None
+    created_at: Optional[datetime] = None
+    model_config = {
+        'from_attributes': True
+    }
+
+    @field_validator('options', 'scores', 'details', mode='before')
+    @classmethod
+    def parse_json(cls, value):
+        # Stored as JSON objects in the database
+        return json.loads(value) if isinstance(value, str) else value
@@ -1,9 +1,11 @@
+from typing import Optional
 from sqlalchemy.orm import relationship
 from pydantic import BaseModel
 
 class Result(BaseModel):
     task_id: int
-    accuracy: float
+    accuracy: Optional[float]
+    details: Optional[str] = None
     task_status: str
     model_config = {
         'from_attributes': True
@@ -1,21 +1,40 @@
-from pydantic import BaseModel
-from typing import Optional
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Any, Optional
 from enum import Enum
 
 class SyntheticData(BaseModel):
+    """Manifest of a stored synthetic dataset; rows are read separately through the repository."""
     id: Optional[int]
     synthesizer_type: str
-    data: str
     original_data_ids: str
+    row_count: int
+    data_schema: str
+    chunk_rows: int
+    chunk_offsets: str
+    created_at: Optional[datetime] = None
     model_config = {
         'from_attributes': True
     }
 
+class SyntheticDataMetadata(BaseModel):
+    """Size and schema of a stored synthetic dataset."""
+    id: int
+    synthesizer_type: str
+    row_count: int
+    columns: list[dict[str, str]]
+    chunk_rows: int
+    created_at: Optional[datetime] = None
+
 class SynthesizerType(str, Enum):
     ctgan = "ctgan"
     copulagan = "copulagan"
     gaussiancopula = "gaussiancopula"
 
+class SyntheticDataFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
 class SyntheticDataCreate(BaseModel):
     synthesizer_type: str
     data: str
@@ -23,3 +42,45 @@ class SyntheticDataCreate(BaseModel):
 
 class SyntheticDataResponse(BaseModel):
     id: int
+
+class SynthesizerCandidate(BaseModel):
+    synthesizer_type: SynthesizerType
+    hyperparameters: dict[str, Any] = {}
+
+class SynthesizerComparisonRequest(BaseModel):
+    candidates: list[SynthesizerCandidate] = Field(..., min_length=1)
+
+class SyntheticDataSample(BaseModel):
+    """One dataset of a batch: its size and, for a reproducible draw, the seed of its sampling."""
+    num_rows: int = Field(..., gt=0)
+    seed: Optional[int] = None
+
+class ConditionalSlice(BaseModel):
+    """Rows requested for one slice of the data, e.g. ``{"pclass": 1, "sex": "female"}``."""
+    conditions: dict[str, Any] = Field(..., min_length=1)
+    num_rows: int = Field(..., gt=0)
+
+class ConditionalSamplingRequest(BaseModel):
+    """
+    Conditional generation from a fitted synthesizer.
+
+    Attributes:
+        synthesizer_type (SynthesizerType): Type of synthesizer to sample from.
+        hyperparameters (dict): Keyword arguments of the synthesizer, as for unconditional generation.
+        slices (list[ConditionalSlice]): Row quotas per slice; identical slices are sampled together.
+        known_rows (list[dict]): Partial rows whose missing columns are sampled.
+        max_tries_per_batch (int): Attempts SDV makes to produce the rows of a condition.
+    """
+    synthesizer_type: SynthesizerType
+    hyperparameters: dict[str, Any] = {}
+    slices: list[ConditionalSlice] = Field(default=[], max_length=100)
+    known_rows: list[dict[str, Any]] = Field(default=[], max_length=100_000)
+    max_tries_per_batch: int = Field(default=100, gt=0, le=10_000)
+
+class SyntheticDataBatchRequest(BaseModel):
+    """Several synthetic datasets sampled from a single fit of one synthesizer."""
+    synthesizer_type: SynthesizerType
+    hyperparameters: dict[str, Any] = {}
+    samples: list[SyntheticDataSample] = Field(..., min_length=1, max_length=100)
+    # Queue the evaluation of every generated dataset once they are stored
+    evaluate: bool = False
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, Optional
+from pydantic import BaseModel, Field
 
 class TaskStatusEnum(str, enum.Enum):
     QUEUED = "queued"
@@ -9,6 +9,12 @@ class TaskStatusEnum(str, enum.Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+class JobType(str, enum.Enum):
+    AUGMENT_AND_TRAIN = "augment_and_train"
+    COMPARE_SYNTHESIZERS = "compare_synthesizers"
+    GENERATE_BATCH = "generate_batch"
+    EVALUATE = "evaluate"
+
 class TaskStatus(BaseModel):
     status: TaskStatusEnum
     accuracy: Optional[float] = None
@@ -20,3 +26,45 @@ class TaskStatus(BaseModel):
     model_config = {
         'from_attributes': True
     }
+
+class Job(BaseModel):
+    """A task claimed by a worker from the job queue."""
+    id: int
+    job_type: JobType
+    payload: dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+TERMINAL_STATUSES = (TaskStatusEnum.COMPLETED, TaskStatusEnum.FAILED)
+
+class ProgressStage(str, enum.Enum):
+    STATUS = "status"
+    FIT_STARTED = "fit_started"
+    FIT_EPOCH = "fit_epoch"
+    FIT_COMPLETED = "fit_completed"
+    SAMPLING = "sampling"
+    TRAINING = "training"
+    EVALUATING = "evaluating"
+
+class ProgressEvent(BaseModel):
+    """
+    A status change or a step of a running job, pushed to the clients following the task.
+
+    Attributes:
+        task_id (int): The task the event belongs to.
+        stage (ProgressStage): A status change, or the pipeline stage being run.
+        status (TaskStatusEnum | None): The new status, for status changes.
+        progress (float | None): Fraction of the stage done, when it is known.
+        epoch (int | None): Epoch just finished, while fitting a GAN synthesizer.
+        total_epochs (int | None): Number of epochs of the fit.
+        message (str | None): Free-form detail, e.g. the error of a failed attempt.
+        timestamp (datetime): When the event was emitted.
+    """
+    task_id: int
+    stage: ProgressStage
+    status: Optional[TaskStatusEnum] = None
+    progress: Optional[float] = None
+    epoch: Optional[int] = None
+    total_epochs: Optional[int] = None
+    message: Optional[str] = None
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,25 @@
+import json
+from datetime import datetime
+from typing import Any, Optional
+from pydantic import BaseModel, Field, field_validator
+
+class TrainedModel(BaseModel):
+    task_id: int
+    path: str
+    synthesizer_type: str
+    augmentation_factor: int
+    features: list[str]
+    accuracy: float
+    created_at: Optional[datetime] = None
+    model_config = {
+        'from_attributes': True
+    }
+
+    @field_validator('features', mode='before')
+    @classmethod
+    def parse_features(cls, value):
+        # Stored as a JSON array in the database
+        return json.loads(value) if isinstance(value, str) else value
+
+class PredictionRequest(BaseModel):
+    rows: list[dict[str, Any]] = Field(..., min_length=1)
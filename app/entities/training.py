@@ -0,0 +1,31 @@
+from typing import Optional
+from pydantic import BaseModel, Field, NonNegativeInt
+
+class TrainingOptions(BaseModel):
+    """
+    Per-request options of the model trained by augment-and-train.
+
+    Attributes:
+        n_jobs (int | None): Cores used to train the forest, capped at the worker's CPU budget (all of it when unset).
+        warm_start (bool): Add trees batch by batch as synthetic rows are sampled, instead of training once on
+            the whole augmented frame.
+        batch_size (int | None): Synthetic rows sampled per batch in warm-start mode; defaults to the real data size.
+        trees_per_batch (int): Trees added for each batch in warm-start mode.
+        early_stopping (bool): Stop adding batches once holdout accuracy stops improving.
+        patience (int): Batches without improvement tolerated before stopping.
+        tolerance (float): Minimum holdout accuracy gain counted as an improvement.
+        cv_folds (int | None): Folds of the cross-validation stored with the result; unset skips it.
+        cv_augmentation_factors (list[int] | None): Augmentation factors compared by the cross-validation;
+            defaults to no augmentation and the requested factor.
+        tstr (bool): Also score a model trained on synthetic rows only and tested on the real folds.
+    """
+    n_jobs: Optional[int] = Field(default=None, ge=1)
+    warm_start: bool = False
+    batch_size: Optional[int] = Field(default=None, ge=1)
+    trees_per_batch: int = Field(default=20, ge=1)
+    early_stopping: bool = False
+    patience: int = Field(default=2, ge=1)
+    tolerance: float = Field(default=0.002, ge=0)
+    cv_folds: Optional[int] = Field(default=5, ge=2, le=20)
+    cv_augmentation_factors: Optional[list[NonNegativeInt]] = Field(default=None, min_length=1)
+    tstr: bool = True
@@ -1,9 +1,13 @@
 # app/middleware/auth_middleware.py
+import hashlib
 import logging
+import re
+import threading
+import time
+from collections import OrderedDict
 
-from fastapi import HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.config import settings
 from app.use_cases.services.jwt_service import JWTService
@@ -15,41 +19,109 @@ jwt_service = JWTService(secret_key, algorithm)
 
 logger = logging.getLogger(__name__)
 
-class AuthMiddleware(BaseHTTPMiddleware):
+# Paths that don't require authentication
+PUBLIC_PATHS = ["/favicon.ico", "/docs", "/openapi.json", "/auth/token", "/auth/login", "/auth/register"]
+PUBLIC_PATH_PATTERN = re.compile("|".join(re.escape(path) for path in PUBLIC_PATHS))
+
+
+class VerifiedTokenCache:
     """
-        Middleware to handle JWT-based authentication.
+        Bounded LRU of verified JWT payloads, keyed by the SHA-256 digest of the token.
 
-        Attributes:
-            public_paths (list): List of paths that don't require authentication.
+        An entry lives for at most ``ttl_seconds`` and never past the token's own ``exp`` claim, so a
+        cached token stops being accepted exactly when ``jwt.decode`` would start rejecting it.
 
         Methods:
-            dispatch(request, call_next): Processes the request and checks for JWT tokens.
+            get(token): Returns the cached payload of a token, if it is still valid.
+            put(token, payload): Caches the payload of a token that was just verified.
     """
-    async def dispatch(self, request: Request, call_next):
-        # Define paths that don't require authentication
-        public_paths = ["/favicon.ico", "/docs", "/openapi.json", "/auth/token", "/auth/login", "/auth/register"]
-        # Skip authentication for public paths
-        if any(request.url.path.startswith(path) for path in public_paths):
-            response = await call_next(request)
-            return response
-
-        # Check for the Authorization header
-        auth_header = request.headers.get("Authorization")
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, token: str, payload: dict):
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        if "exp" in payload:
+            expires_at = min(expires_at, float(payload["exp"]))
+        if expires_at <= now:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class AuthMiddleware:
+    """
+        Pure ASGI middleware handling JWT-based authentication.
+
+        Public paths are matched with one precompiled pattern, and verified tokens are served from a
+        ``VerifiedTokenCache`` instead of being decoded again on every request. The payload is exposed
+        as ``request.state.user``; requests without an Authorization header get ``None``.
+
+        Methods:
+            __call__(scope, receive, send): Checks the JWT token of HTTP requests before passing them on.
+    """
+    def __init__(self, app: ASGIApp, token_cache: VerifiedTokenCache | None = None):
+        self.app = app
+        self.token_cache = token_cache or VerifiedTokenCache(
+            settings.auth_token_cache_max_entries, settings.auth_token_cache_ttl_seconds
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or PUBLIC_PATH_PATTERN.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        auth_header = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value.decode("latin-1")
+                break
+
+        user = None
         if auth_header:
-            try:
-                token_type, token = auth_header.split(" ")
-                print(token_type)
-                print(token)
-                if token_type.lower() != "bearer":
-                    raise HTTPException(status_code=401, detail="Invalid token type")
-                payload = jwt_service.verify_token(token)
-                if payload is None:
-                    raise HTTPException(status_code=401, detail="Invalid or expired token")
-                request.state.user = payload
-            except ValueError:
-                raise HTTPException(status_code=401, detail="Invalid token")
-        else:
-            request.state.user = None
-
-        response = await call_next(request)
-        return response
+            token_type, _, token = auth_header.partition(" ")
+            if token_type.lower() != "bearer" or not token:
+                await self._unauthorized("Invalid token type")(scope, receive, send)
+                return
+            user = self.token_cache.get(token)
+            if user is None:
+                user = jwt_service.verify_token(token)
+                if user is None:
+                    await self._unauthorized("Invalid or expired token")(scope, receive, send)
+                    return
+                self.token_cache.put(token, user)
+
+        scope.setdefault("state", {})["user"] = user
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _unauthorized(detail: str) -> JSONResponse:
+        return JSONResponse(
+            status_code=401,
+            content={"detail": detail, "status_code": 401, "error": "HTTPException"},
+            headers={"WWW-Authenticate": "Bearer"},
+        )
@@ -0,0 +1,76 @@
+import io
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+PARQUET_COMPRESSION = "zstd"
+
+FILTER_OPERATORS = {
+    "eq": pc.equal,
+    "ne": pc.not_equal,
+    "lt": pc.less,
+    "le": pc.less_equal,
+    "gt": pc.greater,
+    "ge": pc.greater_equal,
+}
+
+
+def encode_dataframe(data: pd.DataFrame, chunk_rows: int) -> tuple[str, list[tuple[int, int, bytes]]]:
+    """
+    Encode a DataFrame as a sequence of independently readable compressed Parquet chunks.
+
+    Returns:
+        tuple: The JSON-encoded Arrow schema and a list of ``(row_offset, row_count, payload)`` chunks.
+    """
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    chunks = []
+    for offset in range(0, max(table.num_rows, 1), chunk_rows):
+        chunk = table.slice(offset, chunk_rows)
+        buffer = io.BytesIO()
+        pq.write_table(chunk, buffer, compression=PARQUET_COMPRESSION)
+        chunks.append((offset, chunk.num_rows, buffer.getvalue()))
+    return schema_to_json(table.schema), chunks
+
+
+def decode_chunk(payload: bytes, columns: list[str] | None = None) -> pa.Table:
+    """Decode one Parquet chunk, reading only the requested columns."""
+    return pq.read_table(pa.BufferReader(payload), columns=columns)
+
+
+def decode_chunks(payloads: list[bytes], columns: list[str] | None = None) -> pa.Table:
+    return pa.concat_tables([decode_chunk(payload, columns) for payload in payloads])
+
+
+def schema_to_json(schema: pa.Schema) -> str:
+    return json.dumps([{"name": field.name, "type": str(field.type)} for field in schema])
+
+
+def schema_column_names(data_schema: str) -> list[str]:
+    return [field["name"] for field in json.loads(data_schema)]
+
+
+def filter_table(table: pa.Table, filters: list[tuple[str, str, str]]) -> pa.Table:
+    """
+    Keep the rows of ``table`` matching every ``(column, operator, value)`` filter.
+
+    Values are given as strings and cast to the type of their column; nulls never match.
+    """
+    if not filters:
+        return table
+    mask = None
+    for column, operator, value in filters:
+        if column not in table.column_names:
+            raise ValueError(f"Unknown filter column: {column}")
+        if operator not in FILTER_OPERATORS:
+            raise ValueError(f"Unknown filter operator: {operator}")
+        field_type = table.schema.field(column).type
+        try:
+            scalar = pa.scalar(value).cast(field_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            raise ValueError(f"Invalid value for column {column}: {value}")
+        condition = pc.fill_null(FILTER_OPERATORS[operator](table[column], scalar), False)
+        mask = condition if mask is None else pc.and_(mask, condition)
+    return table.filter(mask)
@@ -0,0 +1,24 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.async_session import async_session_scope
+
+
+class AsyncBaseRepository:
+    """
+        Base class of the asyncio repositories used by the API, mirroring ``BaseRepository``.
+
+        Each operation runs in the given ``AsyncSession``, or in a short-lived session of its own.
+    """
+    def __init__(self, db: AsyncSession | None = None):
+        self._db = db
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        if self._db is not None:
+            yield self._db
+        else:
+            async with async_session_scope() as db:
+                yield db
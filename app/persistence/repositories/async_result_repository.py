@@ -0,0 +1,21 @@
+from app.db.models.result import DBResult
+from app.persistence.repositories.async_base_repository import AsyncBaseRepository
+
+
+class AsyncResultRepository(AsyncBaseRepository):
+    """
+        Asyncio counterpart of ``ResultRepository`` for the API.
+
+        Methods:
+            create_result(task_id, accuracy, details): Creates a new result entry in the database.
+            get_result_by_task_id(task_id): Fetches the result by task_id.
+    """
+    async def create_result(self, task_id: int, accuracy: float | None, details: str | None = None):
+        async with self._session() as db:
+            # Merge rather than add, so a retried job can overwrite the result of a previous attempt
+            await db.merge(DBResult(task_id=task_id, accuracy=accuracy, details=details))
+            await db.commit()
+
+    async def get_result_by_task_id(self, task_id: int) -> DBResult | None:
+        async with self._session() as db:
+            return await db.get(DBResult, task_id)
@@ -0,0 +1,68 @@
+import datetime
+import json
+
+from sqlalchemy import select
+
+from app.db.models.task_status import DBTaskStatus, TaskStatusEnum
+from app.entities.task_status import JobType, TaskStatus as TaskStatusEntity
+from app.persistence.repositories.async_base_repository import AsyncBaseRepository
+
+
+class AsyncTaskStatusRepository(AsyncBaseRepository):
+    """
+       Asyncio counterpart of ``TaskStatusRepository`` for the API; workers keep using the synchronous one.
+
+       Methods:
+           create_task(description, created_at): Creates a new task with the given description.
+           enqueue_job(description, job_type, payload, max_attempts): Creates a task to be run by a worker.
+           update_task_status(task_id, status, accuracy, error): Updates the status of the task.
+           get_task(task_id): Fetches the task by task_id.
+           get_task_status(task_id): Fetches the current status of the task.
+   """
+    async def create_task(self, description: str, created_at=None) -> int:
+        async with self._session() as db:
+            new_task = DBTaskStatus(
+                status=TaskStatusEnum.QUEUED,
+                description=description,
+                created_at=created_at or datetime.datetime.utcnow(),
+            )
+            db.add(new_task)
+            await db.commit()
+            await db.refresh(new_task)
+            return TaskStatusEntity.model_validate(new_task).id
+
+    async def enqueue_job(self, description: str, job_type: JobType, payload: dict, max_attempts: int) -> int:
+        now = datetime.datetime.utcnow()
+        async with self._session() as db:
+            new_task = DBTaskStatus(
+                status=TaskStatusEnum.QUEUED,
+                description=description,
+                created_at=now,
+                job_type=job_type.value,
+                payload=json.dumps(payload),
+                attempts=0,
+                max_attempts=max_attempts,
+                available_at=now,
+            )
+            db.add(new_task)
+            await db.commit()
+            await db.refresh(new_task)
+            return new_task.id
+
+    async def update_task_status(self, task_id: int, status: TaskStatusEnum, accuracy=None, error=None):
+        async with self._session() as db:
+            task = await db.get(DBTaskStatus, task_id)
+            if task:
+                task.status = status
+                task.accuracy = accuracy
+                task.error = error
+                await db.commit()
+
+    async def get_task(self, task_id: int) -> DBTaskStatus | None:
+        async with self._session() as db:
+            return await db.get(DBTaskStatus, task_id)
+
+    async def get_task_status(self, task_id: int) -> TaskStatusEnum | None:
+        async with self._session() as db:
+            # Only the status column, so polling does not load the job payload
+            return await db.scalar(select(DBTaskStatus.status).where(DBTaskStatus.id == task_id))
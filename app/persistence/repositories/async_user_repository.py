@@ -0,0 +1,48 @@
+from sqlalchemy import select, update
+
+from app.db.models.user import DBUser
+from app.entities.user import User
+from app.persistence.repositories.async_base_repository import AsyncBaseRepository
+
+
+class AsyncUserRepository(AsyncBaseRepository):
+    """
+    Asyncio counterpart of ``UserRepository``, used by the auth endpoints.
+
+    Methods:
+        get_user_by_username(username): Fetches a user by their username.
+        create_user(user_data): Creates a new user in the database.
+        get_user_by_id(user_id): Fetches a user by their ID.
+        update_password_hash(user_id, hashed_password): Replaces the stored password hash of a user.
+    """
+    async def get_user_by_username(self, username: str) -> User | None:
+        """Fetch user by username."""
+        async with self._session() as db:
+            db_user = await db.scalar(select(DBUser).where(DBUser.username == username))
+            if db_user:
+                return User.model_validate(db_user)
+            return None
+
+    async def create_user(self, user_data: dict) -> User:
+        """Create a new user."""
+        async with self._session() as db:
+            db_user = DBUser(
+                username=user_data["username"],
+                email=user_data["email"],
+                hashed_password=user_data["hashed_password"]
+            )
+            db.add(db_user)
+            await db.commit()
+            await db.refresh(db_user)
+            return User.model_validate(db_user)
+
+    async def get_user_by_id(self, user_id: int) -> DBUser | None:
+        """Fetch user by user ID."""
+        async with self._session() as db:
+            return await db.get(DBUser, user_id)
+
+    async def update_password_hash(self, user_id: int, hashed_password: str):
+        """Replace the password hash of a user, e.g. after an upgrade of the hashing cost."""
+        async with self._session() as db:
+            await db.execute(update(DBUser).where(DBUser.id == user_id).values(hashed_password=hashed_password))
+            await db.commit()
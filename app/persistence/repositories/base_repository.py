@@ -0,0 +1,27 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+from app.db.session import session_scope
+
+
+class BaseRepository:
+    """
+        Base class of the repositories, handling the scope of their database sessions.
+
+        A repository built with a session (for example by a ``UnitOfWork``) runs every operation in
+        that session, so they share one request- or job-scoped transaction context. Without one, each
+        operation opens a short-lived session of its own, so a repository can be shared by concurrent
+        requests and threads without sharing a ``Session``.
+    """
+    def __init__(self, db: Session | None = None):
+        self._db = db
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        if self._db is not None:
+            yield self._db
+        else:
+            with session_scope() as db:
+                yield db
@@ -0,0 +1,82 @@
+import json
+
+from app.core.cache import Cache
+from app.db.models.result import DBResult
+from app.db.models.task_status import TaskStatusEnum
+from app.entities.task_status import TERMINAL_STATUSES
+from app.persistence.repositories.async_result_repository import AsyncResultRepository
+from app.persistence.repositories.async_task_status_repository import AsyncTaskStatusRepository
+
+# Cached in place of a missing row, so polling for a result that does not exist yet is cached too
+_MISSING = ""
+
+
+class CachedTaskStatusRepository(AsyncTaskStatusRepository):
+    """
+       ``AsyncTaskStatusRepository`` whose status reads go through a cache.
+
+       Completed and failed tasks do not change again, so their status is cached until it is updated
+       through this repository. Queued and running tasks are updated by the workers, which do not see
+       the cache, so their status is only cached for ``in_flight_ttl_seconds``.
+
+       Methods:
+           get_task_status(task_id): Fetches the current status of the task, from the cache when possible.
+           update_task_status(task_id, status, accuracy, error): Updates the status and drops the cached one.
+   """
+    def __init__(self, cache: Cache, in_flight_ttl_seconds: float, db=None):
+        super().__init__(db)
+        self.cache = cache
+        self.in_flight_ttl_seconds = in_flight_ttl_seconds
+
+    async def get_task_status(self, task_id: int) -> TaskStatusEnum | None:
+        key = str(task_id)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return TaskStatusEnum(cached) if cached != _MISSING else None
+
+        status = await super().get_task_status(task_id)
+        ttl = None if status in TERMINAL_STATUSES else self.in_flight_ttl_seconds
+        await self.cache.set(key, status.value if status is not None else _MISSING, ttl)
+        return status
+
+    async def update_task_status(self, task_id: int, status: TaskStatusEnum, accuracy=None, error=None):
+        await super().update_task_status(task_id, status, accuracy, error)
+        await self.cache.delete(str(task_id))
+
+
+class CachedResultRepository(AsyncResultRepository):
+    """
+        ``AsyncResultRepository`` whose reads go through a cache.
+
+        A result is written once, when its job completes, so it is cached until it is overwritten
+        through this repository. A missing result is only cached for ``missing_ttl_seconds``, since the
+        worker that stores it does not see the cache.
+
+        Methods:
+            create_result(task_id, accuracy, details): Creates the result and drops the cached one.
+            get_result_by_task_id(task_id): Fetches the result, from the cache when possible.
+    """
+    def __init__(self, cache: Cache, missing_ttl_seconds: float, db=None):
+        super().__init__(db)
+        self.cache = cache
+        self.missing_ttl_seconds = missing_ttl_seconds
+
+    async def create_result(self, task_id: int, accuracy: float | None, details: str | None = None):
+        await super().create_result(task_id, accuracy, details)
+        await self.cache.delete(str(task_id))
+
+    async def get_result_by_task_id(self, task_id: int) -> DBResult | None:
+        key = str(task_id)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            # A detached copy: callers only read the columns
+            return DBResult(**json.loads(cached)) if cached != _MISSING else None
+
+        result = await super().get_result_by_task_id(task_id)
+        if result is None:
+            await self.cache.set(key, _MISSING, self.missing_ttl_seconds)
+        else:
+            await self.cache.set(key, json.dumps(
+                {"task_id": result.task_id, "accuracy": result.accuracy, "details": result.details}
+            ))
+        return result
@@ -0,0 +1,68 @@
+import json
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+
+from app.db.models.evaluation_result import DBEvaluationResult
+from app.entities.evaluation import EvaluationResult
+from app.persistence.repositories.base_repository import BaseRepository
+
+
+class EvaluationResultRepository(BaseRepository):
+    """
+        Repository class for the stored evaluations of synthetic datasets.
+
+        An evaluation is identified by the synthetic dataset, the fingerprint of the real data, the version
+        of the metric suite and the options the scores depend on.
+
+        Methods:
+            get_evaluation_result(synthetic_data_id, real_data_fingerprint, suite_version, options): Fetches an
+                evaluation.
+            save_evaluation_result(synthetic_data_id, real_data_fingerprint, suite_version, options, scores, details,
+                evaluation_seconds): Stores an evaluation, replacing a previous one with the same identity.
+    """
+
+    def get_evaluation_result(self, synthetic_data_id: int, real_data_fingerprint: str, suite_version: str,
+                              options: str) -> EvaluationResult | None:
+        with self._session() as db:
+            db_result = db.query(DBEvaluationResult).filter(
+                DBEvaluationResult.synthetic_data_id == synthetic_data_id,
+                DBEvaluationResult.real_data_fingerprint == real_data_fingerprint,
+                DBEvaluationResult.suite_version == suite_version,
+                DBEvaluationResult.options == options,
+            ).first()
+            if db_result:
+                return EvaluationResult.model_validate(db_result)
+            return None
+
+    def save_evaluation_result(self, synthetic_data_id: int, real_data_fingerprint: str, suite_version: str,
+                               options: str, scores: dict, details: dict,
+                               evaluation_seconds: float | None = None) -> EvaluationResult:
+        with self._session() as db:
+            db.execute(delete(DBEvaluationResult).where(
+                DBEvaluationResult.synthetic_data_id == synthetic_data_id,
+                DBEvaluationResult.real_data_fingerprint == real_data_fingerprint,
+                DBEvaluationResult.suite_version == suite_version,
+                DBEvaluationResult.options == options,
+            ))
+            db_result = DBEvaluationResult(
+                synthetic_data_id=synthetic_data_id,
+                real_data_fingerprint=real_data_fingerprint,
+                suite_version=suite_version,
+                options=options,
+                scores=json.dumps(scores),
+                details=json.dumps(details),
+                evaluation_seconds=evaluation_seconds,
+            )
+            db.add(db_result)
+            try:
+                db.commit()
+            except IntegrityError:
+                # Another process stored the same evaluation meanwhile; the scores are the same
+                db.rollback()
+                stored = self.get_evaluation_result(synthetic_data_id, real_data_fingerprint, suite_version, options)
+                if stored is None:
+                    raise
+                return stored
+            db.refresh(db_result)
+            return EvaluationResult.model_validate(db_result)
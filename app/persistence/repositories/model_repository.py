@@ -0,0 +1,38 @@
+import json
+
+from app.db.models.trained_model import DBTrainedModel
+from app.entities.trained_model import TrainedModel
+from app.persistence.repositories.base_repository import BaseRepository
+
+
+class ModelRepository(BaseRepository):
+    """
+        Repository class for handling operations related to trained model artifacts.
+
+        Methods:
+            save_model(task_id, path, synthesizer_type, augmentation_factor, features, accuracy): Registers a model.
+            get_model_by_task_id(task_id): Fetches the metadata of the model trained by a task.
+    """
+
+    def save_model(self, task_id: int, path: str, synthesizer_type: str, augmentation_factor: int,
+                   features: list[str], accuracy: float) -> TrainedModel:
+        with self._session() as db:
+            # Merge rather than add, so a retried job replaces the model of a previous attempt
+            db_model = db.merge(DBTrainedModel(
+                task_id=task_id,
+                path=path,
+                synthesizer_type=synthesizer_type,
+                augmentation_factor=augmentation_factor,
+                features=json.dumps(features),
+                accuracy=accuracy,
+            ))
+            db.commit()
+            db.refresh(db_model)
+            return TrainedModel.model_validate(db_model)
+
+    def get_model_by_task_id(self, task_id: int) -> TrainedModel | None:
+        with self._session() as db:
+            db_model = db.query(DBTrainedModel).filter(DBTrainedModel.task_id == task_id).first()
+            if db_model:
+                return TrainedModel.model_validate(db_model)
+            return None
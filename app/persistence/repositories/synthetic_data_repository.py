@@ -1,40 +1,178 @@
+import datetime
+import json
+
 import pandas as pd
+import pyarrow as pa
+from sqlalchemy import insert, select
 
-from app.db.models.synthetic_data import DBSyntheticData
-from app.db.session import get_db
-from app.entities.synthetic_data import SyntheticData
+from app.core.config import settings
+from app.db.models.synthetic_data import DBSyntheticData, DBSyntheticDataChunk
+from app.entities.synthetic_data import SyntheticData, SyntheticDataMetadata
+from app.persistence.columnar_codec import decode_chunk, decode_chunks, encode_dataframe, filter_table
+from app.persistence.repositories.base_repository import BaseRepository
 
 
-class SyntheticDataRepository:
+class SyntheticDataRepository(BaseRepository):
     """
        Repository class for handling operations related to synthetic data.
 
+       Synthetic datasets are stored as a manifest row in ``synthetic_data_titanic`` plus compressed
+       Parquet chunks in ``synthetic_data_chunks``, so readers only fetch and decode what they need.
+
        Methods:
-           get_synthetic_data_by_id(synthetic_data_id): Fetches synthetic data by ID.
+           get_synthetic_data_by_id(synthetic_data_id): Fetches the manifest of a synthetic dataset by ID.
+           get_synthetic_data_metadata(synthetic_data_id): Fetches the size and schema of a synthetic dataset.
+           get_synthetic_dataframe(synthetic_data_id, columns, offset, limit): Reads rows of a synthetic dataset.
+           get_filtered_dataframe(synthetic_data_id, filters, columns, offset, limit): Reads the rows of a
+               synthetic dataset matching filters.
            save_synthetic_data(synthesizer_type, data, original_data_ids): Saves new synthetic data.
+           save_synthetic_data_batch(synthesizer_type, datasets, original_data_ids): Saves several synthetic
+               datasets in a single transaction.
            get_all_data_records_from_csv(csv_path): Reads and returns all records from a CSV file.
    """
-    def __init__(self):
-        self.db = next(get_db())
-
     def get_synthetic_data_by_id(self, synthetic_data_id: int) -> SyntheticData | None:
-        """Fetch synthetic data by ID."""
-        db_record = self.db.query(DBSyntheticData).filter(DBSyntheticData.id == synthetic_data_id).first()
-        if db_record:
-            return SyntheticData.model_validate(db_record)
-        return None
+        """Fetch the manifest of a synthetic dataset by ID, without touching its rows."""
+        with self._session() as db:
+            db_record = db.query(DBSyntheticData).filter(DBSyntheticData.id == synthetic_data_id).first()
+            if db_record:
+                return SyntheticData.model_validate(db_record)
+            return None
+
+    def get_synthetic_data_metadata(self, synthetic_data_id: int) -> SyntheticDataMetadata | None:
+        """Fetch the size and schema of a synthetic dataset, without its original IDs or rows."""
+        with self._session() as db:
+            row = db.execute(
+                select(DBSyntheticData.id, DBSyntheticData.synthesizer_type, DBSyntheticData.row_count,
+                       DBSyntheticData.data_schema, DBSyntheticData.chunk_rows, DBSyntheticData.created_at)
+                .where(DBSyntheticData.id == synthetic_data_id)
+            ).first()
+        if row is None:
+            return None
+        return SyntheticDataMetadata(
+            id=row.id,
+            synthesizer_type=row.synthesizer_type,
+            row_count=row.row_count,
+            columns=json.loads(row.data_schema),
+            chunk_rows=row.chunk_rows,
+            created_at=row.created_at,
+        )
+
+    def get_synthetic_dataframe(self, synthetic_data_id: int, columns: list[str] | None = None, offset: int = 0,
+                                limit: int | None = None) -> pd.DataFrame:
+        """
+        Read a synthetic dataset, optionally restricted to some columns and to a row range.
+
+        Only the chunks overlapping ``[offset, offset + limit)`` are fetched, and only the requested
+        columns of those chunks are decoded.
+        """
+        with self._session() as db:
+            query = db.query(DBSyntheticDataChunk.row_offset, DBSyntheticDataChunk.payload).filter(
+                DBSyntheticDataChunk.synthetic_data_id == synthetic_data_id,
+                DBSyntheticDataChunk.row_offset + DBSyntheticDataChunk.row_count > offset,
+            )
+            if limit is not None:
+                query = query.filter(DBSyntheticDataChunk.row_offset < offset + limit)
+            chunks = query.order_by(DBSyntheticDataChunk.chunk_index).all()
+        if not chunks:
+            return pd.DataFrame(columns=columns or [])
 
-    def save_synthetic_data(self, synthesizer_type: str, data: str, original_data_ids: str) -> SyntheticData:
+        first_offset = chunks[0].row_offset
+        table = decode_chunks([chunk.payload for chunk in chunks], columns)
+        table = table.slice(offset - first_offset, limit)
+        return table.to_pandas()
+
+    def get_filtered_dataframe(self, synthetic_data_id: int, filters: list[tuple[str, str, str]],
+                               columns: list[str] | None = None, offset: int = 0,
+                               limit: int | None = None) -> pd.DataFrame:
+        """
+        Read the rows matching every ``(column, operator, value)`` filter, paginated over the matching rows.
+
+        Chunks are streamed one at a time and only the projected and filtered columns are decoded; reading
+        stops as soon as ``limit`` matching rows past ``offset`` have been collected.
+        """
+        read_columns = None if columns is None else list(dict.fromkeys(columns + [f[0] for f in filters]))
+        tables, to_skip, remaining = [], offset, limit
+        with self._session() as db:
+            payloads = db.execute(
+                select(DBSyntheticDataChunk.payload)
+                .where(DBSyntheticDataChunk.synthetic_data_id == synthetic_data_id)
+                .order_by(DBSyntheticDataChunk.chunk_index)
+                .execution_options(yield_per=1)
+            ).scalars()
+            for payload in payloads:
+                table = filter_table(decode_chunk(payload, read_columns), filters)
+                if to_skip >= table.num_rows:
+                    to_skip -= table.num_rows
+                    continue
+                table = table.slice(to_skip, remaining)
+                to_skip = 0
+                tables.append(table.select(columns) if columns is not None else table)
+                if remaining is not None:
+                    remaining -= table.num_rows
+                    if remaining <= 0:
+                        break
+        if not tables:
+            return pd.DataFrame(columns=columns or [])
+        return pa.concat_tables(tables).to_pandas()
+
+    def save_synthetic_data(self, synthesizer_type: str, data: pd.DataFrame, original_data_ids: str) -> SyntheticData:
         """Save new synthetic data."""
+        chunk_rows = settings.synthetic_data_chunk_rows
+        data_schema, chunks = encode_dataframe(data, chunk_rows)
         db_record = DBSyntheticData(
             synthesizer_type=synthesizer_type,
-            data=data,
-            original_data_ids=original_data_ids
+            original_data_ids=original_data_ids,
+            row_count=len(data),
+            data_schema=data_schema,
+            chunk_rows=chunk_rows,
+            chunk_offsets=json.dumps([offset for offset, _, _ in chunks]),
         )
-        self.db.add(db_record)
-        self.db.commit()
-        self.db.refresh(db_record)
-        return SyntheticData.model_validate(db_record)
+        db_record.chunks = [
+            DBSyntheticDataChunk(chunk_index=index, row_offset=offset, row_count=row_count, payload=payload)
+            for index, (offset, row_count, payload) in enumerate(chunks)
+        ]
+        with self._session() as db:
+            db.add(db_record)
+            db.commit()
+            db.refresh(db_record)
+            return SyntheticData.model_validate(db_record)
+
+    def save_synthetic_data_batch(self, synthesizer_type: str, datasets: list[pd.DataFrame],
+                                  original_data_ids: str) -> list[int]:
+        """
+        Save several synthetic datasets in a single transaction and return their IDs, in order.
+
+        The manifests are inserted with one multi-row INSERT ... RETURNING and all the chunks with one
+        executemany, instead of one flush per object; either every dataset is stored or none is.
+        """
+        chunk_rows = settings.synthetic_data_chunk_rows
+        encoded = [encode_dataframe(data, chunk_rows) for data in datasets]
+        manifests = [
+            {
+                "synthesizer_type": synthesizer_type,
+                "original_data_ids": original_data_ids,
+                "row_count": len(data),
+                "data_schema": data_schema,
+                "chunk_rows": chunk_rows,
+                "chunk_offsets": json.dumps([offset for offset, _, _ in chunks]),
+                "created_at": datetime.datetime.utcnow(),
+            }
+            for data, (data_schema, chunks) in zip(datasets, encoded)
+        ]
+
+        with self._session() as db:
+            ids = list(db.scalars(
+                insert(DBSyntheticData).returning(DBSyntheticData.id, sort_by_parameter_order=True),
+                manifests,
+            ))
+            db.execute(insert(DBSyntheticDataChunk), [
+                {"synthetic_data_id": synthetic_data_id, "chunk_index": index, "row_offset": offset,
+                 "row_count": row_count, "payload": payload}
+                for synthetic_data_id, (_, chunks) in zip(ids, encoded)
+                for index, (offset, row_count, payload) in enumerate(chunks)
+            ])
+            db.commit()
+            return ids
 
     def get_all_data_records_from_csv(self, csv_path: str) -> pd.DataFrame:
         try:
@@ -44,7 +182,3 @@ class SyntheticDataRepository:
             raise ValueError("CSV file not found.")
         except Exception as e:
             raise ValueError("Error reading CSV file.")
-
-    def close(self):
-        """Close the database session."""
-        self.db.close()
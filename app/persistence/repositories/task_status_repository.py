@@ -1,46 +1,209 @@
-import uuid
+import datetime
+import json
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.db.models.result import DBResult
 from app.db.models.task_status import DBTaskStatus, TaskStatusEnum
-from app.entities.task_status import TaskStatus as TaskStatusEntity
+from app.entities.task_status import Job, JobType, TaskStatus as TaskStatusEntity
+from app.persistence.repositories.base_repository import BaseRepository
 
-class TaskStatusRepository:
+class TaskStatusRepository(BaseRepository):
     """
        Repository class for handling operations related to task status.
 
+       The ``task_status`` table doubles as a durable job queue: the API enqueues jobs and workers
+       claim them with ``SELECT ... FOR UPDATE SKIP LOCKED``.
+
        Methods:
            create_task(description, created_at): Creates a new task with the given description.
+           enqueue_job(description, job_type, payload, max_attempts): Creates a task to be run by a worker.
+           claim_next_job(worker_id): Locks and returns the next runnable job, if any.
+           heartbeat(task_id, worker_id): Records that a worker is still running a job.
+           complete_job(task_id, worker_id, accuracy, details, stage_timings): Stores the result of a job the
+               worker still holds.
+           retry_or_fail(task_id, worker_id, error, stage_timings): Requeues a failed job with backoff or marks it
+               as failed.
+           recover_orphaned_jobs(stale_after): Requeues jobs whose worker stopped sending heartbeats.
            update_task_status(task_id, status, accuracy, error): Updates the status of the task.
            get_task(task_id): Fetches the task by task_id.
            get_task_status(task_id): Fetches the current status of the task.
    """
-    def __init__(self):
-        self.db = next(get_db())
-
-    def create_task(self, description: str, created_at):
-        new_task = DBTaskStatus(
-            status=TaskStatusEnum.QUEUED,
-            description=description,
-            created_at=created_at,
-        )
-        self.db.add(new_task)
-        self.db.commit()
-        self.db.refresh(new_task)
-        return TaskStatusEntity.model_validate(new_task).id
+    def create_task(self, description: str, created_at=None):
+        with self._session() as db:
+            new_task = DBTaskStatus(
+                status=TaskStatusEnum.QUEUED,
+                description=description,
+                created_at=created_at or datetime.datetime.utcnow(),
+            )
+            db.add(new_task)
+            db.commit()
+            db.refresh(new_task)
+            return TaskStatusEntity.model_validate(new_task).id
 
-    def update_task_status(self, task_id: int, status: TaskStatusEnum, accuracy=None, error=None):
-        task = self.db.query(DBTaskStatus).filter(DBTaskStatus.id == task_id).first()
-        if task:
-            task.status = status
+    def enqueue_job(self, description: str, job_type: JobType, payload: dict, max_attempts: int) -> int:
+        now = datetime.datetime.utcnow()
+        with self._session() as db:
+            new_task = DBTaskStatus(
+                status=TaskStatusEnum.QUEUED,
+                description=description,
+                created_at=now,
+                job_type=job_type.value,
+                payload=json.dumps(payload),
+                attempts=0,
+                max_attempts=max_attempts,
+                available_at=now,
+            )
+            db.add(new_task)
+            db.commit()
+            db.refresh(new_task)
+            return new_task.id
+
+    def claim_next_job(self, worker_id: str) -> Job | None:
+        now = datetime.datetime.utcnow()
+        with self._session() as db:
+            task = (
+                db.query(DBTaskStatus)
+                .filter(
+                    DBTaskStatus.status == TaskStatusEnum.QUEUED,
+                    DBTaskStatus.job_type.isnot(None),
+                    DBTaskStatus.available_at <= now,
+                )
+                .order_by(DBTaskStatus.available_at, DBTaskStatus.id)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if not task:
+                db.rollback()
+                return None
+
+            task.status = TaskStatusEnum.IN_PROGRESS
+            task.attempts += 1
+            task.locked_by = worker_id
+            task.locked_at = now
+            task.heartbeat_at = now
+            db.commit()
+            return Job(
+                id=task.id,
+                job_type=task.job_type,
+                payload=json.loads(task.payload or "{}"),
+                attempts=task.attempts,
+                max_attempts=task.max_attempts,
+            )
+
+    def heartbeat(self, task_id: int, worker_id: str) -> bool:
+        with self._session() as db:
+            updated = (
+                db.query(DBTaskStatus)
+                .filter(
+                    DBTaskStatus.id == task_id,
+                    DBTaskStatus.locked_by == worker_id,
+                    DBTaskStatus.status == TaskStatusEnum.IN_PROGRESS,
+                )
+                .update({DBTaskStatus.heartbeat_at: datetime.datetime.utcnow()}, synchronize_session=False)
+            )
+            db.commit()
+            return updated == 1
+
+    def complete_job(self, task_id: int, worker_id: str, accuracy: float | None = None,
+                     details: str | None = None, stage_timings: dict | None = None) -> bool:
+        with self._session() as db:
+            task = (
+                db.query(DBTaskStatus)
+                .filter(
+                    DBTaskStatus.id == task_id,
+                    DBTaskStatus.locked_by == worker_id,
+                    DBTaskStatus.status == TaskStatusEnum.IN_PROGRESS,
+                )
+                .with_for_update()
+                .first()
+            )
+            if not task:
+                # The lock was lost, e.g. after a stall past the heartbeat timeout; the job was requeued elsewhere
+                db.rollback()
+                return False
+
+            # The result and the completion are committed together, so only the lock holder's result is kept
+            # Merge rather than add, so a retried job can overwrite the result of a previous attempt
+            db.merge(DBResult(task_id=task_id, accuracy=accuracy, details=details))
+            task.status = TaskStatusEnum.COMPLETED
             task.accuracy = accuracy
-            task.error = error
-            self.db.commit()
+            task.error = None
+            task.stage_timings = json.dumps(stage_timings) if stage_timings is not None else None
+            task.locked_by = None
+            task.locked_at = None
+            task.heartbeat_at = None
+            db.commit()
+            return True
+
+    def retry_or_fail(self, task_id: int, worker_id: str, error: str,
+                      stage_timings: dict | None = None) -> TaskStatusEnum | None:
+        with self._session() as db:
+            task = (
+                db.query(DBTaskStatus)
+                .filter(DBTaskStatus.id == task_id, DBTaskStatus.locked_by == worker_id)
+                .with_for_update()
+                .first()
+            )
+            if not task:
+                # The job was recovered by another worker in the meantime
+                db.rollback()
+                return None
+            status = self._release(task, error)
+            # The stages of the failed attempt, up to the one that raised
+            task.stage_timings = json.dumps(stage_timings) if stage_timings is not None else None
+            db.commit()
+            return status
+
+    def recover_orphaned_jobs(self, stale_after: datetime.timedelta) -> int:
+        cutoff = datetime.datetime.utcnow() - stale_after
+        with self._session() as db:
+            tasks = (
+                db.query(DBTaskStatus)
+                .filter(
+                    DBTaskStatus.status == TaskStatusEnum.IN_PROGRESS,
+                    DBTaskStatus.job_type.isnot(None),
+                    DBTaskStatus.heartbeat_at < cutoff,
+                )
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            for task in tasks:
+                self._release(task, f"Worker {task.locked_by} stopped responding")
+            db.commit()
+            return len(tasks)
+
+    @staticmethod
+    def _release(task: DBTaskStatus, error: str) -> TaskStatusEnum:
+        task.error = error
+        task.locked_by = None
+        task.locked_at = None
+        task.heartbeat_at = None
+        if task.attempts < task.max_attempts:
+            # Exponential backoff: base, 2 * base, 4 * base, ... capped at the configured maximum
+            backoff = min(settings.job_retry_backoff_seconds * 2 ** (task.attempts - 1),
+                          settings.job_retry_backoff_max_seconds)
+            task.status = TaskStatusEnum.QUEUED
+            task.available_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=backoff)
+        else:
+            task.status = TaskStatusEnum.FAILED
+        return task.status
+
+    def update_task_status(self, task_id: int, status: TaskStatusEnum, accuracy=None, error=None):
+        with self._session() as db:
+            task = db.query(DBTaskStatus).filter(DBTaskStatus.id == task_id).first()
+            if task:
+                task.status = status
+                task.accuracy = accuracy
+                task.error = error
+                db.commit()
 
     def get_task(self, task_id: int):
-        return self.db.query(DBTaskStatus).filter(DBTaskStatus.id == task_id).first()
+        with self._session() as db:
+            return db.query(DBTaskStatus).filter(DBTaskStatus.id == task_id).first()
 
 
     def get_task_status(self, task_id: int):
 
-        task = self.db.query(DBTaskStatus).filter(DBTaskStatus.id == task_id).first()
-        return task.status if task else None
\ No newline at end of file
+        with self._session() as db:
+            task = db.query(DBTaskStatus).filter(DBTaskStatus.id == task_id).first()
+            return task.status if task else None
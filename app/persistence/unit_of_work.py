@@ -0,0 +1,38 @@
+from app.db.session import SessionLocal
+from app.persistence.repositories.model_repository import ModelRepository
+from app.persistence.repositories.result_repository import ResultRepository
+from app.persistence.repositories.synthetic_data_repository import SyntheticDataRepository
+from app.persistence.repositories.task_status_repository import TaskStatusRepository
+from app.persistence.repositories.user_repository import UserRepository
+
+
+class UnitOfWork:
+    """
+        Scopes one database session to a request or a job.
+
+        The repositories exposed by a unit of work all run in its session. Leaving the ``with`` block
+        rolls back whatever was not committed if it raised, and always closes the session, so a failed
+        job cannot leave a broken transaction behind for the next one.
+
+        Usage:
+            with UnitOfWork() as uow:
+                uow.tasks.update_task_status(task_id, TaskStatusEnum.COMPLETED)
+    """
+    def __enter__(self) -> "UnitOfWork":
+        self.session = SessionLocal()
+        self.tasks = TaskStatusRepository(self.session)
+        self.results = ResultRepository(self.session)
+        self.synthetic_data = SyntheticDataRepository(self.session)
+        self.models = ModelRepository(self.session)
+        self.users = UserRepository(self.session)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is not None:
+                self.session.rollback()
+        finally:
+            self.session.close()
+
+    def commit(self):
+        self.session.commit()
@@ -1,49 +1,72 @@
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException
 from dependency_injector.wiring import inject, Provide
+from app.core.config import settings
+from app.core.executors import ExecutorSaturatedError, password_hashing_executor
 from app.entities.user import LoginRequest, RegisterRequest
-from app.persistence.repositories.user_repository import UserRepository
+from app.persistence.repositories.async_user_repository import AsyncUserRepository
 from app.utils.password_hasher import PasswordHasher
 from app.use_cases.services.jwt_service import JWTService
 from app.container import AppContainer
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+async def _hash_on_executor(operation: str, fn, *args):
+    """Run a bcrypt call on the bounded hashing pool, answering 503 when it is saturated."""
+    try:
+        return await password_hashing_executor.run(operation, fn, *args)
+    except ExecutorSaturatedError as e:
+        logger.warning(f"Password hashing pool saturated, rejecting {operation}: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Too many concurrent authentication requests, retry later",
+            headers={"Retry-After": str(settings.password_hashing_retry_after_seconds)},
+        )
+
 
 @router.post("/login")
 @inject
-def login(
+async def login(
     request: LoginRequest,
-    user_repo: UserRepository = Depends(Provide[AppContainer.user_repository]),
+    user_repo: AsyncUserRepository = Depends(Provide[AppContainer.user_repository]),
     password_hasher: PasswordHasher = Depends(Provide[AppContainer.password_hasher]),
     jwt_service: JWTService = Depends(Provide[AppContainer.jwt_service])
 ):
-    user = user_repo.get_user_by_username(request.username)
-    user_repo.close()
+    user = await user_repo.get_user_by_username(request.username)
 
-    if user and password_hasher.verify_password(request.password, user.hashed_password):
-        access_token = jwt_service.create_access_token(data={"sub": user.id, "username": user.username})
-        return {"access_token": access_token, "token_type": "bearer"}
+    if user:
+        verified, new_hash = await _hash_on_executor(
+            "verify", password_hasher.verify_and_update, request.password, user.hashed_password
+        )
+        if verified:
+            if new_hash:
+                # The stored hash uses a deprecated scheme or cost; replace it while the password is at hand
+                await user_repo.update_password_hash(user.id, new_hash)
+            access_token = jwt_service.create_access_token(data={"sub": user.id, "username": user.username})
+            return {"access_token": access_token, "token_type": "bearer"}
 
     raise HTTPException(status_code=401, detail="Invalid credentials")
 
 
 @router.post("/register")
 @inject
-def register(
+async def register(
     request: RegisterRequest,
-    user_repo: UserRepository = Depends(Provide[AppContainer.user_repository]),
+    user_repo: AsyncUserRepository = Depends(Provide[AppContainer.user_repository]),
     password_hasher: PasswordHasher = Depends(Provide[AppContainer.password_hasher])
 ):
-    if user_repo.get_user_by_username(request.username):
-        user_repo.close()
+    if await user_repo.get_user_by_username(request.username):
         raise HTTPException(status_code=400, detail="Username already registered")
 
-    hashed_password = password_hasher.hash_password(request.password)
+    hashed_password = await _hash_on_executor("hash", password_hasher.hash_password, request.password)
 
-    user = user_repo.create_user({
+    user = await user_repo.create_user({
         "username": request.username,
         "email": request.email,
         "hashed_password": hashed_password
     })
-    user_repo.close()
 
     return {"message": "User registered successfully"}
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from app.db.session import get_pool_status
+
+router = APIRouter()
+
+@router.get("/metrics")
+def prometheus_metrics_endpoint():
+    """
+        Endpoint exposing the Prometheus metrics of this process.
+
+        Returns:
+            Response: The metrics in the Prometheus text exposition format.
+    """
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+@router.get("/metrics/db-pool")
+def db_pool_metrics_endpoint():
+    """
+        Endpoint to inspect the database connection pool of this process.
+
+        Returns:
+            dict: Pool size, checked-in/out and overflow connections, and connect/checkout/invalidation counts.
+    """
+    return get_pool_status()
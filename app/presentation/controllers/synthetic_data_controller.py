@@ -1,13 +1,25 @@
+import asyncio
+import hashlib
+import json
 import logging
-from fastapi import APIRouter, HTTPException, Request, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Request, Depends, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from dependency_injector.wiring import inject, Provide
-from app.entities.synthetic_data import SynthesizerType
-from app.persistence.repositories.task_status_repository import TaskStatusRepository
+from app.core.config import settings
+from app.core.executors import run_blocking
+from app.entities.evaluation import EvaluationOptions
+from app.entities.synthetic_data import (ConditionalSamplingRequest, SynthesizerComparisonRequest, SynthesizerType,
+                                        SyntheticDataBatchRequest, SyntheticDataFormat)
+from app.entities.task_status import JobType, ProgressEvent, ProgressStage, TERMINAL_STATUSES
+from app.entities.trained_model import PredictionRequest
+from app.entities.training import TrainingOptions
+from app.persistence.columnar_codec import FILTER_OPERATORS
 from app.use_cases.services.data_service import DataService
+from app.use_cases.services.progress_broker import progress_broker
 from app.container import AppContainer
 from app.use_cases.services.result_service import ResultService
 from app.use_cases.services.task_status_service import TaskStatusService
-from app.use_cases.tasks.data_tasks import DataTask
+from app.utils.stage_profiler import StageProfiler, profile_path
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -17,7 +29,10 @@ logger = logging.getLogger(__name__)
 async def generate_synthetic_data_endpoint(
     request: Request,
     synthesizer_type: SynthesizerType,
-    data_service: DataService = Depends(Provide[AppContainer.data_service])
+    profile: bool = False,
+    evaluate: bool = False,
+    data_service: DataService = Depends(Provide[AppContainer.data_service]),
+    task_status_service: TaskStatusService = Depends(Provide[AppContainer.task_status_service]),
 ):
     """
         Endpoint to generate synthetic data based on a specified synthesizer type.
@@ -25,55 +40,338 @@ async def generate_synthetic_data_endpoint(
         Args:
             request (Request): The request object.
             synthesizer_type (SynthesizerType): Type of synthesizer to use.
+            profile (bool): Whether to run the generation under cProfile and return its stage timings.
+            evaluate (bool): Whether to queue a job precomputing the evaluation of the generated data.
             data_service (DataService): Data service to handle data generation logic.
+            task_status_service (TaskStatusService): Service to handle task statuses.
 
         Returns:
-            dict: Synthetic data ID and synthesizer type used.
+            dict: Synthetic data ID, synthesizer type used and, when requested, the evaluation task ID.
     """
     try:
-        synthetic_data_id = data_service.generate_synthetic_data(synthesizer_type)
-        return {"id": synthetic_data_id, "synthesizer_type": synthesizer_type.value}
+        profiler = _request_profiler("generate_synthetic_data", profile)
+        synthetic_data_id = await run_blocking(data_service.generate_synthetic_data, synthesizer_type,
+                                               profiler=profiler)
+        response = {"id": synthetic_data_id, "synthesizer_type": synthesizer_type.value}
+        if evaluate:
+            response["evaluation_task_id"] = await _enqueue_evaluation(task_status_service, synthetic_data_id)
+        if profile:
+            response["profile"] = _profile_summary(profiler)
+        return response
     except Exception as e:
         logger.error(f"Error during synthetic data generation: {e}")
         raise HTTPException(status_code=500, detail="Error generating synthetic data")
 
 
+def _request_profiler(pipeline: str, profile: bool) -> StageProfiler:
+    return StageProfiler(pipeline, profile_path(pipeline) if profile else None)
+
+
+def _profile_summary(profiler: StageProfiler) -> dict:
+    return {"stage_timings": profiler.timings(), "path": profiler.profile_path}
+
+
+async def _enqueue_evaluation(task_status_service: TaskStatusService, synthetic_data_id: int) -> int:
+    """Queue a job computing and storing the full evaluation of a synthetic dataset, answered later from the store."""
+    return await task_status_service.enqueue_job(
+        f"Evaluation of synthetic data {synthetic_data_id}",
+        JobType.EVALUATE,
+        {"synthetic_data_id": synthetic_data_id, "options": EvaluationOptions().model_dump(mode="json")},
+    )
+
+
+@router.post("/generate/conditional/")
+@inject
+async def generate_conditional_synthetic_data_endpoint(
+    sampling_request: ConditionalSamplingRequest,
+    evaluate: bool = False,
+    data_service: DataService = Depends(Provide[AppContainer.data_service]),
+    task_status_service: TaskStatusService = Depends(Provide[AppContainer.task_status_service]),
+):
+    """
+        Endpoint to generate synthetic rows for given slices of the data, e.g. ``pclass=1, sex=female``.
+
+        Each slice comes with a row quota, and slices with the same conditions are sampled together.
+        Partial rows given in ``known_rows`` get their missing columns sampled. The rows are stored as
+        one synthetic dataset.
+
+        Args:
+            sampling_request (ConditionalSamplingRequest): Synthesizer, slices with their quotas and known rows.
+            evaluate (bool): Whether to queue a job precomputing the evaluation of the generated data.
+            data_service (DataService): Data service to handle data generation logic.
+            task_status_service (TaskStatusService): Service to handle task statuses.
+
+        Returns:
+            dict: Synthetic data ID, row count, per distinct slice the rows requested and sampled and, when
+            requested, the evaluation task ID.
+    """
+    if not sampling_request.slices and not sampling_request.known_rows:
+        raise HTTPException(status_code=422, detail="Give at least one slice or known row")
+    total_rows = sum(slice_.num_rows for slice_ in sampling_request.slices) + len(sampling_request.known_rows)
+    if total_rows > settings.batch_max_total_rows:
+        raise HTTPException(status_code=422,
+                            detail=f"A request may ask for at most {settings.batch_max_total_rows} rows in total")
+    try:
+        result = await run_blocking(
+            data_service.generate_conditional_synthetic_data,
+            sampling_request.synthesizer_type,
+            [slice_.model_dump() for slice_ in sampling_request.slices],
+            sampling_request.known_rows,
+            sampling_request.hyperparameters,
+            sampling_request.max_tries_per_batch,
+        )
+        if evaluate:
+            result["evaluation_task_id"] = await _enqueue_evaluation(task_status_service, result["id"])
+    except ValueError as e:
+        # Unknown condition columns, or conditions SDV could not satisfy
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error during conditional synthetic data generation: {e}")
+        raise HTTPException(status_code=500, detail="Error generating synthetic data")
+    return {**result, "synthesizer_type": sampling_request.synthesizer_type.value}
+
+
+@router.post("/generate/batch/")
+@inject
+async def generate_synthetic_data_batch_endpoint(
+    batch_request: SyntheticDataBatchRequest,
+    description: str = "Batch synthetic data generation",
+    profile: bool = False,
+    task_status_service: TaskStatusService = Depends(Provide[AppContainer.task_status_service]),
+):
+    """
+        Endpoint to queue a job generating several synthetic datasets from a single fit.
+
+        The worker fits the synthesizer once, samples the datasets in parallel (each with its own seed, when
+        given) and stores them in one transaction. Their IDs are available from /result/{task_id} once the
+        task has completed.
+
+        Args:
+            batch_request (SyntheticDataBatchRequest): Synthesizer, hyperparameters and the datasets to sample,
+                and whether to queue the evaluation of each of them once they are stored.
+            description (str): Description of the task.
+            profile (bool): Whether the worker runs the job under cProfile; stage timings are always recorded.
+            task_status_service (TaskStatusService): Service to handle task statuses.
+
+        Returns:
+            dict: Task ID and initiation status.
+    """
+    total_rows = sum(sample.num_rows for sample in batch_request.samples)
+    if total_rows > settings.batch_max_total_rows:
+        raise HTTPException(status_code=422,
+                            detail=f"A batch may request at most {settings.batch_max_total_rows} rows in total")
+    try:
+        task_id = await task_status_service.enqueue_job(
+            description,
+            JobType.GENERATE_BATCH,
+            {**batch_request.model_dump(mode="json"), "profile": profile},
+        )
+        return {"task_id": task_id, "status": "Task initiated. Check status with the task_id"}
+    except Exception as e:
+        logger.error(f"Error initiating batch generation: {e}")
+        raise HTTPException(status_code=500, detail="Error initiating batch generation")
+
+
+# Stored synthetic datasets never change, so a read is identified by the dataset and the query alone
+SYNTHETIC_DATA_CACHE_CONTROL = "private, max-age=86400"
+
+
+def _etag(metadata, *parts) -> str:
+    key = json.dumps([metadata.id, metadata.created_at.isoformat() if metadata.created_at else None,
+                      metadata.row_count, *parts], default=str)
+    return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _parse_filter(expression: str) -> tuple[str, str, str]:
+    column, operator, value = (expression.split(":", 2) + ["", ""])[:3]
+    if not column or operator not in FILTER_OPERATORS:
+        raise HTTPException(status_code=422,
+                            detail=f"Invalid filter {expression!r}, expected column:operator:value with operator "
+                                   f"one of {', '.join(FILTER_OPERATORS)}")
+    return column, operator, value
+
+
+async def _get_metadata_or_404(data_service: DataService, synthetic_data_id: int):
+    metadata = await run_blocking(data_service.get_synthetic_data_metadata, synthetic_data_id)
+    if metadata is None:
+        raise HTTPException(status_code=404, detail="Synthetic data not found")
+    return metadata
+
+
+@router.get("/synthetic-data/{synthetic_data_id}/metadata")
+@inject
+async def get_synthetic_data_metadata(
+    synthetic_data_id: int,
+    request: Request,
+    data_service: DataService = Depends(Provide[AppContainer.data_service])
+):
+    """
+        Endpoint to get the size and schema of a stored synthetic dataset, without reading its rows.
+
+        Args:
+            synthetic_data_id (int): Synthetic data ID.
+            request (Request): The request object, for ``If-None-Match``.
+            data_service (DataService): Data service to read synthetic data.
+
+        Returns:
+            dict: ID, synthesizer type, row count, column names and types, chunk size and creation date.
+    """
+    metadata = await _get_metadata_or_404(data_service, synthetic_data_id)
+    etag = _etag(metadata, "metadata")
+    headers = {"ETag": etag, "Cache-Control": SYNTHETIC_DATA_CACHE_CONTROL}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=json.loads(metadata.model_dump_json()), headers=headers)
+
+
+@router.get("/synthetic-data/{synthetic_data_id}")
+@inject
+async def read_synthetic_data(
+    synthetic_data_id: int,
+    request: Request,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=1_000, gt=0, le=settings.synthetic_data_page_max_rows),
+    columns: list[str] | None = Query(default=None),
+    filter_: list[str] = Query(default=[], alias="filter"),
+    data_service: DataService = Depends(Provide[AppContainer.data_service])
+):
+    """
+        Endpoint to read a page of a stored synthetic dataset.
+
+        Only the chunks holding the requested rows are fetched, and only the requested columns are decoded.
+        Filters are ``column:operator:value`` with operator eq, ne, lt, le, gt or ge; with filters, ``offset``
+        and ``limit`` count matching rows. Responses carry an ETag, and ``If-None-Match`` gets a 304
+        without reading any row.
+
+        Args:
+            synthetic_data_id (int): Synthetic data ID.
+            request (Request): The request object, for ``If-None-Match``.
+            offset (int): Rows to skip.
+            limit (int): Maximum number of rows to return.
+            columns (list[str] | None): Columns to return, all of them by default.
+            filter_ (list[str]): ``filter`` query parameters, conditions the rows must all match, e.g. ``pclass:eq:1``.
+            data_service (DataService): Data service to read synthetic data.
+
+        Returns:
+            dict: The page of rows, with its offset and the offset of the next page (None on the last page).
+    """
+    metadata = await _get_metadata_or_404(data_service, synthetic_data_id)
+    filters = [_parse_filter(expression) for expression in filter_]
+    etag = _etag(metadata, offset, limit, columns, filters)
+    headers = {"ETag": etag, "Cache-Control": SYNTHETIC_DATA_CACHE_CONTROL}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        page = await run_blocking(data_service.read_synthetic_data, synthetic_data_id, columns, filters, offset, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error reading synthetic data: {e}")
+        raise HTTPException(status_code=500, detail="Error reading synthetic data")
+
+    return JSONResponse(
+        content={
+            "id": synthetic_data_id,
+            "offset": offset,
+            "next_offset": offset + len(page) if len(page) == limit else None,
+            "columns": list(page.columns),
+            # Through pandas' JSON writer, so that NaN and timestamps are encoded as null and ISO strings
+            "rows": json.loads(page.to_json(orient="records", date_format="iso")),
+        },
+        headers=headers,
+    )
+
+
+STREAM_MEDIA_TYPES = {
+    SyntheticDataFormat.ndjson: "application/x-ndjson",
+    SyntheticDataFormat.csv: "text/csv",
+}
+
+@router.post("/generate/stream/")
+@inject
+async def stream_synthetic_data_endpoint(
+    synthesizer_type: SynthesizerType,
+    num_rows: int = Query(..., gt=0, le=settings.stream_max_rows),
+    output_format: SyntheticDataFormat = SyntheticDataFormat.ndjson,
+    batch_size: int = Query(default=settings.stream_batch_size, gt=0, le=settings.stream_max_batch_size),
+    data_service: DataService = Depends(Provide[AppContainer.data_service])
+):
+    """
+        Endpoint to stream a large synthetic dataset without storing it.
+
+        Rows are sampled in batches of ``batch_size`` and each batch is sent as soon as it is ready.
+
+        Args:
+            synthesizer_type (SynthesizerType): Type of synthesizer to use.
+            num_rows (int): Total number of rows to generate.
+            output_format (SyntheticDataFormat): NDJSON or CSV.
+            batch_size (int): Number of rows sampled per batch, at most ``stream_max_batch_size``.
+            data_service (DataService): Data service to handle data generation logic.
+
+        Returns:
+            StreamingResponse: The synthetic rows, batch by batch.
+    """
+    try:
+        chunks = await run_blocking(
+            data_service.stream_synthetic_data, synthesizer_type, num_rows, output_format, batch_size
+        )
+    except Exception as e:
+        logger.error(f"Error preparing synthetic data stream: {e}")
+        raise HTTPException(status_code=500, detail="Error generating synthetic data")
+
+    return StreamingResponse(
+        chunks,
+        media_type=STREAM_MEDIA_TYPES[output_format],
+        headers={"Content-Disposition": f"attachment; filename=synthetic_{synthesizer_type.value}.{output_format.value}"},
+    )
+
+
 @router.post("/augment-and-train/")
 @inject
 async def augment_and_train_endpoint(
-    background_tasks: BackgroundTasks,
     synthesizer_type: SynthesizerType,
     augmentation_factor: int = 2,
     description: str = "Data augmentation and training",
+    training_options: TrainingOptions | None = None,
+    profile: bool = False,
     task_status_service: TaskStatusService = Depends(Provide[AppContainer.task_status_service]),
-    data_service: DataService = Depends(Provide[AppContainer.data_service]),
 ):
     """
-        Endpoint to start an asynchronous data augmentation and model training process.
+        Endpoint to queue a data augmentation and model training job.
+
+        The job is executed by a worker process (``python -m app.worker``); this endpoint only enqueues it.
 
         Args:
-            background_tasks (BackgroundTasks): Background tasks to handle async processes.
             synthesizer_type (SynthesizerType): Type of synthesizer to use.
             augmentation_factor (int): Factor by which to augment the data.
             description (str): Description of the task.
+            training_options (TrainingOptions): Parallelism, warm-start and early-stopping options of the training,
+                and the cross-validation stored in the details of the result.
+            profile (bool): Whether the worker runs the job under cProfile; stage timings are always recorded.
             task_status_service (TaskStatusService): Service to handle task statuses.
-            data_service (DataService): Service to handle data augmentation and training.
 
         Returns:
             dict: Task ID and initiation status.
         """
     try:
-        # Create the task using the TaskService, including a description and created_at timestamp
-        task_id = task_status_service.create_task(description)
-
-        # Add the background task to run the training asynchronously
-        background_tasks.add_task(
-            DataTask.run_augment_and_train_task,
-            task_id,
-            synthesizer_type,
-            augmentation_factor,
-            data_service,
-            task_status_service,
+        task_id = await task_status_service.enqueue_job(
+            description,
+            JobType.AUGMENT_AND_TRAIN,
+            {
+                "synthesizer_type": synthesizer_type.value,
+                "augmentation_factor": augmentation_factor,
+                "training_options": training_options.model_dump() if training_options else None,
+                "profile": profile,
+            },
         )
 
         # Return the task ID to the user so they can check the status later
@@ -82,24 +380,72 @@ async def augment_and_train_endpoint(
         logger.error(f"Error initiating model training: {e}")
         raise HTTPException(status_code=500, detail="Error initiating data augmentation and training")
 
+@router.post("/compare/")
+@inject
+async def compare_synthesizers_endpoint(
+    comparison_request: SynthesizerComparisonRequest,
+    description: str = "Synthesizer comparison",
+    profile: bool = False,
+    task_status_service: TaskStatusService = Depends(Provide[AppContainer.task_status_service]),
+):
+    """
+        Endpoint to queue a job comparing several synthesizer configurations on the same data.
+
+        The candidates are fitted, sampled and evaluated in parallel by a worker. The ranked leaderboard,
+        with per-stage timings, is available from /result/{task_id} once the task has completed.
+
+        Args:
+            comparison_request (SynthesizerComparisonRequest): Synthesizer types and hyperparameters to compare.
+            description (str): Description of the task.
+            profile (bool): Whether the worker runs the job under cProfile; stage timings are always recorded.
+            task_status_service (TaskStatusService): Service to handle task statuses.
+
+        Returns:
+            dict: Task ID and initiation status.
+    """
+    try:
+        task_id = await task_status_service.enqueue_job(
+            description,
+            JobType.COMPARE_SYNTHESIZERS,
+            {**comparison_request.model_dump(mode="json"), "profile": profile},
+        )
+        return {"task_id": task_id, "status": "Task initiated. Check status with the task_id"}
+    except Exception as e:
+        logger.error(f"Error initiating synthesizer comparison: {e}")
+        raise HTTPException(status_code=500, detail="Error initiating synthesizer comparison")
+
 @router.post("/evaluate/")
 @inject
 async def evaluate_synthetic_data_endpoint(
     request: Request,
     synthetic_data_id: int,
+    evaluation_options: EvaluationOptions = Depends(),
+    profile: bool = False,
+    refresh: bool = False,
     data_service: DataService = Depends(Provide[AppContainer.data_service])
 ):
     """"
     Endpoint to evaluate a synthetic data based on a specified synthesizer type.
+
+    Evaluations are stored, so repeated calls for the same dataset and options are answered without
+    recomputing the scores, and concurrent calls share one computation.
+
     Args:
         request (Request): The request object.
         synthetic_data_id (int): Synthetic data ID.
+        evaluation_options (EvaluationOptions): Full report, or sampled mode with bounded rows and column pairs.
+        profile (bool): Whether to run the evaluation under cProfile and return its stage timings.
+        refresh (bool): Whether to recompute the scores even when they are stored.
         data_service (DataService): Data service to handle data evaluation.
     Returns:
-        score: score of the evaluted synthetic data
+        score: score of the evaluted synthetic data, with the per-column and per-pair scores under ``Details``
     """
     try:
-        scores = data_service.evaluate_synthetic_data(synthetic_data_id)
+        profiler = _request_profiler("evaluate_synthetic_data", profile)
+        scores = await run_blocking(data_service.evaluate_synthetic_data, synthetic_data_id, evaluation_options,
+                                    refresh, profiler=profiler)
+        if profile:
+            scores["profile"] = _profile_summary(profiler)
         return scores
     except Exception as e:
         logger.error(f"Error during evaluation: {e}")
@@ -108,28 +454,58 @@ async def evaluate_synthetic_data_endpoint(
 @router.get("/result/{task_id}")
 @inject
 async def get_result_by_task_id(
-    task_id: str,
+    task_id: int,
     result_service: ResultService = Depends(Provide[AppContainer.result_service])
 ):
     """
      Endpoint to retrieve the accuracy of a task result by task ID.
 
      Args:
-         task_id (str): ID of the task.
+         task_id (int): ID of the task.
          result_service (ResultService): Service to fetch result data.
 
      Returns:
-         dict: Task ID and accuracy.
+         dict: Task ID, accuracy and, for jobs that produce them, result details.
      """
     try:
-        result = result_service.get_result_by_task_id(task_id)
+        result = await result_service.get_result_by_task_id(task_id)
         if result is None:
             raise HTTPException(status_code=404, detail="Result not found")
-        return {"task_id": result.task_id, "accuracy": result.accuracy}
+        details = json.loads(result.details) if result.details else None
+        return {"task_id": result.task_id, "accuracy": result.accuracy, "details": details}
     except Exception as e:
         logger.error(f"Error retrieving result: {e}")
         raise HTTPException(status_code=500, detail="Error retrieving result")
 
+@router.post("/predict/{task_id}")
+@inject
+async def predict_endpoint(
+    task_id: int,
+    prediction_request: PredictionRequest,
+    data_service: DataService = Depends(Provide[AppContainer.data_service])
+):
+    """
+     Endpoint to score a batch of passengers with the model trained by a task.
+
+     Args:
+         task_id (int): ID of the augment-and-train task that produced the model.
+         prediction_request (PredictionRequest): Raw passenger rows to score.
+         data_service (DataService): Data service holding the model registry.
+
+     Returns:
+         dict: Task ID and the class probabilities of each row.
+     """
+    try:
+        probabilities = await run_blocking(
+            data_service.model_registry.predict_proba, task_id, prediction_request.rows
+        )
+        return {"task_id": task_id, "probabilities": probabilities}
+    except LookupError:
+        raise HTTPException(status_code=404, detail="Model not found")
+    except Exception as e:
+        logger.error(f"Error during prediction: {e}")
+        raise HTTPException(status_code=500, detail="Error during prediction")
+
 @router.get("/task-status/{task_id}")
 @inject
 async def get_task_status(
@@ -147,10 +523,87 @@ async def get_task_status(
            dict: Task ID and status.
        """
     try:
-        status = task_status_service.get_task_status(task_id)
+        status = await task_status_service.get_task_status(task_id)
         if status is None:
             raise HTTPException(status_code=404, detail="Task not found")
         return {"task_id": task_id, "status": status}
     except Exception as e:
         logger.error(f"Error retrieving task status: {e}")
         raise HTTPException(status_code=500, detail="Error retrieving task status")
+
+
+@router.get("/task-status/{task_id}/timings")
+@inject
+async def get_task_stage_timings(
+    task_id: int,
+    task_status_service: TaskStatusService = Depends(Provide[AppContainer.task_status_service])
+):
+    """
+       Endpoint to get the wall time, CPU time and peak memory of each stage of a job's last attempt.
+
+       Args:
+           task_id (int): ID of the task.
+           task_status_service (TaskStatusService): Service to fetch task status.
+
+       Returns:
+           dict: Task ID and stage timings, None until an attempt has finished.
+       """
+    task = await task_status_service.get_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    stage_timings = json.loads(task.stage_timings) if task.stage_timings else None
+    return {"task_id": task_id, "stage_timings": stage_timings}
+
+
+def _sse_message(event: ProgressEvent) -> str:
+    return f"event: {event.stage.value}\ndata: {event.model_dump_json(exclude_none=True)}\n\n"
+
+
+@router.get("/task-status/{task_id}/events")
+@inject
+async def stream_task_events(
+    task_id: int,
+    request: Request,
+    task_status_service: TaskStatusService = Depends(Provide[AppContainer.task_status_service])
+):
+    """
+       Server-sent events stream of a task: its status changes and the progress of the running job
+       (fit started, fit epoch N of M, sampling at X%, training, evaluating).
+
+       The current status is sent first; the stream ends once the task is completed or failed.
+
+       Args:
+           task_id (int): ID of the task.
+           request (Request): The request object, used to notice disconnected clients.
+           task_status_service (TaskStatusService): Service to fetch task status.
+
+       Returns:
+           StreamingResponse: A ``text/event-stream`` of ``ProgressEvent`` messages.
+       """
+    if await task_status_service.get_task_status(task_id) is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    async def events():
+        async with progress_broker.subscribe(task_id) as queue:
+            # Read the status once subscribed, so a change in between is not missed
+            status = await task_status_service.get_task_status(task_id)
+            yield _sse_message(ProgressEvent(task_id=task_id, stage=ProgressStage.STATUS, status=status))
+            if status in TERMINAL_STATUSES:
+                return
+            latest = progress_broker.latest(task_id)
+            if latest is not None and latest.stage != ProgressStage.STATUS:
+                yield _sse_message(latest)
+
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.progress_keepalive_seconds)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle stream while a long fit is running
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse_message(event)
+                if event.stage == ProgressStage.STATUS and event.status in TERMINAL_STATUSES:
+                    return
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
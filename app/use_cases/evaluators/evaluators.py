@@ -1,18 +1,59 @@
-from sdmetrics.reports.single_table import QualityReport
+import json
+from importlib.metadata import PackageNotFoundError, version
+
+from app.entities.evaluation import EvaluationMode, EvaluationOptions
+from app.use_cases.evaluators.sampled_evaluator import SampledQualityEvaluator
+
+# Version of the metrics and of how they are aggregated; bump it whenever they change, so that stored
+# evaluations computed the previous way are not served anymore
+EVALUATION_SUITE_VERSION = 1
 
 class Evaluator:
     @staticmethod
-    def evaluate_data_quality(synthetic_data, real_data, metadata):
+    def suite_version() -> str:
+        """Identifies the metrics computing the scores: this module's version and the sdmetrics release."""
+        try:
+            sdmetrics_version = version("sdmetrics")
+        except PackageNotFoundError:
+            sdmetrics_version = "unknown"
+        return f"{EVALUATION_SUITE_VERSION}+sdmetrics-{sdmetrics_version}"
+
+    @staticmethod
+    def evaluate_data_quality(synthetic_data, real_data, metadata, options: EvaluationOptions | None = None,
+                              real_data_key: str | None = None):
+        """
+        Score synthetic data against the real data.
+
+        The full sdmetrics QualityReport is used by default. With ``options.mode == "sampled"``, the scores are
+        approximated on row samples and a capped number of column pairs, and the report states the sampling used;
+        ``real_data_key`` identifies the real dataset so its statistics can be reused across evaluations.
+
+        The scores come with their ``Details``: the score of every column (``Column Shapes``) and column pair
+        (``Column Pair Trends``), with the metric that computed it.
+        """
+        if options is not None and options.mode == EvaluationMode.SAMPLED:
+            return SampledQualityEvaluator.evaluate(synthetic_data, real_data, metadata.to_dict(), options,
+                                                    real_data_key)
+
+        from sdmetrics.reports.single_table import QualityReport
+
         quality_report = QualityReport()
         quality_report.generate(real_data, synthetic_data, metadata.to_dict())
 
         # Extract the relevant scores
-        column_shapes_score = quality_report.get_details("Column Shapes")["Score"].mean()
-        column_pair_trends_score = quality_report.get_details("Column Pair Trends")["Score"].mean()
+        column_shapes = quality_report.get_details("Column Shapes")
+        column_pair_trends = quality_report.get_details("Column Pair Trends")
+        column_shapes_score = column_shapes["Score"].mean()
+        column_pair_trends_score = column_pair_trends["Score"].mean()
         overall_score = quality_report.get_score()
 
         return {
             "Column Shapes Score": column_shapes_score,
             "Column Pair Trends Score": column_pair_trends_score,
-            "Overall Score": overall_score
+            "Overall Score": overall_score,
+            "Details": {
+                # Through JSON, so missing scores become None and numpy scalars plain numbers
+                "Column Shapes": json.loads(column_shapes.to_json(orient="records")),
+                "Column Pair Trends": json.loads(column_pair_trends.to_json(orient="records")),
+            },
         }
@@ -0,0 +1,159 @@
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from app.entities.evaluation import EvaluationOptions
+
+NUM_DISCRETE_BINS = 10
+_REAL_SAMPLE_CACHE_SIZE = 16
+
+
+def _finite_or_none(score: float) -> float | None:
+    # A metric that could not be computed is reported as missing
+    return None if np.isnan(score) else score
+
+
+class SampledQualityEvaluator:
+    """
+    Bounded-time variant of the sdmetrics QualityReport.
+
+    Runs the metrics the QualityReport uses (KSComplement / TVComplement for column shapes,
+    CorrelationSimilarity / ContingencySimilarity for column pair trends), taken from sdmetrics itself,
+    but on seeded row samples and on at most ``max_column_pairs`` pairs, computed in parallel. The
+    sampled real rows only depend on the real dataset and the sampling options, so they are drawn once
+    per ``real_data_key`` and reused by later evaluations.
+    """
+
+    _real_samples: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def evaluate(cls, synthetic_data: pd.DataFrame, real_data: pd.DataFrame, metadata: dict,
+                 options: EvaluationOptions, real_data_key: str | None = None) -> dict:
+        sdtypes = {column: spec["sdtype"] for column, spec in metadata["columns"].items()
+                   if column in real_data.columns and column in synthetic_data.columns}
+        columns = list(sdtypes)
+        all_pairs = list(itertools.combinations(columns, 2))
+        pairs = cls._select_pairs(all_pairs, options)
+
+        real_sample = cls._get_real_sample(real_data, columns, options, real_data_key)
+        synthetic_sample = cls._sample(synthetic_data[columns], options)
+
+        with ThreadPoolExecutor(max_workers=options.n_jobs) as executor:
+            shape_scores = dict(zip(columns, executor.map(
+                lambda column: cls._column_shape(real_sample[column], synthetic_sample[column], sdtypes[column]),
+                columns,
+            )))
+            pair_scores = dict(zip(pairs, executor.map(
+                lambda pair: cls._column_pair_trend(real_sample[list(pair)], synthetic_sample[list(pair)], sdtypes),
+                pairs,
+            )))
+
+        column_shapes_score = float(np.nanmean(list(shape_scores.values()))) if shape_scores else float("nan")
+        column_pair_trends_score = float(np.nanmean(list(pair_scores.values()))) if pair_scores else float("nan")
+        return {
+            "Column Shapes Score": column_shapes_score,
+            "Column Pair Trends Score": column_pair_trends_score,
+            "Overall Score": float(np.nanmean([column_shapes_score, column_pair_trends_score])),
+            "Sampling": {
+                "mode": options.mode.value,
+                "seed": options.seed,
+                "max_rows": options.max_rows,
+                "real_rows": len(real_sample),
+                "synthetic_rows": len(synthetic_sample),
+                "max_column_pairs": options.max_column_pairs,
+                "column_pairs_evaluated": len(pairs),
+                "column_pairs_total": len(all_pairs),
+            },
+            "Details": {
+                "Column Shapes": [
+                    {"Column": column, "Metric": cls._column_shape_metric(sdtypes[column]),
+                     "Score": _finite_or_none(score)}
+                    for column, score in shape_scores.items()
+                ],
+                "Column Pair Trends": [
+                    {"Column 1": left, "Column 2": right, "Metric": cls._column_pair_metric(left, right, sdtypes),
+                     "Score": _finite_or_none(score)}
+                    for (left, right), score in pair_scores.items()
+                ],
+            },
+        }
+
+    @staticmethod
+    def _sample(data: pd.DataFrame, options: EvaluationOptions) -> pd.DataFrame:
+        if len(data) <= options.max_rows:
+            return data
+        return data.sample(n=options.max_rows, random_state=options.seed)
+
+    @staticmethod
+    def _select_pairs(pairs: list[tuple[str, str]], options: EvaluationOptions) -> list[tuple[str, str]]:
+        if len(pairs) <= options.max_column_pairs:
+            return pairs
+        rng = np.random.default_rng(options.seed)
+        selected = rng.choice(len(pairs), size=options.max_column_pairs, replace=False)
+        return [pairs[index] for index in sorted(selected)]
+
+    @classmethod
+    def _get_real_sample(cls, real_data: pd.DataFrame, columns: list[str], options: EvaluationOptions,
+                         real_data_key: str | None) -> pd.DataFrame:
+        if real_data_key is None:
+            return cls._sample(real_data[columns], options)
+
+        key = (real_data_key, options.max_rows, options.seed, tuple(columns))
+        with cls._lock:
+            if key in cls._real_samples:
+                cls._real_samples.move_to_end(key)
+                return cls._real_samples[key]
+
+        # A private copy, so the cached sample does not keep the caller's frame alive
+        sample = cls._sample(real_data[columns], options).copy()
+        with cls._lock:
+            cls._real_samples[key] = sample
+            while len(cls._real_samples) > _REAL_SAMPLE_CACHE_SIZE:
+                cls._real_samples.popitem(last=False)
+        return sample
+
+    @staticmethod
+    def _column_shape_metric(sdtype: str) -> str:
+        return "KSComplement" if sdtype == "numerical" else "TVComplement"
+
+    @staticmethod
+    def _column_pair_metric(left: str, right: str, sdtypes: dict) -> str:
+        if sdtypes[left] == "numerical" and sdtypes[right] == "numerical":
+            return "CorrelationSimilarity"
+        return "ContingencySimilarity"
+
+    @staticmethod
+    def _column_shape(real: pd.Series, synthetic: pd.Series, sdtype: str) -> float:
+        from sdmetrics.single_column import KSComplement, TVComplement
+
+        metric = KSComplement if sdtype == "numerical" else TVComplement
+        try:
+            return float(metric.compute(real, synthetic))
+        except Exception:
+            # Like the QualityReport, a metric that cannot be computed does not count towards the score
+            return float("nan")
+
+    @staticmethod
+    def _column_pair_trend(real: pd.DataFrame, synthetic: pd.DataFrame, sdtypes: dict) -> float:
+        from sdmetrics.column_pairs import ContingencySimilarity, CorrelationSimilarity
+        from sdmetrics.utils import discretize_column
+
+        left, right = real.columns
+        try:
+            if sdtypes[left] == "numerical" and sdtypes[right] == "numerical":
+                return float(CorrelationSimilarity.compute(real, synthetic, coefficient="Pearson"))
+
+            # Mixed pairs: numerical columns are binned on the real data first, as the QualityReport does
+            real, synthetic = real.copy(), synthetic.copy()
+            for column in (left, right):
+                if sdtypes[column] == "numerical":
+                    real[column], synthetic[column] = discretize_column(real[column], synthetic[column],
+                                                                        num_discrete_bins=NUM_DISCRETE_BINS)
+            return float(ContingencySimilarity.compute(real, synthetic))
+        except Exception:
+            return float("nan")
@@ -1,14 +1,31 @@
-from sdv.single_table import CTGANSynthesizer, GaussianCopulaSynthesizer, CopulaGANSynthesizer
+import importlib
+
 from app.entities.synthetic_data import SynthesizerType  # Import the enum
 
+# sdv pulls in torch through CTGAN, so the synthesizer classes are only imported on first use
+_SYNTHESIZER_CLASSES = {
+    SynthesizerType.ctgan: "CTGANSynthesizer",
+    SynthesizerType.copulagan: "CopulaGANSynthesizer",
+    SynthesizerType.gaussiancopula: "GaussianCopulaSynthesizer",
+}
+
+
 class SynthesizerFactory:
     @staticmethod
-    def get_synthesizer(synthesizer_type: SynthesizerType, metadata):
-        if synthesizer_type == SynthesizerType.ctgan:
-            return CTGANSynthesizer(metadata)
-        elif synthesizer_type == SynthesizerType.copulagan:
-            return CopulaGANSynthesizer(metadata)
-        elif synthesizer_type == SynthesizerType.gaussiancopula:
-            return GaussianCopulaSynthesizer(metadata)
-        else:
+    def get_synthesizer(synthesizer_type: SynthesizerType, metadata, **hyperparameters):
+        synthesizer_class = SynthesizerFactory._get_synthesizer_class(synthesizer_type)
+        return synthesizer_class(metadata, **hyperparameters)
+
+    @staticmethod
+    def load_synthesizer(synthesizer_type: SynthesizerType, filepath: str):
+        """Load a fitted synthesizer previously written with ``synthesizer.save``."""
+        synthesizer_class = SynthesizerFactory._get_synthesizer_class(synthesizer_type)
+        return synthesizer_class.load(filepath)
+
+    @staticmethod
+    def _get_synthesizer_class(synthesizer_type: SynthesizerType):
+        try:
+            class_name = _SYNTHESIZER_CLASSES[SynthesizerType(synthesizer_type)]
+        except (KeyError, ValueError):
             raise ValueError(f"Unsupported synthesizer type: {synthesizer_type}")
+        return getattr(importlib.import_module("sdv.single_table"), class_name)
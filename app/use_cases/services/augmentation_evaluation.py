@@ -0,0 +1,123 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def synthetic_rows_needed(real_rows: int, augmentation_factors: list[int], tstr: bool) -> int:
+    """Size of the synthetic pool ``cross_validate_augmentation`` draws its training rows from."""
+    largest = max(augmentation_factors, default=0)
+    return real_rows * max(largest, 1 if tstr else 0)
+
+
+def cross_validate_augmentation(real: pd.DataFrame, synthetic: pd.DataFrame, target: str,
+                                augmentation_factors: list[int], folds: int, tstr: bool, n_jobs: int,
+                                seed: int = 42) -> dict:
+    """
+    Score augmentation factors with k-fold cross-validation, and synthetic data with Train-Synthetic-Test-Real.
+
+    The folds split the real rows only, stratified on ``target``, so every test fold is made of real rows the
+    forest never saw. With factor ``f``, a fold trains on its real training rows plus ``f`` times as many
+    synthetic rows (factor 0 is the real-data baseline). TSTR trains on as many synthetic rows as the real
+    training fold has, and no real row. All the factors and TSTR are scored on the same folds, and every
+    fold takes the first rows of ``synthetic``, so they differ only by what is compared.
+
+    The (factor, fold) fits are independent and run in parallel with joblib, one single-threaded forest per
+    job. The features are converted to arrays once, so joblib memory-maps them into its workers instead of
+    pickling them for every job. The synthesizer behind ``synthetic`` is fitted on all the real rows, so the
+    held-out rows still influenced the synthetic ones; the scores compare factors, they are not an unbiased
+    estimate of accuracy on unseen passengers.
+
+    Args:
+        real (pd.DataFrame): Encoded real rows.
+        synthetic (pd.DataFrame): Encoded synthetic rows, at least ``synthetic_rows_needed`` of them.
+        target (str): Column predicted by the forest.
+        augmentation_factors (list[int]): Factors compared.
+        folds (int): Number of folds.
+        tstr (bool): Whether to also score a forest trained on synthetic rows only.
+        n_jobs (int): Number of fits run at the same time.
+        seed (int): Seed of the fold split and of the forests.
+
+    Returns:
+        dict: ``{"folds": ..., "augmentation": {factor: summary}, "tstr": summary | None}``, where a summary
+        holds the mean and standard deviation of the accuracy, and the accuracy, row counts and timings of
+        every fold.
+
+    Raises:
+        ValueError: If a class of ``target`` has fewer real rows than there are folds, or ``synthetic`` is
+            too small.
+    """
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import StratifiedKFold
+
+    needed = synthetic_rows_needed(len(real), augmentation_factors, tstr)
+    if len(synthetic) < needed:
+        raise ValueError(f"Cross-validation needs {needed} synthetic rows, got {len(synthetic)}")
+    smallest_class = int(real[target].value_counts().min())
+    if smallest_class < folds:
+        raise ValueError(f"The smallest class of {target} has {smallest_class} rows, fewer than {folds} folds")
+
+    features = [column for column in real.columns if column != target]
+    X_real, y_real = real[features].to_numpy(dtype=float), real[target].to_numpy()
+    X_synthetic = synthetic[features].to_numpy(dtype=float)[:needed]
+    y_synthetic = synthetic[target].to_numpy()[:needed]
+
+    splits = list(StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed).split(X_real, y_real))
+    # One entry per (compared setting, fold): the setting's name, whether the real training rows are used,
+    # and the synthetic rows added per real training row
+    compared = [(str(factor), True, factor) for factor in augmentation_factors]
+    if tstr:
+        compared.append(("tstr", False, 1))
+    jobs = [(name, fold, use_real, factor) for name, use_real, factor in compared for fold in range(folds)]
+
+    scores = Parallel(n_jobs=min(n_jobs, len(jobs)))(
+        delayed(_score_fold)(X_real, y_real, X_synthetic, y_synthetic, *splits[fold], use_real, factor, seed)
+        for _, fold, use_real, factor in jobs
+    )
+
+    summaries: dict[str, list[dict]] = {}
+    for (name, fold, _, _), score in zip(jobs, scores):
+        summaries.setdefault(name, []).append({"fold": fold, **score})
+    return {
+        "folds": folds,
+        "real_rows": len(real),
+        "augmentation": {str(factor): _summarize(summaries[str(factor)]) for factor in augmentation_factors},
+        "tstr": _summarize(summaries["tstr"]) if tstr else None,
+    }
+
+
+def _score_fold(X_real: np.ndarray, y_real: np.ndarray, X_synthetic: np.ndarray, y_synthetic: np.ndarray,
+                train_index: np.ndarray, test_index: np.ndarray, use_real: bool, factor: int, seed: int) -> dict:
+    """Fit one forest on a fold's training rows and score it on the fold's real test rows."""
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.metrics import accuracy_score
+
+    synthetic_rows = len(train_index) * factor
+    X_parts, y_parts = [X_synthetic[:synthetic_rows]], [y_synthetic[:synthetic_rows]]
+    if use_real:
+        X_parts.insert(0, X_real[train_index])
+        y_parts.insert(0, y_real[train_index])
+
+    started = time.perf_counter()
+    model = RandomForestClassifier(random_state=seed, n_jobs=1)
+    model.fit(np.concatenate(X_parts), np.concatenate(y_parts))
+    fitted = time.perf_counter()
+    accuracy = accuracy_score(y_real[test_index], model.predict(X_real[test_index]))
+    return {
+        "accuracy": float(accuracy),
+        "real_train_rows": len(train_index) if use_real else 0,
+        "synthetic_rows": synthetic_rows,
+        "test_rows": len(test_index),
+        "fit_seconds": fitted - started,
+        "score_seconds": time.perf_counter() - fitted,
+    }
+
+
+def _summarize(folds: list[dict]) -> dict:
+    accuracies = [fold["accuracy"] for fold in folds]
+    return {
+        "mean": float(np.mean(accuracies)),
+        "std": float(np.std(accuracies, ddof=1)) if len(accuracies) > 1 else 0.0,
+        "fit_seconds": float(sum(fold["fit_seconds"] for fold in folds)),
+        "folds": folds,
+    }
@@ -0,0 +1,80 @@
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable
+
+import pandas as pd
+
+from app.entities.synthetic_data import SynthesizerType
+from app.use_cases.factories.factories import SynthesizerFactory
+
+logger = logging.getLogger(__name__)
+
+# Fitted synthesizer of a sampling worker process, loaded once by its initializer
+_synthesizer = None
+
+
+def sample_datasets(synthesizer, synthesizer_type: SynthesizerType, samples: list[dict], max_workers: int,
+                    on_sampled: Callable[[int], None] | None = None) -> list[pd.DataFrame]:
+    """
+    Draw one dataset per entry of ``samples`` from a fitted synthesizer.
+
+    Sampling advances the synthesizer's random state, so concurrent draws from one instance are neither
+    safe nor reproducible. Parallel draws run in worker processes that each load their own copy of the
+    synthesizer, saved once to a temporary file. A sample with a ``seed`` resets the random state of its
+    copy first, so the same seed always gives the same rows, whichever process draws them.
+
+    Args:
+        synthesizer: The fitted SDV synthesizer.
+        synthesizer_type (SynthesizerType): Type of the synthesizer, used to load the copies.
+        samples (list[dict]): ``{"num_rows": ..., "seed": ...}`` entries.
+        max_workers (int): Maximum number of worker processes; 1 samples in this process.
+        on_sampled (Callable | None): Called with the number of datasets drawn so far.
+
+    Returns:
+        list[pd.DataFrame]: The datasets, in the order of ``samples``.
+    """
+    on_sampled = on_sampled or (lambda done: None)
+    workers = max(1, min(max_workers, len(samples)))
+    if workers == 1:
+        datasets = []
+        for sample in samples:
+            datasets.append(_draw(synthesizer, sample["num_rows"], sample.get("seed")))
+            on_sampled(len(datasets))
+        return datasets
+
+    fd, path = tempfile.mkstemp(suffix=".pkl")
+    os.close(fd)
+    try:
+        synthesizer.save(path)
+        context = multiprocessing.get_context("spawn")
+        datasets: list[pd.DataFrame | None] = [None] * len(samples)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_load_synthesizer,
+                                 initargs=(synthesizer_type.value, path)) as executor:
+            futures = {
+                executor.submit(_sample_in_worker, sample["num_rows"], sample.get("seed")): index
+                for index, sample in enumerate(samples)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                datasets[futures[future]] = future.result()
+                on_sampled(done)
+        return datasets
+    finally:
+        os.remove(path)
+
+
+def _draw(synthesizer, num_rows: int, seed: int | None) -> pd.DataFrame:
+    if seed is not None:
+        synthesizer._set_random_state(seed)
+    return synthesizer.sample(num_rows=num_rows)
+
+
+def _load_synthesizer(synthesizer_type: str, path: str):
+    global _synthesizer
+    _synthesizer = SynthesizerFactory.load_synthesizer(SynthesizerType(synthesizer_type), path)
+
+
+def _sample_in_worker(num_rows: int, seed: int | None) -> pd.DataFrame:
+    return _draw(_synthesizer, num_rows, seed)
@@ -0,0 +1,67 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+
+def group_slices(slices: list[dict], columns) -> list[dict]:
+    """
+    Merge the slices asking for the same conditions, adding up their row quotas.
+
+    Column names are matched case-insensitively against ``columns``, the columns of the fitted data.
+
+    Args:
+        slices (list[dict]): ``{"conditions": {...}, "num_rows": ...}`` entries.
+        columns: Columns the synthesizer was fitted on.
+
+    Returns:
+        list[dict]: One ``{"conditions": {...}, "num_rows": ...}`` entry per distinct condition, in the order
+        each first appears.
+
+    Raises:
+        ValueError: If a condition is on a column the synthesizer does not know.
+    """
+    by_lower = {column.lower(): column for column in columns}
+    groups: dict[str, dict] = {}
+    for slice_ in slices:
+        conditions = {}
+        for column, value in slice_["conditions"].items():
+            if column.lower() not in by_lower:
+                raise ValueError(f"Unknown condition column: {column}")
+            conditions[by_lower[column.lower()]] = value
+        key = json.dumps(conditions, sort_keys=True, default=str)
+        group = groups.setdefault(key, {"conditions": conditions, "num_rows": 0})
+        group["num_rows"] += slice_["num_rows"]
+    return list(groups.values())
+
+
+def sample_conditions(synthesizer, groups: list[dict], known_rows: list[dict], max_tries_per_batch: int,
+                      batch_size: int) -> pd.DataFrame:
+    """
+    Sample the rows of every grouped slice, then complete the known partial rows.
+
+    All the conditions go to a single ``sample_from_conditions`` call, which samples each distinct
+    condition once instead of filtering unconditional samples.
+    """
+    from sdv.sampling import Condition
+
+    frames = []
+    if groups:
+        conditions = [Condition(column_values=group["conditions"], num_rows=group["num_rows"]) for group in groups]
+        frames.append(synthesizer.sample_from_conditions(
+            conditions=conditions, max_tries_per_batch=max_tries_per_batch, batch_size=batch_size,
+        ))
+    if known_rows:
+        frames.append(synthesizer.sample_remaining_columns(
+            known_columns=pd.DataFrame(known_rows), max_tries_per_batch=max_tries_per_batch, batch_size=batch_size,
+        ))
+    return pd.concat(frames, ignore_index=True)
+
+
+def slice_counts(data: pd.DataFrame, groups: list[dict]) -> list[dict]:
+    """Rows of ``data`` matching each grouped slice, next to the rows it asked for."""
+    counts = []
+    for group in groups:
+        mask = np.logical_and.reduce([data[column] == value for column, value in group["conditions"].items()])
+        counts.append({**group, "sampled_rows": int(mask.sum())})
+    return counts
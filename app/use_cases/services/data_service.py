@@ -1,139 +1,588 @@
 import json
 import logging
-
-from app.core.config import settings
-from app.entities.synthetic_data import SynthesizerType
-
-logger = logging.getLogger(__name__)
-
-csv_path = settings.csv
+import os
+import time
+from typing import TYPE_CHECKING, Iterator
 
 import pandas as pd
-import logging
-import os
-import joblib
+
+from app.core.config import settings
+from app.entities.evaluation import EvaluationMode, EvaluationOptions
+from app.entities.synthetic_data import SynthesizerType, SyntheticDataFormat
+from app.entities.task_status import ProgressStage
+from app.entities.training import TrainingOptions
+from app.use_cases.services.augmentation_evaluation import cross_validate_augmentation, synthetic_rows_needed
+from app.use_cases.services.batch_sampling import sample_datasets
+from app.use_cases.services.conditional_sampling import group_slices, sample_conditions, slice_counts
 from app.use_cases.services.hasher import Hasher
+from app.use_cases.services.incremental_fit import fit_state, refit_incrementally
 from app.use_cases.factories.factories import SynthesizerFactory
 from app.use_cases.evaluators.evaluators import Evaluator
-from sdv.metadata import SingleTableMetadata
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import accuracy_score
+from app.use_cases.services.dataset_registry import DatasetRegistry, DatasetVariant, PII_COLUMNS
+from app.use_cases.services.model_registry import ModelRegistry
+from app.use_cases.services.progress import EpochProgressMonitor, ProgressReporter, no_progress
+from app.use_cases.services.synthesizer_cache import SynthesizerCache
+from app.use_cases.services.synthesizer_comparison import compare_synthesizers
+from app.persistence.columnar_codec import schema_column_names
+from app.utils.single_flight import SingleFlight
+from app.utils.stage_profiler import StageProfiler, profiled
+from app.persistence.repositories.evaluation_result_repository import EvaluationResultRepository
+from app.persistence.repositories.model_repository import ModelRepository
 from app.persistence.repositories.synthetic_data_repository import SyntheticDataRepository
 
+if TYPE_CHECKING:
+    from sdv.metadata import SingleTableMetadata
 
 logger = logging.getLogger(__name__)
 
-data_anonymizer = Hasher()
+csv_path = settings.csv
 
-syntheticDataRepository = SyntheticDataRepository()
 
 class DataService:
     """Service layer for handling synthetic data operations."""
 
-    def __init__(self, factory: SynthesizerFactory, evaluator: Evaluator, csv_path: str):
+    def __init__(self, factory: SynthesizerFactory, evaluator: Evaluator, csv_path: str,
+                 synthesizer_cache: SynthesizerCache | None = None, dataset_registry: DatasetRegistry | None = None,
+                 model_registry: ModelRegistry | None = None,
+                 synthetic_data_repository: SyntheticDataRepository | None = None,
+                 evaluation_result_repository: EvaluationResultRepository | None = None):
         self.factory = factory
         self.evaluator = evaluator
         self.csv_path = csv_path
+        self.synthetic_data_repository = synthetic_data_repository or SyntheticDataRepository()
+        self.evaluation_result_repository = evaluation_result_repository or EvaluationResultRepository()
+        self._evaluations = SingleFlight()
+        self.dataset_registry = dataset_registry or DatasetRegistry(
+            self.synthetic_data_repository.get_all_data_records_from_csv,
+            Hasher(),
+            settings.dataset_cache_dir,
+        )
+        self.model_registry = model_registry or ModelRegistry(
+            ModelRepository(),
+            settings.trained_model_dir,
+            settings.trained_model_max_loaded,
+        )
+        self.synthesizer_cache = synthesizer_cache or SynthesizerCache(
+            factory,
+            settings.synthesizer_cache_dir,
+            settings.synthesizer_cache_max_bytes,
+            settings.synthesizer_cache_max_memory_entries,
+        )
+
+    def _get_fitted_synthesizer(self, synthesizer_type: SynthesizerType, data: pd.DataFrame,
+                                variant: DatasetVariant, hyperparameters: dict | None = None,
+                                progress: ProgressReporter = no_progress, profiler: StageProfiler | None = None):
+        """
+        Return a synthesizer fitted on ``data``, reusing a cached one when the source CSV is unchanged.
+
+        When rows were only appended to the source CSV since a synthesizer was cached, that synthesizer is
+        updated with the appended rows instead of being fitted from scratch (see ``refit_incrementally``).
+        """
+        profiler = profiler or StageProfiler("fit")
+
+        def fit():
+            from sdv.metadata import SingleTableMetadata
+
+            progress(ProgressStage.FIT_STARTED)
+            # Create metadata for SDV
+            with profiler.stage("detect_metadata"):
+                metadata = SingleTableMetadata()
+                metadata.detect_from_dataframe(data)
+
+            synthesizer = self.factory.get_synthesizer(synthesizer_type, metadata, **(hyperparameters or {}))
+            # ``data`` may be a read-only view of the shared dataset; fitting works on a private copy
+            with profiler.stage("fit"), EpochProgressMonitor(synthesizer, progress):
+                synthesizer.fit(data.copy())
+            progress(ProgressStage.FIT_COMPLETED)
+            return synthesizer
+
+        def refit(synthesizer, state: dict) -> dict | None:
+            progress(ProgressStage.FIT_STARTED)
+            with profiler.stage("refit"):
+                state = refit_incrementally(
+                    synthesizer, synthesizer_type, data, state,
+                    settings.incremental_refit_max_delta_ratio,
+                    settings.incremental_refit_gan_epochs,
+                    settings.incremental_refit_replay_ratio,
+                )
+            if state is not None:
+                progress(ProgressStage.FIT_COMPLETED)
+            return state
+
+        def state(synthesizer) -> dict:
+            with profiler.stage("refit_state"):
+                return fit_state(synthesizer, synthesizer_type, data, settings.incremental_refit_block_rows)
+
+        incremental = settings.incremental_refit_enabled
+        return self.synthesizer_cache.get_or_fit(self.csv_path, self.dataset_registry.variant_tag(variant),
+                                                 synthesizer_type, hyperparameters, fit,
+                                                 refit_fn=refit if incremental else None,
+                                                 state_fn=state if incremental else None)
+
+    @staticmethod
+    def _evaluation_metadata(columns) -> "SingleTableMetadata":
+        """Metadata used to evaluate synthetic data against the real data."""
+        from sdv.metadata import SingleTableMetadata
+
+        metadata = SingleTableMetadata()
+        for column in columns:
+            metadata.add_column(column, sdtype='numerical' if column in ['age', 'fare'] else 'categorical')
+        return metadata
 
-    def generate_synthetic_data(self, synthesizer_type: SynthesizerType):
+    @profiled("generate_synthetic_data")
+    def generate_synthetic_data(self, synthesizer_type: SynthesizerType, hyperparameters: dict | None = None,
+                                profiler: StageProfiler | None = None):
         """Generate synthetic data based on the specified synthesizer type."""
         logger.info(f"Starting synthetic data generation with synthesizer type: {synthesizer_type}")
 
-        # Load real data from CSV
-        data = syntheticDataRepository.get_all_data_records_from_csv(self.csv_path)
-        data.columns = data.columns.str.lower()
+        # Cleaned and anonymized real data
+        with profiler.stage("load_dataset"):
+            data = self.dataset_registry.get_view(self.csv_path, DatasetVariant.ANONYMIZED)
         original_data_ids = list(data['passengerid']) if 'passengerid' in data.columns else []
 
-        # Clean and anonymize the data
-        data = data.drop(columns=['name', 'email', 'ticket', 'cabin'], errors='ignore')
-        data = data_anonymizer.anonymize_data(data, ['name', 'email', 'ticket', 'cabin'])
-
-        # Create metadata for SDV
-        metadata = SingleTableMetadata()
-        metadata.detect_from_dataframe(data)
-
         # Generate synthetic data
-        synthesizer = self.factory.get_synthesizer(synthesizer_type, metadata)
-        synthesizer.fit(data)
-        synthetic_data = synthesizer.sample(num_rows=len(data))
+        synthesizer = self._get_fitted_synthesizer(synthesizer_type, data, DatasetVariant.ANONYMIZED, hyperparameters,
+                                                   profiler=profiler)
+        with profiler.stage("sample"), self.synthesizer_cache.sampling_lock(synthesizer):
+            synthetic_data = synthesizer.sample(num_rows=len(data))
 
         # Save the synthetic data to the database
-        synthetic_data_json = synthetic_data.to_json(orient='records')
-        synthetic_data_id = syntheticDataRepository.save_synthetic_data(synthesizer_type.value, synthetic_data_json,
-                                                json.dumps(original_data_ids))
+        with profiler.stage("save"):
+            synthetic_data_id = self.synthetic_data_repository.save_synthetic_data(
+                synthesizer_type.value, synthetic_data, json.dumps(original_data_ids)
+            ).id
 
         logger.info(f"Synthetic data generation completed with ID: {synthetic_data_id}")
         return synthetic_data_id
 
-    def evaluate_synthetic_data(self, synthetic_data_id: int):
-        """Evaluate the quality of the generated synthetic data."""
+    @profiled("generate_conditional_synthetic_data")
+    def generate_conditional_synthetic_data(self, synthesizer_type: SynthesizerType, slices: list[dict],
+                                            known_rows: list[dict] | None = None,
+                                            hyperparameters: dict | None = None, max_tries_per_batch: int = 100,
+                                            profiler: StageProfiler | None = None) -> dict:
+        """
+        Generate synthetic rows for given slices of the data, and complete given partial rows.
+
+        Rows are drawn with SDV's conditional sampling on the cached fitted synthesizer rather than by
+        filtering unconditional samples; slices with the same conditions are sampled together.
+
+        Args:
+            synthesizer_type (SynthesizerType): Type of synthesizer to use.
+            slices (list[dict]): ``{"conditions": {...}, "num_rows": ...}`` row quotas.
+            known_rows (list[dict] | None): Partial rows whose missing columns are sampled.
+            hyperparameters (dict | None): Keyword arguments passed to the synthesizer.
+            max_tries_per_batch (int): Attempts SDV makes to produce the rows of a condition.
+
+        Returns:
+            dict: ID of the stored dataset and, per distinct slice, the rows requested and sampled.
+        """
+        logger.info(f"Starting conditional generation of {len(slices)} slices with synthesizer type: {synthesizer_type}")
+
+        with profiler.stage("load_dataset"):
+            data = self.dataset_registry.get_view(self.csv_path, DatasetVariant.ANONYMIZED)
+        original_data_ids = list(data['passengerid']) if 'passengerid' in data.columns else []
+        groups = group_slices(slices, data.columns)
+        known_rows = [{column.lower(): value for column, value in row.items()} for row in known_rows or []]
+
+        synthesizer = self._get_fitted_synthesizer(synthesizer_type, data, DatasetVariant.ANONYMIZED, hyperparameters,
+                                                   profiler=profiler)
+        with profiler.stage("sample"), self.synthesizer_cache.sampling_lock(synthesizer):
+            synthetic_data = sample_conditions(synthesizer, groups, known_rows, max_tries_per_batch,
+                                               settings.stream_batch_size)
+
+        with profiler.stage("save"):
+            synthetic_data_id = self.synthetic_data_repository.save_synthetic_data(
+                synthesizer_type.value, synthetic_data, json.dumps(original_data_ids)
+            ).id
+
+        logger.info(f"Conditional generation completed with ID: {synthetic_data_id}")
+        return {
+            "id": synthetic_data_id,
+            "row_count": len(synthetic_data),
+            "slices": slice_counts(synthetic_data, groups),
+        }
+
+    @profiled("generate_synthetic_data_batch")
+    def generate_synthetic_data_batch(self, synthesizer_type: SynthesizerType, samples: list[dict],
+                                      hyperparameters: dict | None = None, progress: ProgressReporter = no_progress,
+                                      profiler: StageProfiler | None = None) -> list[int]:
+        """
+        Generate several synthetic datasets from a single fit of the synthesizer.
+
+        The datasets are sampled in parallel worker processes, each with its own seed when one is given,
+        and stored together in a single transaction.
+
+        Args:
+            synthesizer_type (SynthesizerType): Type of synthesizer to use.
+            samples (list[dict]): ``{"num_rows": ..., "seed": ...}`` entries, one per dataset.
+            hyperparameters (dict | None): Keyword arguments passed to the synthesizer.
+
+        Returns:
+            list[int]: IDs of the stored datasets, in the order of ``samples``.
+        """
+        logger.info(f"Starting batch generation of {len(samples)} datasets with synthesizer type: {synthesizer_type}")
+
+        with profiler.stage("load_dataset"):
+            data = self.dataset_registry.get_view(self.csv_path, DatasetVariant.ANONYMIZED)
+        original_data_ids = list(data['passengerid']) if 'passengerid' in data.columns else []
+
+        synthesizer = self._get_fitted_synthesizer(synthesizer_type, data, DatasetVariant.ANONYMIZED, hyperparameters,
+                                                   progress, profiler)
+        with profiler.stage("sample"):
+            datasets = sample_datasets(
+                synthesizer, synthesizer_type, samples, settings.batch_sample_max_workers,
+                lambda done: progress(ProgressStage.SAMPLING, progress=done / len(samples)),
+            )
+
+        with profiler.stage("save"):
+            synthetic_data_ids = self.synthetic_data_repository.save_synthetic_data_batch(
+                synthesizer_type.value, datasets, json.dumps(original_data_ids)
+            )
+
+        logger.info(f"Batch generation completed with IDs: {synthetic_data_ids}")
+        return synthetic_data_ids
+
+    def stream_synthetic_data(self, synthesizer_type: SynthesizerType, num_rows: int,
+                              output_format: SyntheticDataFormat, batch_size: int | None = None,
+                              hyperparameters: dict | None = None) -> Iterator[str]:
+        """
+        Sample ``num_rows`` synthetic rows in fixed-size batches and return them as an iterator of encoded chunks.
+
+        The synthesizer is resolved (and fitted on a cache miss) before the iterator is returned, so only
+        sampling happens while the response is streamed and memory stays bounded by ``batch_size``.
+        """
+        logger.info(f"Starting streaming generation of {num_rows} rows with synthesizer type: {synthesizer_type}")
+
+        data = self.dataset_registry.get_view(self.csv_path, DatasetVariant.ANONYMIZED)
+        synthesizer = self._get_fitted_synthesizer(synthesizer_type, data, DatasetVariant.ANONYMIZED, hyperparameters)
+        batch_size = min(batch_size or settings.stream_batch_size, settings.stream_max_batch_size)
+        return self._iter_sample_batches(synthesizer, num_rows, batch_size, output_format)
+
+    def _iter_sample_batches(self, synthesizer, num_rows: int, batch_size: int,
+                             output_format: SyntheticDataFormat) -> Iterator[str]:
+        for offset in range(0, num_rows, batch_size):
+            rows = min(batch_size, num_rows - offset)
+            # Held per batch only, so concurrent streams from the same synthesizer interleave
+            with self.synthesizer_cache.sampling_lock(synthesizer):
+                batch = synthesizer.sample(num_rows=rows, batch_size=rows)
+
+            if output_format == SyntheticDataFormat.csv:
+                yield batch.to_csv(index=False, header=offset == 0)
+            else:
+                chunk = batch.to_json(orient='records', lines=True)
+                yield chunk if chunk.endswith("\n") else chunk + "\n"
+
+        logger.info(f"Streaming generation completed: {num_rows} rows")
+
+    def get_synthetic_data_metadata(self, synthetic_data_id: int):
+        """Size and schema of a stored synthetic dataset, or None when it does not exist."""
+        return self.synthetic_data_repository.get_synthetic_data_metadata(synthetic_data_id)
+
+    def read_synthetic_data(self, synthetic_data_id: int, columns: list[str] | None = None,
+                            filters: list[tuple[str, str, str]] | None = None, offset: int = 0,
+                            limit: int | None = None) -> pd.DataFrame:
+        """
+        Read a page of a stored synthetic dataset.
+
+        Args:
+            synthetic_data_id (int): ID of the dataset.
+            columns (list[str] | None): Columns to return, all of them when None.
+            filters (list[tuple] | None): ``(column, operator, value)`` conditions the rows must all match.
+            offset (int): Rows to skip; with filters, matching rows to skip.
+            limit (int | None): Maximum number of rows to return.
+
+        Raises:
+            ValueError: If a column, filter operator or filter value is invalid.
+        """
+        metadata = self.synthetic_data_repository.get_synthetic_data_metadata(synthetic_data_id)
+        known_columns = [column["name"] for column in metadata.columns]
+        unknown = [column for column in (columns or []) + [f[0] for f in filters or []] if column not in known_columns]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+        if filters:
+            return self.synthetic_data_repository.get_filtered_dataframe(synthetic_data_id, filters, columns, offset,
+                                                                         limit)
+        return self.synthetic_data_repository.get_synthetic_dataframe(synthetic_data_id, columns, offset, limit)
+
+    @profiled("evaluate_synthetic_data")
+    def evaluate_synthetic_data(self, synthetic_data_id: int, options: EvaluationOptions | None = None,
+                                refresh: bool = False, profiler: StageProfiler | None = None):
+        """
+        Evaluate the quality of the generated synthetic data.
+
+        A stored synthetic dataset and a version of the real data never change, so the scores and their details
+        are stored per dataset, real data fingerprint, metric suite version and options, and later calls are
+        answered from the store. Concurrent calls for the same evaluation share one computation.
+
+        Args:
+            synthetic_data_id (int): ID of the synthetic dataset.
+            options (EvaluationOptions | None): Full report by default, or the sampled evaluation.
+            refresh (bool): Whether to recompute the scores even when they are stored.
+
+        Returns:
+            dict: The scores, with the per-column and per-pair scores under ``Details``.
+        """
+        options = options or EvaluationOptions()
+        real_data_fingerprint = (f"{self.dataset_registry.fingerprint(self.csv_path)}:"
+                                 f"{self.dataset_registry.variant_tag(DatasetVariant.ANONYMIZED)}")
+        identity = (synthetic_data_id, real_data_fingerprint, self.evaluator.suite_version(), options.result_key())
+
+        def evaluate():
+            if not refresh:
+                with profiler.stage("lookup"):
+                    stored = self.evaluation_result_repository.get_evaluation_result(*identity)
+                if stored is not None:
+                    logger.info(f"Evaluation of synthetic data {synthetic_data_id} served from the stored results")
+                    return stored
+
+            started = time.perf_counter()
+            scores = self._compute_evaluation(synthetic_data_id, options, real_data_fingerprint, profiler)
+            details = scores.pop("Details", {})
+            with profiler.stage("save"):
+                return self.evaluation_result_repository.save_evaluation_result(
+                    *identity, scores, details, time.perf_counter() - started
+                )
+
+        result = self._evaluations.do(identity, evaluate)
+        return {**result.scores, "Details": result.details}
+
+    def _compute_evaluation(self, synthetic_data_id: int, options: EvaluationOptions, real_data_key: str,
+                            profiler: StageProfiler) -> dict:
         # Retrieve synthetic data from the database
-        synthetic_data_record = syntheticDataRepository.get_synthetic_data_by_id(synthetic_data_id)
+        synthetic_data_record = self.synthetic_data_repository.get_synthetic_data_by_id(synthetic_data_id)
         if not synthetic_data_record:
             raise ValueError("Synthetic data not found")
 
-        # Load real data from CSV
-        real_data = syntheticDataRepository.get_all_data_records_from_csv(self.csv_path)
-        synthetic_data = pd.read_json(synthetic_data_record.data)
-
-        real_data.columns = real_data.columns.str.lower()
+        # Cleaned real data, and only the columns of the synthetic data that take part in the evaluation
+        with profiler.stage("load_dataset"):
+            real_data = self.dataset_registry.get_view(self.csv_path, DatasetVariant.ANONYMIZED)
+        columns = [column for column in schema_column_names(synthetic_data_record.data_schema)
+                   if column.lower() not in PII_COLUMNS]
+        sampled = options.mode == EvaluationMode.SAMPLED
+        # Synthetic rows are independent draws, so the first max_rows of them are already a random sample
+        with profiler.stage("load_synthetic_data"):
+            synthetic_data = self.synthetic_data_repository.get_synthetic_dataframe(
+                synthetic_data_id, columns=columns, limit=options.max_rows if sampled else None
+            )
         synthetic_data.columns = synthetic_data.columns.str.lower()
 
-        # Clean data
-        real_data = real_data.drop(columns=['name', 'email', 'ticket', 'cabin'], errors='ignore')
-        synthetic_data = synthetic_data.drop(columns=['name', 'email', 'ticket', 'cabin'], errors='ignore')
-
         # Create metadata for evaluation
-        metadata = SingleTableMetadata()
-        for column in real_data.columns:
-            metadata.add_column(column, sdtype='numerical' if column in ['age', 'fare'] else 'categorical')
+        metadata = self._evaluation_metadata(real_data.columns)
 
         # Perform evaluation
-        scores = self.evaluator.evaluate_data_quality(synthetic_data, real_data, metadata)
+        with profiler.stage("evaluate"):
+            scores = self.evaluator.evaluate_data_quality(synthetic_data, real_data, metadata, options, real_data_key)
         return scores
 
-    def augment_and_train(self, synthesizer_type: SynthesizerType, augmentation_factor: int):
-        """Augment data and train a machine learning model."""
+    @profiled("compare_synthesizers")
+    def compare_synthesizers(self, candidates: list[dict], progress: ProgressReporter = no_progress,
+                             profiler: StageProfiler | None = None) -> dict:
+        """
+        Fit, sample and evaluate several synthesizer configurations in parallel on the same data.
+
+        The CSV is loaded and preprocessed once, then shared with the worker processes.
+
+        Returns:
+            dict: The ranked leaderboard and the timings of the shared stages.
+        """
+        logger.info(f"Starting comparison of {len(candidates)} synthesizer configurations")
+
+        with profiler.stage("load_and_preprocess"):
+            data = self.dataset_registry.get_view(self.csv_path, DatasetVariant.ANONYMIZED)
+
+        progress(ProgressStage.FIT_STARTED, message=f"{len(candidates)} candidates")
+        with profiler.stage("candidates"):
+            leaderboard = compare_synthesizers(data, self._evaluation_metadata(data.columns), candidates,
+                                               self.csv_path,
+                                               self.dataset_registry.variant_tag(DatasetVariant.ANONYMIZED),
+                                               settings.compare_max_workers)
+        progress(ProgressStage.EVALUATING, progress=1.0)
+
+        timings = {name: timing["wall_seconds"] for name, timing in profiler.timings().items()}
+        logger.info(f"Synthesizer comparison completed, best: {leaderboard[0]['synthesizer_type']}")
+        return {"leaderboard": leaderboard, "timings": timings}
+
+    @profiled("augment_and_train")
+    def augment_and_train(self, synthesizer_type: SynthesizerType, augmentation_factor: int,
+                          hyperparameters: dict | None = None, task_id: int | None = None,
+                          training_options: TrainingOptions | None = None, progress: ProgressReporter = no_progress,
+                          profiler: StageProfiler | None = None):
+        """Augment data and train a machine learning model, registered under ``task_id`` when given."""
         logger.info(
             f"Starting data augmentation and training with synthesizer type: {synthesizer_type}, augmentation factor: {augmentation_factor}")
-
-        # Load real data from CSV
-        data = syntheticDataRepository.get_all_data_records_from_csv(self.csv_path)
-        data.columns = data.columns.str.lower()
-        data = data.drop(columns=['name', 'email', 'ticket', 'cabin'], errors='ignore')
-
-        # One-hot encode categorical variables
-        data = pd.get_dummies(data, columns=['sex', 'embarked', 'pclass'], drop_first=True)
-
-        # Create metadata
-        metadata = SingleTableMetadata()
-        metadata.detect_from_dataframe(data)
-
-        # Generate synthetic data
-        synthesizer = self.factory.get_synthesizer(synthesizer_type, metadata)
-        synthesizer.fit(data)
-        synthetic_data = synthesizer.sample(num_rows=len(data) * augmentation_factor)
-
-        # Combine original and synthetic data
-        augmented_data = pd.concat([data, synthetic_data], ignore_index=True)
-        X = augmented_data.drop(columns=['survived'])  # Features
-        y = augmented_data['survived']  # Target
-
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-
-        # Train RandomForest model
-        model = RandomForestClassifier(random_state=42)
-        model.fit(X_train, y_train)
-
-        # Save and evaluate the model
-        model_path = os.path.join(os.getcwd(), "model.joblib")
-        joblib.dump(model, model_path)
-        y_pred = model.predict(X_test)
-        accuracy = accuracy_score(y_test, y_pred)
+        options = training_options or TrainingOptions()
+        n_jobs = self._resolve_n_jobs(options.n_jobs)
+
+        # Cleaned real data with one-hot encoded categorical variables
+        with profiler.stage("load_dataset"):
+            data = self.dataset_registry.get_view(self.csv_path, DatasetVariant.ENCODED)
+
+        synthesizer = self._get_fitted_synthesizer(synthesizer_type, data, DatasetVariant.ENCODED, hyperparameters,
+                                                   progress, profiler)
+        if options.warm_start:
+            model, accuracy = self._train_incrementally(synthesizer, data, augmentation_factor, options, n_jobs,
+                                                        progress, profiler)
+        else:
+            model, accuracy = self._train_on_augmented(synthesizer, data, augmentation_factor, n_jobs, progress,
+                                                       profiler)
+
+        if task_id is not None:
+            features = [column for column in data.columns if column != 'survived']
+            with profiler.stage("save_model"):
+                self.model_registry.register(task_id, model, features, accuracy, synthesizer_type.value,
+                                             augmentation_factor)
 
         logger.info(f"Model training completed successfully with accuracy: {accuracy}")
         return accuracy
 
+    @profiled("cross_validate_augmentation")
+    def cross_validate_augmentation(self, synthesizer_type: SynthesizerType, augmentation_factor: int,
+                                    hyperparameters: dict | None = None,
+                                    training_options: TrainingOptions | None = None,
+                                    progress: ProgressReporter = no_progress,
+                                    profiler: StageProfiler | None = None) -> dict | None:
+        """
+        Cross-validate augmentation with the synthesizer used by ``augment_and_train``.
+
+        Args:
+            synthesizer_type (SynthesizerType): Type of synthesizer to use.
+            augmentation_factor (int): Factor of the trained model, compared with no augmentation unless
+                ``training_options.cv_augmentation_factors`` is set.
+            hyperparameters (dict | None): Hyperparameters of the synthesizer.
+            training_options (TrainingOptions | None): Folds, factors, TSTR and parallelism of the evaluation.
+            progress (ProgressReporter): Receives the sampling and evaluation progress.
+            profiler (StageProfiler | None): Records the stage timings.
+
+        Returns:
+            dict | None: The scores of ``cross_validate_augmentation``, or None when ``cv_folds`` is unset.
+        """
+        options = training_options or TrainingOptions()
+        if options.cv_folds is None:
+            return None
+        factors = options.cv_augmentation_factors or sorted({0, augmentation_factor})
+
+        with profiler.stage("load_dataset"):
+            data = self.dataset_registry.get_view(self.csv_path, DatasetVariant.ENCODED)
+        synthesizer = self._get_fitted_synthesizer(synthesizer_type, data, DatasetVariant.ENCODED, hyperparameters,
+                                                   progress, profiler)
+        num_rows = synthetic_rows_needed(len(data), factors, options.tstr)
+        with profiler.stage("sample"):
+            synthetic_data = (self._sample_with_progress(synthesizer, num_rows, settings.stream_batch_size, progress)
+                              if num_rows else data.iloc[:0])
+
+        progress(ProgressStage.EVALUATING)
+        with profiler.stage("cross_validate"):
+            scores = cross_validate_augmentation(data, synthetic_data, 'survived', factors, options.cv_folds,
+                                                 options.tstr, self._resolve_n_jobs(options.n_jobs))
+        summary = ", ".join(f"x{factor} {scores['augmentation'][str(factor)]['mean']:.4f}" for factor in factors)
+        logger.info(f"Cross-validated accuracy over {options.cv_folds} folds: {summary}")
+        return scores
+
+    @staticmethod
+    def _resolve_n_jobs(requested: int | None) -> int:
+        """Number of cores the forest may use: the request, capped at this worker's share of the CPUs."""
+        budget = settings.training_cpu_budget
+        if budget is None:
+            cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+            budget = max(1, cpus // settings.worker_concurrency)
+        return min(requested, budget) if requested else budget
+
+    @staticmethod
+    def _sample_with_progress(synthesizer, num_rows: int, batch_size: int,
+                              progress: ProgressReporter) -> pd.DataFrame:
+        """Sample ``num_rows`` rows in batches of ``batch_size``, reporting the share sampled after each batch."""
+        batches = []
+        for offset in range(0, num_rows, batch_size):
+            batches.append(synthesizer.sample(num_rows=min(batch_size, num_rows - offset)))
+            progress(ProgressStage.SAMPLING, progress=min(offset + batch_size, num_rows) / num_rows)
+        return pd.concat(batches, ignore_index=True)
+
+    @classmethod
+    def _train_on_augmented(cls, synthesizer, data: pd.DataFrame, augmentation_factor: int, n_jobs: int,
+                            progress: ProgressReporter = no_progress, profiler: StageProfiler | None = None):
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.metrics import accuracy_score
+        from sklearn.model_selection import train_test_split
+
+        profiler = profiler or StageProfiler("augment_and_train")
+        # Hold out real rows only, so that no synthetic row is scored
+        real_train, holdout = train_test_split(data, test_size=0.2, random_state=42)
+        X_test, y_test = holdout.drop(columns=['survived']), holdout['survived']
+
+        # Generate synthetic data, in streaming-sized batches so the sampling progress can be reported
+        with profiler.stage("sample"):
+            synthetic_data = cls._sample_with_progress(synthesizer, len(data) * augmentation_factor,
+                                                       settings.stream_batch_size, progress)
+
+        # Combine the real training rows and synthetic data
+        with profiler.stage("concat"):
+            augmented_data = pd.concat([real_train, synthetic_data], ignore_index=True)
+            X_train = augmented_data.drop(columns=['survived'])  # Features
+            y_train = augmented_data['survived']  # Target
 
+        # Train RandomForest model
+        progress(ProgressStage.TRAINING)
+        with profiler.stage("train"):
+            model = RandomForestClassifier(random_state=42, n_jobs=n_jobs)
+            model.fit(X_train, y_train)
+
+        progress(ProgressStage.EVALUATING)
+        with profiler.stage("evaluate"):
+            y_pred = model.predict(X_test)
+            accuracy = accuracy_score(y_test, y_pred)
+        return model, accuracy
+
+    @staticmethod
+    def _train_incrementally(synthesizer, data: pd.DataFrame, augmentation_factor: int, options: TrainingOptions,
+                             n_jobs: int, progress: ProgressReporter = no_progress,
+                             profiler: StageProfiler | None = None):
+        """
+        Grow a warm-started forest batch by batch as synthetic rows are sampled.
+
+        Each batch adds ``trees_per_batch`` trees trained on the real training rows plus that batch only, so
+        memory is bounded by the batch size rather than by the augmentation factor. Accuracy is measured on
+        a holdout of real rows after every batch.
+        """
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.metrics import accuracy_score
+        from sklearn.model_selection import train_test_split
+
+        profiler = profiler or StageProfiler("augment_and_train")
+        real_train, holdout = train_test_split(data, test_size=0.2, random_state=42)
+        X_holdout, y_holdout = holdout.drop(columns=['survived']), holdout['survived']
+
+        with profiler.stage("train"):
+            model = RandomForestClassifier(n_estimators=options.trees_per_batch, warm_start=True, random_state=42,
+                                           n_jobs=n_jobs)
+            model.fit(real_train.drop(columns=['survived']), real_train['survived'])
+        with profiler.stage("evaluate"):
+            accuracy = best_accuracy = accuracy_score(y_holdout, model.predict(X_holdout))
+
+        total_rows = len(data) * augmentation_factor
+        batch_size = options.batch_size or len(data)
+        batches_without_improvement = 0
+        for offset in range(0, total_rows, batch_size):
+            with profiler.stage("sample"):
+                batch = synthesizer.sample(num_rows=min(batch_size, total_rows - offset))
+            progress(ProgressStage.TRAINING, progress=(offset + len(batch)) / total_rows)
+            with profiler.stage("concat"):
+                batch_data = pd.concat([real_train, batch], ignore_index=True)
+
+            with profiler.stage("train"):
+                model.n_estimators += options.trees_per_batch
+                model.fit(batch_data.drop(columns=['survived']), batch_data['survived'])
+            with profiler.stage("evaluate"):
+                accuracy = accuracy_score(y_holdout, model.predict(X_holdout))
+            logger.info(f"Augmentation batch at row {offset}: {model.n_estimators} trees, holdout accuracy {accuracy}")
+
+            if accuracy - best_accuracy > options.tolerance:
+                best_accuracy = accuracy
+                batches_without_improvement = 0
+            else:
+                batches_without_improvement += 1
+            if options.early_stopping and batches_without_improvement >= options.patience:
+                logger.info(f"Holdout accuracy levelled off, stopping after {offset + len(batch)} synthetic rows")
+                break
+
+        return model, accuracy
@@ -0,0 +1,128 @@
+import enum
+import glob
+import logging
+import os
+import tempfile
+import threading
+from typing import Callable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from app.use_cases.services.hasher import Hasher
+from app.utils.fingerprint import file_fingerprint, source_id
+
+logger = logging.getLogger(__name__)
+
+PII_COLUMNS = ['name', 'email', 'ticket', 'cabin']
+CATEGORICAL_COLUMNS = ['sex', 'embarked', 'pclass']
+
+
+class DatasetVariant(str, enum.Enum):
+    RAW = "raw"
+    ANONYMIZED = "anonymized"
+    ENCODED = "encoded"
+
+
+class DatasetRegistry:
+    """
+    Loads each source CSV once and caches its preprocessing variants as immutable Arrow tables.
+
+    Every variant is written to an uncompressed, single-chunk Feather file under ``cache_dir`` and
+    memory-mapped. Read-only consumers use ``get_view``, whose numeric columns without missing values
+    are zero-copy views of the mapped pages, shared by all processes on the host; string columns and
+    columns with missing values are still materialized by each process. Callers that modify the data
+    use ``get_frame`` for a private copy. Entries are keyed by the source's content hash and rebuilt
+    when the file changes.
+
+    Methods:
+        get_table(csv_path, variant): Returns the memory-mapped, immutable table of a variant.
+        get_view(csv_path, variant): Returns a read-only DataFrame backed by the mapped table where possible.
+        get_frame(csv_path, variant): Returns a private, writable DataFrame copy of a variant.
+        fingerprint(csv_path): Returns the content hash the cached variants are keyed by.
+        variant_tag(variant): Returns the name of a variant including the settings it is built with.
+    """
+
+    def __init__(self, loader: Callable[[str], pd.DataFrame], anonymizer: Hasher, cache_dir: str):
+        self.loader = loader
+        self.anonymizer = anonymizer
+        self.cache_dir = cache_dir
+        self._tables: dict[tuple[str, DatasetVariant], tuple[str, pa.Table]] = {}
+        # Re-entrant, since derived variants are built from the raw one
+        self._lock = threading.RLock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(csv_path: str) -> str:
+        return file_fingerprint(csv_path)
+
+    def variant_tag(self, variant: DatasetVariant) -> str:
+        variant = DatasetVariant(variant)
+        if variant == DatasetVariant.ANONYMIZED:
+            # Changing the anonymization key changes the data, so it must not reuse the previous cache entries
+            return f"{variant.value}_{self.anonymizer.config_id}"
+        return variant.value
+
+    def get_view(self, csv_path: str, variant: DatasetVariant) -> pd.DataFrame:
+        # split_blocks keeps one block per column, so eligible columns are not copied into a consolidated block
+        return self.get_table(csv_path, variant).to_pandas(split_blocks=True)
+
+    def get_frame(self, csv_path: str, variant: DatasetVariant) -> pd.DataFrame:
+        return self.get_table(csv_path, variant).to_pandas()
+
+    def get_table(self, csv_path: str, variant: DatasetVariant) -> pa.Table:
+        variant = DatasetVariant(variant)
+        source = source_id(csv_path)
+        fingerprint = self.fingerprint(csv_path)
+        key = (source, variant)
+
+        with self._lock:
+            cached = self._tables.get(key)
+            if cached and cached[0] == fingerprint:
+                return cached[1]
+
+            path = os.path.join(self.cache_dir, f"{source}-{fingerprint[:16]}-{self.variant_tag(variant)}.feather")
+            if not os.path.exists(path):
+                self._purge_stale(source, variant, path)
+                logger.info(f"Building dataset variant {variant.value} of {csv_path}")
+                self._write(path, self._build(csv_path, variant))
+
+            table = feather.read_table(path, memory_map=True)
+            self._tables[key] = (fingerprint, table)
+            return table
+
+    def _build(self, csv_path: str, variant: DatasetVariant) -> pd.DataFrame:
+        if variant == DatasetVariant.RAW:
+            data = self.loader(csv_path)
+            data.columns = data.columns.str.lower()
+            return data
+
+        data = self.get_frame(csv_path, DatasetVariant.RAW)
+        data = data.drop(columns=PII_COLUMNS, errors='ignore')
+        if variant == DatasetVariant.ANONYMIZED:
+            return self.anonymizer.anonymize_data(data, PII_COLUMNS)
+        # One-hot encode categorical variables
+        return pd.get_dummies(data, columns=CATEGORICAL_COLUMNS, drop_first=True)
+
+    def _write(self, path: str, data: pd.DataFrame):
+        # Write to a temporary file first so other processes never map a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            # A single record batch, so every column is one contiguous buffer that can be viewed without a copy
+            feather.write_feather(data, tmp_path, compression="uncompressed", chunksize=max(len(data), 1))
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _purge_stale(self, source: str, variant: DatasetVariant, current_path: str):
+        for path in glob.glob(os.path.join(self.cache_dir, f"{source}-*-{variant.value}*.feather")):
+            if path != current_path:
+                logger.info(f"Source data or settings changed, removing cached dataset variant: {os.path.basename(path)}")
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
@@ -1,19 +1,75 @@
 import hashlib
+import hmac
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
+import numpy as np
 import pandas as pd
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
+def _hash_strings(values: list[str], key: bytes | None) -> list[str]:
+    if key is None:
+        return [hashlib.sha256(value.encode()).hexdigest() for value in values]
+    return [hmac.new(key, value.encode(), hashlib.sha256).hexdigest() for value in values]
+
+
 class Hasher:
+    """
+    Batched column anonymizer.
+
+    Each distinct value of a column is hashed only once (``pd.factorize``) and the digests are mapped
+    back onto the rows. With a ``key``, values are hashed with HMAC-SHA256 so the digests cannot be
+    reversed with a dictionary of candidate values. Columns with many distinct values are hashed
+    in parallel chunks.
+    """
+
+    def __init__(self, key: str | None = None, max_workers: int | None = None, parallel_threshold: int | None = None,
+                 executor: str | None = None):
+        key = key if key is not None else settings.anonymization_key
+        self.key = key.encode() if key else None
+        self.max_workers = max_workers or settings.anonymization_max_workers
+        self.parallel_threshold = parallel_threshold or settings.anonymization_parallel_threshold
+        self.executor = executor or settings.anonymization_executor
+
+    @property
+    def config_id(self) -> str:
+        """Identifies the digests this hasher produces, without revealing its key."""
+        if self.key is None:
+            return "sha256"
+        return "hmac-" + hmac.new(self.key, b"config-id", hashlib.sha256).hexdigest()[:12]
+
     def anonymize_data(self, data: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
         logger.info(f"Anonymizing data for columns: {columns}")
         try:
             for column in columns:
                 if column in data.columns:
-                    data[column] = data[column].apply(lambda x: hashlib.sha256(str(x).encode()).hexdigest())
+                    data[column] = self.hash_series(data[column])
             logger.info("Data anonymization completed successfully.")
             return data
         except Exception as e:
             logger.error(f"Error during data anonymization: {e}")
             raise
+
+    def hash_series(self, series: pd.Series) -> pd.Series:
+        # Factorize the string form of the cells, since values that compare equal may print differently
+        # (1 and 1.0, None and NaN, 0.0 and -0.0) and each must keep the digest of its own str()
+        keys = series.map(str) if series.dtype == object else series.astype(str)
+        codes, uniques = pd.factorize(keys, use_na_sentinel=False)
+        digests = np.asarray(self._hash_values(list(uniques)), dtype=object)
+        return pd.Series(digests.take(codes), index=series.index, name=series.name)
+
+    def _hash_values(self, values: list[str]) -> list[str]:
+        if len(values) < self.parallel_threshold or self.max_workers <= 1:
+            return _hash_strings(values, self.key)
+
+        chunk_size = -(-len(values) // self.max_workers)
+        chunks = [values[start:start + chunk_size] for start in range(0, len(values), chunk_size)]
+        pool_class = ProcessPoolExecutor if self.executor == "process" else ThreadPoolExecutor
+        with pool_class(max_workers=self.max_workers) as pool:
+            results = pool.map(_hash_strings, chunks, repeat(self.key))
+            return [digest for chunk in results for digest in chunk]
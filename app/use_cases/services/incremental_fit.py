@@ -0,0 +1,338 @@
+import logging
+import math
+import sys
+
+import numpy as np
+import pandas as pd
+
+from app.entities.synthetic_data import SynthesizerType
+from app.utils.fingerprint import row_block_hashes
+
+logger = logging.getLogger(__name__)
+
+# CDF values are clipped away from 0 and 1 before computing normal scores, as copulas does
+_EPSILON = np.finfo(np.float32).eps
+
+GAN_SYNTHESIZERS = {SynthesizerType.ctgan, SynthesizerType.copulagan}
+
+
+def fit_state(synthesizer, synthesizer_type: SynthesizerType, data: pd.DataFrame, block_rows: int) -> dict:
+    """
+    State saved with a synthesizer fitted from scratch on ``data``, from which it can be updated incrementally.
+
+    It records the hashes of the row blocks of ``data``, to later tell whether a new version of the data only
+    appends rows to it. For a Gaussian copula, it also holds the sufficient statistics of the marginals (count,
+    mean, sum of squared deviations, min and max of every column) and of the normal scores the correlation
+    matrix is estimated from (count, sums and cross products).
+
+    Args:
+        synthesizer: The fitted SDV synthesizer.
+        synthesizer_type (SynthesizerType): Type of the synthesizer.
+        data (pd.DataFrame): The data it was fitted on.
+        block_rows (int): Number of rows per hashed block.
+
+    Returns:
+        dict: A JSON-serializable state.
+    """
+    state = {"lineage": _lineage(data, block_rows), "base_rows": len(data), "incremental_rows": 0}
+    if SynthesizerType(synthesizer_type) == SynthesizerType.gaussiancopula:
+        model = synthesizer._model
+        processed = synthesizer._data_processor.transform(data.copy())[model.columns]
+        state["copula"] = {
+            "moments": _moments(processed),
+            "scores": _score_statistics(_normal_scores(model, processed)),
+        }
+    return state
+
+
+def appended_rows(lineage: dict, data: pd.DataFrame) -> pd.DataFrame | None:
+    """
+    The rows of ``data`` appended after those ``lineage`` was recorded from.
+
+    Returns:
+        pd.DataFrame | None: The appended rows, possibly none, or None when ``data`` does not start with the
+        recorded rows: a row was modified, removed or reordered, or the columns changed.
+    """
+    if _schema(data) != lineage["schema"] or len(data) < lineage["rows"]:
+        return None
+    if row_block_hashes(data.iloc[:lineage["rows"]], lineage["block_rows"]) != lineage["block_hashes"]:
+        return None
+    return data.iloc[lineage["rows"]:]
+
+
+def refit_incrementally(synthesizer, synthesizer_type: SynthesizerType, data: pd.DataFrame, state: dict,
+                        max_delta_ratio: float, gan_epochs: int, replay_ratio: float) -> dict | None:
+    """
+    Update, in place, a synthesizer fitted on an earlier version of ``data`` with the rows appended since.
+
+    A Gaussian copula is updated from its sufficient statistics: the marginals are re-estimated by the method
+    of moments on the pooled moments, and the correlation matrix from the pooled normal scores, the appended
+    rows being scored with the updated marginals. A CTGAN or CopulaGAN generator is fine-tuned for
+    ``gan_epochs`` epochs on the appended rows, mixed with ``replay_ratio`` times as many earlier rows so it
+    does not forget them. Either way, the work is proportional to the appended rows.
+
+    The updates approximate a fit from scratch, so once more than ``max_delta_ratio`` times the rows of the
+    last full fit have been added incrementally, the synthesizer is fitted from scratch again.
+
+    Args:
+        synthesizer: The synthesizer to update; must not be shared with other threads.
+        synthesizer_type (SynthesizerType): Type of the synthesizer.
+        data (pd.DataFrame): The new version of the data.
+        state (dict): The state saved with the synthesizer (see ``fit_state``).
+        max_delta_ratio (float): Maximum rows added incrementally since the last full fit, relative to its rows.
+        gan_epochs (int): Fine-tuning epochs of the GAN synthesizers.
+        replay_ratio (float): Earlier rows replayed per appended row when fine-tuning a GAN.
+
+    Returns:
+        dict | None: The state to save with the updated synthesizer, or None when it must be fitted from scratch.
+    """
+    synthesizer_type = SynthesizerType(synthesizer_type)
+    delta = appended_rows(state["lineage"], data)
+    if delta is None:
+        logger.info("Source rows were modified, not only appended: fitting from scratch")
+        return None
+
+    incremental_rows = state["incremental_rows"] + len(delta)
+    if incremental_rows > max_delta_ratio * state["base_rows"]:
+        logger.info(f"{incremental_rows} rows appended since the last full fit on {state['base_rows']} rows: "
+                    f"fitting from scratch")
+        return None
+
+    updated_state = {**state, "lineage": _extend_lineage(state["lineage"], data), "incremental_rows": incremental_rows}
+    if delta.empty:
+        return updated_state
+
+    logger.info(f"Updating {synthesizer_type.value} synthesizer with {len(delta)} appended rows")
+    if synthesizer_type == SynthesizerType.gaussiancopula:
+        copula = _update_copula(synthesizer, synthesizer._data_processor.transform(delta.copy()), state["copula"],
+                                len(data))
+        if copula is None:
+            return None
+        updated_state["copula"] = copula
+    elif synthesizer_type in GAN_SYNTHESIZERS:
+        previous_rows = state["lineage"]["rows"]
+        replay = data.iloc[:previous_rows].sample(n=min(previous_rows, int(len(delta) * replay_ratio)),
+                                                  random_state=len(data))
+        _fine_tune_gan(synthesizer, synthesizer_type, pd.concat([delta, replay], ignore_index=True), gan_epochs)
+    else:
+        return None
+    return updated_state
+
+
+def _schema(data: pd.DataFrame) -> list[list[str]]:
+    return [[str(column), str(dtype)] for column, dtype in data.dtypes.items()]
+
+
+def _lineage(data: pd.DataFrame, block_rows: int) -> dict:
+    return {"schema": _schema(data), "rows": len(data), "block_rows": block_rows,
+            "block_hashes": row_block_hashes(data, block_rows)}
+
+
+def _extend_lineage(lineage: dict, data: pd.DataFrame) -> dict:
+    # The complete blocks of the previous rows are unchanged; only the last, partial one and the new rows are hashed
+    block_rows = lineage["block_rows"]
+    complete_blocks = lineage["rows"] // block_rows
+    hashes = lineage["block_hashes"][:complete_blocks] + row_block_hashes(data.iloc[complete_blocks * block_rows:],
+                                                                          block_rows)
+    return {**lineage, "rows": len(data), "block_hashes": hashes}
+
+
+def _moments(processed: pd.DataFrame) -> dict:
+    values = processed.to_numpy(dtype=float)
+    count = np.sum(~np.isnan(values), axis=0)
+    mean = np.nanmean(values, axis=0)
+    return {
+        "count": count.tolist(),
+        "mean": mean.tolist(),
+        "m2": np.nansum((values - mean) ** 2, axis=0).tolist(),
+        "min": np.nanmin(values, axis=0).tolist(),
+        "max": np.nanmax(values, axis=0).tolist(),
+    }
+
+
+def _merge_moments(left: dict, right: dict) -> dict:
+    # Chan et al.'s pairwise update of the mean and the sum of squared deviations
+    left = {name: np.asarray(values, dtype=float) for name, values in left.items()}
+    right = {name: np.asarray(values, dtype=float) for name, values in right.items()}
+    count = left["count"] + right["count"]
+    difference = right["mean"] - left["mean"]
+    return {
+        "count": count.tolist(),
+        "mean": (left["mean"] + difference * right["count"] / count).tolist(),
+        "m2": (left["m2"] + right["m2"] + difference ** 2 * left["count"] * right["count"] / count).tolist(),
+        "min": np.fmin(left["min"], right["min"]).tolist(),
+        "max": np.fmax(left["max"], right["max"]).tolist(),
+    }
+
+
+def _moment_parameters(univariate: dict, count: float, mean: float, m2: float, low: float,
+                       high: float) -> dict | None:
+    """Parameters of a copulas univariate matching the given moments, or None for other distributions."""
+    std = math.sqrt(m2 / count) if count else 0.0
+    if std == 0 or high <= low:
+        return None
+
+    kind = univariate["type"].rsplit(".", 1)[-1]
+    if kind == "GaussianUnivariate":
+        parameters = {"loc": mean, "scale": std}
+    elif kind == "UniformUnivariate":
+        parameters = {"loc": low, "scale": high - low}
+    elif kind == "TruncatedGaussian":
+        parameters = {"loc": mean, "scale": std, "a": (low - mean) / std, "b": (high - mean) / std}
+    elif kind == "BetaUnivariate":
+        scale = high - low
+        scaled_mean, scaled_variance = (mean - low) / scale, (std / scale) ** 2
+        common = scaled_mean * (1 - scaled_mean) / scaled_variance - 1
+        if common <= 0:
+            return None
+        parameters = {"a": scaled_mean * common, "b": (1 - scaled_mean) * common, "loc": low, "scale": scale}
+    elif kind == "GammaUnivariate":
+        loc = min(univariate["loc"], low)
+        if mean <= loc:
+            return None
+        parameters = {"a": ((mean - loc) / std) ** 2, "loc": loc, "scale": std ** 2 / (mean - loc)}
+    else:
+        return None
+    return {**univariate, **{name: float(value) for name, value in parameters.items()}}
+
+
+def _normal_scores(model, processed: pd.DataFrame) -> np.ndarray:
+    from scipy import stats
+
+    scores = np.column_stack([
+        stats.norm.ppf(np.clip(univariate.cdf(processed[column].to_numpy(dtype=float)), _EPSILON, 1 - _EPSILON))
+        for column, univariate in zip(model.columns, model.univariates)
+    ])
+    return scores[~np.isnan(scores).any(axis=1)]
+
+
+def _score_statistics(scores: np.ndarray) -> dict:
+    return {"count": len(scores), "sum": scores.sum(axis=0).tolist(), "cross": (scores.T @ scores).tolist()}
+
+
+def _merge_score_statistics(left: dict, right: dict) -> dict:
+    return {
+        "count": left["count"] + right["count"],
+        "sum": (np.asarray(left["sum"]) + np.asarray(right["sum"])).tolist(),
+        "cross": (np.asarray(left["cross"]) + np.asarray(right["cross"])).tolist(),
+    }
+
+
+def _correlation(scores: dict) -> np.ndarray:
+    """Correlation matrix of the normal scores, regularized like copulas' ``GaussianMultivariate``."""
+    mean = np.asarray(scores["sum"]) / scores["count"]
+    covariance = np.asarray(scores["cross"]) / scores["count"] - np.outer(mean, mean)
+    std = np.sqrt(np.clip(np.diag(covariance), 0, None))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlation = np.nan_to_num(covariance / np.outer(std, std), nan=0.0, posinf=0.0, neginf=0.0)
+    correlation = np.clip(correlation, -1.0, 1.0)
+    np.fill_diagonal(correlation, 1.0)
+    if np.linalg.cond(correlation) > 1.0 / sys.float_info.epsilon:
+        correlation = correlation + np.identity(correlation.shape[0]) * _EPSILON
+    return correlation
+
+
+def _update_copula(synthesizer, processed_delta: pd.DataFrame, statistics: dict, num_rows: int) -> dict | None:
+    from copulas.multivariate import GaussianMultivariate
+
+    model = synthesizer._model
+    processed_delta = processed_delta[model.columns]
+    moments = _merge_moments(statistics["moments"], _moments(processed_delta))
+
+    params = model.to_dict()
+    univariates = []
+    for index, univariate in enumerate(params["univariates"]):
+        updated = _moment_parameters(univariate, *(moments[name][index] for name in ("count", "mean", "m2", "min",
+                                                                                     "max")))
+        if updated is None:
+            logger.info(f"Marginal {univariate['type']} of column {model.columns[index]} cannot be updated "
+                        f"from its moments: fitting from scratch")
+            return None
+        univariates.append(updated)
+
+    # The appended rows are scored with the updated marginals; the earlier rows keep the scores they had
+    marginals = GaussianMultivariate.from_dict({**params, "univariates": univariates})
+    scores = _merge_score_statistics(statistics["scores"],
+                                     _score_statistics(_normal_scores(marginals, processed_delta)))
+    synthesizer._model = GaussianMultivariate.from_dict(
+        {**params, "univariates": univariates, "correlation": _correlation(scores).tolist()}
+    )
+    if hasattr(synthesizer, "_num_rows"):
+        synthesizer._num_rows = num_rows
+    return {"moments": moments, "scores": scores}
+
+
+def _fine_tune_gan(synthesizer, synthesizer_type: SynthesizerType, rows: pd.DataFrame, epochs: int):
+    """
+    Resume the adversarial training of a fitted CTGAN or CopulaGAN on ``rows``.
+
+    The generator and the data transformer are the fitted ones; the discriminator, which ctgan does not keep
+    after fitting, starts afresh. The loop is ctgan's own. The conditional sampler used at sampling time is
+    left as fitted, so the category frequencies are those of the last full fit.
+    """
+    import torch
+    from ctgan.data_sampler import DataSampler
+    from ctgan.synthesizers.ctgan import Discriminator
+
+    model = synthesizer._model
+    processed = synthesizer._data_processor.transform(rows)
+    if synthesizer_type == SynthesizerType.copulagan:
+        processed = synthesizer._gaussian_normalizer_hyper_transformer.transform(processed)
+    train_data = model._transformer.transform(processed)
+    data_sampler = DataSampler(train_data, model._transformer.output_info_list, model._log_frequency)
+
+    generator = model._generator
+    generator.train()
+    discriminator = Discriminator(model._transformer.output_dimensions + data_sampler.dim_cond_vec(),
+                                  model._discriminator_dim, pac=model.pac).to(model._device)
+    optimizer_g = torch.optim.Adam(generator.parameters(), lr=model._generator_lr, betas=(0.5, 0.9),
+                                   weight_decay=model._generator_decay)
+    optimizer_d = torch.optim.Adam(discriminator.parameters(), lr=model._discriminator_lr, betas=(0.5, 0.9),
+                                   weight_decay=model._discriminator_decay)
+
+    batch_size = model._batch_size
+    mean = torch.zeros(batch_size, model._embedding_dim, device=model._device)
+    std = mean + 1
+    steps_per_epoch = max(len(train_data) // batch_size, 1)
+
+    def generate():
+        noise = torch.normal(mean=mean, std=std)
+        condvec = data_sampler.sample_condvec(batch_size)
+        if condvec is None:
+            return noise, None, None, None, None
+        c1, m1, col, opt = condvec
+        c1, m1 = torch.from_numpy(c1).to(model._device), torch.from_numpy(m1).to(model._device)
+        return torch.cat([noise, c1], dim=1), c1, m1, col, opt
+
+    for _ in range(epochs):
+        for _ in range(steps_per_epoch):
+            for _ in range(model._discriminator_steps):
+                noise, c1, m1, col, opt = generate()
+                if c1 is None:
+                    real = data_sampler.sample_data(train_data, batch_size, None, None)
+                else:
+                    perm = np.random.permutation(batch_size)
+                    real = data_sampler.sample_data(train_data, batch_size, col[perm], opt[perm])
+                fake = model._apply_activate(generator(noise))
+                real = torch.from_numpy(real.astype("float32")).to(model._device)
+                if c1 is not None:
+                    fake, real = torch.cat([fake, c1], dim=1), torch.cat([real, c1[perm]], dim=1)
+
+                penalty = discriminator.calc_gradient_penalty(real, fake, model._device, model.pac)
+                loss_d = -(torch.mean(discriminator(real)) - torch.mean(discriminator(fake)))
+                optimizer_d.zero_grad(set_to_none=False)
+                penalty.backward(retain_graph=True)
+                loss_d.backward()
+                optimizer_d.step()
+
+            noise, c1, m1, _, _ = generate()
+            fake = generator(noise)
+            fake_activated = model._apply_activate(fake)
+            if c1 is None:
+                loss_g = -torch.mean(discriminator(fake_activated))
+            else:
+                loss_g = (-torch.mean(discriminator(torch.cat([fake_activated, c1], dim=1)))
+                          + model._cond_loss(fake, c1, m1))
+            optimizer_g.zero_grad(set_to_none=False)
+            loss_g.backward()
+            optimizer_g.step()
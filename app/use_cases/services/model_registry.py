@@ -0,0 +1,105 @@
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import joblib
+import pandas as pd
+
+from app.entities.trained_model import TrainedModel
+from app.persistence.repositories.model_repository import ModelRepository
+from app.use_cases.services.dataset_registry import CATEGORICAL_COLUMNS, PII_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRegistry:
+    """
+    Versioned store of trained models, one artifact per task.
+
+    Artifacts are written to ``model_dir`` with their metadata registered in the database. Models
+    used for inference are kept in a bounded LRU of each process. Forests are not memory-mapped:
+    unpickling a tree copies its nodes into memory sklearn allocates, so every process holds its own
+    copy and ``max_loaded_models`` is what bounds that memory. A cached model is reloaded when its
+    artifact is replaced, e.g. by a retried job in another process.
+
+    Methods:
+        register(task_id, model, features, accuracy, synthesizer_type, augmentation_factor): Stores a model.
+        load(task_id): Returns a loaded model and its metadata.
+        predict_proba(task_id, rows): Scores a batch of raw rows with the model of a task.
+    """
+
+    def __init__(self, repository: ModelRepository, model_dir: str, max_loaded_models: int):
+        self.repository = repository
+        self.model_dir = model_dir
+        self.max_loaded_models = max_loaded_models
+        # task_id -> (model, metadata, mtime of the artifact it was loaded from)
+        self._loaded: OrderedDict[int, tuple[object, TrainedModel, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(self.model_dir, exist_ok=True)
+
+    def register(self, task_id: int, model, features: list[str], accuracy: float, synthesizer_type: str,
+                 augmentation_factor: int) -> TrainedModel:
+        path = os.path.join(self.model_dir, f"{task_id}.joblib")
+        fd, tmp_path = tempfile.mkstemp(dir=self.model_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            joblib.dump(model, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._loaded.pop(task_id, None)
+        logger.info(f"Registered model of task {task_id} at {path}")
+        return self.repository.save_model(task_id, path, synthesizer_type, augmentation_factor, features, accuracy)
+
+    def load(self, task_id: int) -> tuple[object, TrainedModel]:
+        with self._lock:
+            cached = self._loaded.get(task_id)
+        if cached is not None:
+            model, metadata, mtime = cached
+            # Registration in another process only replaces the file, so check it is still the one loaded
+            if self._artifact_mtime(metadata.path) == mtime:
+                with self._lock:
+                    if task_id in self._loaded:
+                        self._loaded.move_to_end(task_id)
+                return model, metadata
+
+        metadata = self.repository.get_model_by_task_id(task_id)
+        if metadata is None:
+            raise LookupError(f"No model registered for task {task_id}")
+        mtime = self._artifact_mtime(metadata.path)
+        model = joblib.load(metadata.path)
+
+        with self._lock:
+            self._loaded[task_id] = (model, metadata, mtime)
+            self._loaded.move_to_end(task_id)
+            while len(self._loaded) > self.max_loaded_models:
+                self._loaded.popitem(last=False)
+        return model, metadata
+
+    @staticmethod
+    def _artifact_mtime(path: str) -> int | None:
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def predict_proba(self, task_id: int, rows: list[dict]) -> list[dict[str, float]]:
+        """Encode raw rows like the training data and return the class probabilities of each row."""
+        model, metadata = self.load(task_id)
+
+        data = pd.DataFrame(rows)
+        data.columns = data.columns.str.lower()
+        data = data.drop(columns=PII_COLUMNS + ['survived'], errors='ignore')
+        # No drop_first here: columns of the dropped reference levels are simply absent from the features
+        data = pd.get_dummies(data, columns=[column for column in CATEGORICAL_COLUMNS if column in data.columns])
+        features = data.reindex(columns=metadata.features, fill_value=0)
+
+        probabilities = model.predict_proba(features)
+        classes = [str(label) for label in model.classes_]
+        return [dict(zip(classes, map(float, row))) for row in probabilities]
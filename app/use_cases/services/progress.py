@@ -0,0 +1,113 @@
+import logging
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.entities.task_status import ProgressEvent, ProgressStage, TaskStatusEnum
+
+logger = logging.getLogger(__name__)
+
+# Called by long-running operations as ``progress(stage, progress=..., epoch=..., ...)``
+ProgressReporter = Callable[..., None]
+
+
+def no_progress(stage: ProgressStage, **details):
+    """Progress reporter used when nobody follows the operation."""
+
+
+def publish_progress(event: ProgressEvent):
+    """
+    Send a progress event to the API processes with ``NOTIFY``.
+
+    Progress is best-effort: it is not stored, and a failed notification never fails the job.
+    Databases other than PostgreSQL have no LISTEN/NOTIFY, so events are only logged there.
+    """
+    from app.db.session import engine
+
+    payload = event.model_dump_json(exclude_none=True)
+    if engine.dialect.name != "postgresql":
+        logger.debug(f"Progress of task {event.task_id}: {payload}")
+        return
+    try:
+        # AUTOCOMMIT delivers the notification at once instead of at the end of a transaction
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("SELECT pg_notify(:channel, :payload)"),
+                               {"channel": settings.progress_channel, "payload": payload})
+    except Exception as e:
+        logger.warning(f"Could not publish progress of task {event.task_id}: {e}")
+
+
+class TaskProgressPublisher:
+    """
+    Progress reporter of one job, publishing every step as a ``ProgressEvent``.
+
+    Methods:
+        __call__(stage, **details): Publishes a step of the job.
+        status(status, message): Publishes a status change of the job.
+    """
+
+    def __init__(self, task_id: int, publish: Callable[[ProgressEvent], None] = publish_progress):
+        self.task_id = task_id
+        self.publish = publish
+
+    def __call__(self, stage: ProgressStage, **details):
+        self.publish(ProgressEvent(task_id=self.task_id, stage=stage, **details))
+
+    def status(self, status: TaskStatusEnum, message: Optional[str] = None):
+        self.publish(ProgressEvent(task_id=self.task_id, stage=ProgressStage.STATUS, status=status, message=message))
+
+
+class EpochProgressMonitor:
+    """
+    Reports the epochs of a GAN synthesizer while it is being fitted.
+
+    SDV does not expose a per-epoch callback, but the underlying CTGAN/TVAE model appends one row per
+    epoch to its ``loss_values`` frame; a background thread polls it and reports every new epoch.
+    Synthesizers without epochs are fitted without epoch events.
+
+    Methods:
+        __enter__(): Starts polling the synthesizer.
+        __exit__(): Stops polling.
+    """
+
+    def __init__(self, synthesizer, progress: ProgressReporter, interval_seconds: float | None = None):
+        self.synthesizer = synthesizer
+        self.progress = progress
+        self.interval_seconds = interval_seconds or settings.progress_epoch_poll_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._reported = 0
+
+    def _total_epochs(self) -> int | None:
+        try:
+            return self.synthesizer.get_parameters().get("epochs")
+        except Exception:
+            return None
+
+    def _poll(self, total_epochs: int):
+        while not self._stop.wait(self.interval_seconds):
+            self._report(total_epochs)
+
+    def _report(self, total_epochs: int):
+        model = getattr(self.synthesizer, "_model", None)
+        loss_values = getattr(model, "loss_values", None)
+        epoch = len(loss_values) if loss_values is not None else 0
+        if epoch > self._reported:
+            self._reported = epoch
+            self.progress(ProgressStage.FIT_EPOCH, epoch=epoch, total_epochs=total_epochs,
+                          progress=epoch / total_epochs)
+
+    def __enter__(self):
+        total_epochs = self._total_epochs()
+        if total_epochs:
+            self._thread = threading.Thread(target=self._poll, args=(total_epochs,), daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return False
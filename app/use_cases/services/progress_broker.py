@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.entities.task_status import ProgressEvent
+
+logger = logging.getLogger(__name__)
+
+_LISTEN_RETRY_SECONDS = 5.0
+_LATEST_EVENTS_MAX_ENTRIES = 1_000
+
+
+def listen_dsn(database_url: str) -> str | None:
+    """DSN asyncpg listens on for progress notifications, or None when the database is not PostgreSQL."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        return None
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class ProgressBroker:
+    """
+    In-process pub/sub fanning job progress out to the event streams of one API process.
+
+    Workers run in other processes and publish with ``NOTIFY``; the broker holds a single ``LISTEN``
+    connection per API process, started with the first subscriber, and hands every notification to
+    the queues of the streams following that task. The latest event of each task is kept, so a client
+    connecting mid-job sees where it is right away.
+
+    Methods:
+        subscribe(task_id): Async context manager yielding a queue of the task's events.
+        publish(event): Delivers an event to the subscribers of its task.
+        latest(task_id): Returns the last event seen for a task.
+        close(): Stops listening for notifications.
+    """
+
+    def __init__(self, dsn: str | None, channel: str, queue_size: int):
+        self.dsn = dsn
+        self.channel = channel
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+        self._latest: OrderedDict[int, ProgressEvent] = OrderedDict()
+        self._listener: asyncio.Task | None = None
+
+    @asynccontextmanager
+    async def subscribe(self, task_id: int) -> AsyncIterator[asyncio.Queue]:
+        self._ensure_listening()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(task_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(task_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[task_id]
+
+    def publish(self, event: ProgressEvent):
+        self._latest[event.task_id] = event
+        self._latest.move_to_end(event.task_id)
+        while len(self._latest) > _LATEST_EVENTS_MAX_ENTRIES:
+            self._latest.popitem(last=False)
+
+        for queue in self._subscribers.get(event.task_id, ()):
+            if queue.full():
+                # A slow client loses its oldest events rather than holding back the others
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def latest(self, task_id: int) -> ProgressEvent | None:
+        return self._latest.get(task_id)
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _ensure_listening(self):
+        if self.dsn is None or (self._listener is not None and not self._listener.done()):
+            return
+        self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    def _on_notification(self, connection, pid, channel, payload):
+        try:
+            self.publish(ProgressEvent.model_validate_json(payload))
+        except ValidationError as e:
+            logger.warning(f"Ignoring malformed progress notification: {e}")
+
+    async def _listen(self):
+        import asyncpg
+
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                await connection.add_listener(self.channel, self._on_notification)
+                logger.info(f"Listening for job progress on channel {self.channel}")
+                # Notifications arrive through the callback; wake up now and then to notice a dead connection
+                while not connection.is_closed():
+                    await asyncio.sleep(_LISTEN_RETRY_SECONDS)
+                logger.warning("Progress listener connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Progress listener failed: {e}, retrying in {_LISTEN_RETRY_SECONDS}s")
+                await asyncio.sleep(_LISTEN_RETRY_SECONDS)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+
+progress_broker = ProgressBroker(
+    listen_dsn(settings.database_url),
+    settings.progress_channel,
+    settings.progress_subscriber_queue_size,
+)
@@ -1,13 +1,13 @@
 # result_service.py
-from app.persistence.repositories.result_repository import ResultRepository
+from app.persistence.repositories.async_result_repository import AsyncResultRepository
 
 
 class ResultService:
-    def __init__(self, result_repository: ResultRepository):
+    def __init__(self, result_repository: AsyncResultRepository):
         self.result_repository = result_repository
 
-    def create_result(self, task_id: int, accuracy: float):
-        return self.result_repository.create_result(task_id, accuracy)
+    async def create_result(self, task_id: int, accuracy: float | None, details: str | None = None):
+        return await self.result_repository.create_result(task_id, accuracy, details)
 
-    def get_result_by_task_id(self, task_id: int):
-        return self.result_repository.get_result_by_task_id(task_id)
+    async def get_result_by_task_id(self, task_id: int):
+        return await self.result_repository.get_result_by_task_id(task_id)
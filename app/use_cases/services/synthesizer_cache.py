@@ -0,0 +1,251 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable
+
+from app.entities.synthetic_data import SynthesizerType
+from app.use_cases.factories.factories import SynthesizerFactory
+from app.utils.fingerprint import file_fingerprint, source_id
+
+logger = logging.getLogger(__name__)
+
+
+class SynthesizerCache:
+    """
+    Persistent LRU cache of fitted synthesizers.
+
+    Entries are keyed by the content hash of the source CSV, the preprocessing variant, the
+    synthesizer type and its hyperparameters. Fitted synthesizers are serialized to ``cache_dir``
+    and the most recently used ones are also kept in memory. When the source CSV changes, the
+    entries fitted on a previous version of it are dropped, except those saved with a refit state:
+    they are kept on disk as the base of an incremental refit until an entry for the new version
+    replaces them, or they are evicted.
+
+    Methods:
+        get_or_fit(csv_path, variant, synthesizer_type, hyperparameters, fit_fn, refit_fn, state_fn): Returns a
+            fitted synthesizer.
+        invalidate(csv_path): Drops every cached synthesizer fitted on the given source.
+        sampling_lock(synthesizer): Returns the lock serializing the sampling calls of a cached synthesizer.
+    """
+
+    def __init__(self, factory: SynthesizerFactory, cache_dir: str, max_bytes: int, max_memory_entries: int):
+        self.factory = factory
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._sampling_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(source: str, fingerprint: str, variant: str, synthesizer_type: SynthesizerType,
+                 hyperparameters: dict | None = None) -> str:
+        params = json.dumps(hyperparameters or {}, sort_keys=True, default=str)
+        params_hash = hashlib.sha256(params.encode()).hexdigest()[:12]
+        return f"{source}-{fingerprint[:16]}-{variant}-{SynthesizerType(synthesizer_type).value}-{params_hash}"
+
+    def get_or_fit(self, csv_path: str, variant: str, synthesizer_type: SynthesizerType,
+                   hyperparameters: dict | None, fit_fn: Callable[[], object],
+                   refit_fn: Callable[[object, dict], dict | None] | None = None,
+                   state_fn: Callable[[object], dict] | None = None):
+        """
+        Return the fitted synthesizer for the given key, calling ``fit_fn`` only on a cache miss.
+
+        On a miss, when ``refit_fn`` is given and a synthesizer of the same type and hyperparameters was saved
+        with a state for a previous version of the source, a private copy of it is updated with ``refit_fn``
+        instead; ``fit_fn`` is only called when that returns None.
+
+        Args:
+            csv_path (str): Path of the source CSV the synthesizer is fitted on.
+            variant (str): Name of the preprocessing applied to the CSV before fitting, including the settings
+                it depends on (see ``DatasetRegistry.variant_tag``).
+            synthesizer_type (SynthesizerType): Type of synthesizer.
+            hyperparameters (dict | None): Keyword arguments passed to the synthesizer.
+            fit_fn (Callable): Builds and fits the synthesizer on a miss.
+            refit_fn (Callable | None): Updates, in place, a synthesizer fitted on a previous version of the source,
+                given the state saved with it; returns its new state, or None when it must be fitted from scratch.
+            state_fn (Callable | None): Returns the state saved with a synthesizer built by ``fit_fn``.
+
+        Returns:
+            A fitted SDV synthesizer.
+        """
+        source = source_id(csv_path)
+        fingerprint = file_fingerprint(csv_path)
+        key = self.make_key(source, fingerprint, variant, synthesizer_type, hyperparameters)
+        self._purge_stale(source, fingerprint, key)
+
+        with self._get_key_lock(key):
+            synthesizer = self._get_from_memory(key)
+            if synthesizer is not None:
+                logger.info(f"Synthesizer cache hit (memory): {key}")
+                return synthesizer
+
+            path = self._entry_path(key)
+            if os.path.exists(path):
+                try:
+                    synthesizer = self.factory.load_synthesizer(synthesizer_type, path)
+                    os.utime(path)
+                    self._put_in_memory(key, synthesizer)
+                    logger.info(f"Synthesizer cache hit (disk): {key}")
+                    return synthesizer
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable synthesizer cache entry {key}: {e}")
+                    self._remove_entry(path)
+
+            synthesizer, state = self._refit_previous(key, synthesizer_type, refit_fn) if refit_fn else (None, None)
+            if synthesizer is None:
+                logger.info(f"Synthesizer cache miss: {key}")
+                synthesizer = fit_fn()
+                state = state_fn(synthesizer) if state_fn else None
+            self._write_entry(path, synthesizer, state)
+            self._put_in_memory(key, synthesizer)
+            self._remove_previous_versions(key)
+            self._evict_disk()
+            return synthesizer
+
+    def invalidate(self, csv_path: str):
+        """Drop every cached synthesizer fitted on any version of the given source."""
+        source = source_id(csv_path)
+        with self._lock:
+            for key in [k for k in self._memory if k.startswith(f"{source}-")]:
+                del self._memory[key]
+        for path in glob.glob(os.path.join(self.cache_dir, f"{source}-*.pkl")):
+            self._remove_entry(path)
+
+    def sampling_lock(self, synthesizer) -> threading.Lock:
+        """
+        Lock to hold while sampling from a synthesizer returned by this cache.
+
+        Cached instances are shared by every request of the process, and sampling advances their random
+        state and sampling caches, which is not thread-safe.
+        """
+        with self._lock:
+            lock = self._sampling_locks.get(synthesizer)
+            if lock is None:
+                lock = self._sampling_locks[synthesizer] = threading.Lock()
+            return lock
+
+    def _purge_stale(self, source: str, fingerprint: str, key: str):
+        current_prefix = f"{source}-{fingerprint[:16]}-"
+        with self._lock:
+            stale = [k for k in self._memory if k.startswith(f"{source}-") and not k.startswith(current_prefix)]
+            for stale_key in stale:
+                del self._memory[stale_key]
+        for path in glob.glob(os.path.join(self.cache_dir, f"{source}-*.pkl")):
+            if os.path.basename(path).startswith(current_prefix):
+                continue
+            # Entries with a refit state are kept as the base of an incremental refit
+            if not os.path.exists(self._state_path(path)):
+                logger.info(f"Source data changed, invalidating synthesizer cache entry: {os.path.basename(path)}")
+                self._remove_entry(path)
+
+    def _previous_versions(self, key: str) -> list[str]:
+        """Paths of the entries of the same source, variant, type and hyperparameters as ``key``, newest first."""
+        source, _, rest = key.split("-", 2)
+        paths = [
+            path for path in glob.glob(os.path.join(self.cache_dir, f"{source}-*-{rest}.pkl"))
+            if path != self._entry_path(key)
+        ]
+        return sorted(paths, key=lambda path: os.stat(path).st_mtime if os.path.exists(path) else 0, reverse=True)
+
+    def _refit_previous(self, key: str, synthesizer_type: SynthesizerType, refit_fn) -> tuple[object, dict | None]:
+        for path in self._previous_versions(key):
+            try:
+                with open(self._state_path(path)) as f:
+                    state = json.load(f)
+                # A private copy: the instance cached in memory may be sampled from meanwhile
+                synthesizer = self.factory.load_synthesizer(synthesizer_type, path)
+            except Exception as e:
+                logger.warning(f"Cannot refit from synthesizer cache entry {os.path.basename(path)}: {e}")
+                continue
+            try:
+                state = refit_fn(synthesizer, state)
+            except Exception as e:
+                logger.warning(f"Incremental refit from {os.path.basename(path)} failed, fitting from scratch: {e}")
+                return None, None
+            if state is not None:
+                logger.info(f"Synthesizer refitted incrementally from {os.path.basename(path)}: {key}")
+                return synthesizer, state
+            return None, None
+        return None, None
+
+    def _remove_previous_versions(self, key: str):
+        for path in self._previous_versions(key):
+            logger.info(f"Replaced synthesizer cache entry: {os.path.basename(path)}")
+            self._remove_entry(path)
+
+    def _get_key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _get_from_memory(self, key: str):
+        with self._lock:
+            synthesizer = self._memory.get(key)
+            if synthesizer is not None:
+                self._memory.move_to_end(key)
+            return synthesizer
+
+    def _put_in_memory(self, key: str, synthesizer):
+        with self._lock:
+            self._memory[key] = synthesizer
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    @staticmethod
+    def _state_path(entry_path: str) -> str:
+        return f"{os.path.splitext(entry_path)[0]}.json"
+
+    def _write_entry(self, path: str, synthesizer, state: dict | None = None):
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            synthesizer.save(tmp_path)
+            os.replace(tmp_path, path)
+            if state is not None:
+                with open(tmp_path, "w") as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self._state_path(path))
+        except Exception as e:
+            logger.warning(f"Could not persist synthesizer cache entry {path}: {e}")
+            self._remove_file(tmp_path)
+
+    def _evict_disk(self):
+        entries = []
+        for path in glob.glob(os.path.join(self.cache_dir, "*.pkl")):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            logger.info(f"Evicting synthesizer cache entry: {os.path.basename(path)}")
+            self._remove_entry(path)
+            total_size -= size
+
+    def _remove_entry(self, path: str):
+        self._remove_file(path)
+        self._remove_file(self._state_path(path))
+
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
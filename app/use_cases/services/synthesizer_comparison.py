@@ -0,0 +1,113 @@
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from app.core.config import settings
+from app.entities.synthetic_data import SynthesizerType
+from app.use_cases.evaluators.evaluators import Evaluator
+from app.use_cases.factories.factories import SynthesizerFactory
+from app.use_cases.services.synthesizer_cache import SynthesizerCache
+from app.utils.shared_frame import SharedFrame
+
+if TYPE_CHECKING:
+    from sdv.metadata import SingleTableMetadata
+
+logger = logging.getLogger(__name__)
+
+
+def compare_synthesizers(data: pd.DataFrame, evaluation_metadata: "SingleTableMetadata", candidates: list[dict],
+                         csv_path: str, variant: str, max_workers: int) -> list[dict]:
+    """
+    Fit, sample and evaluate every candidate synthesizer in parallel and rank them by overall quality.
+
+    ``data`` is published once in shared memory; each worker process attaches to it instead of
+    receiving a pickled copy per candidate.
+
+    Args:
+        data (pd.DataFrame): Preprocessed real data the candidates are fitted on.
+        evaluation_metadata (SingleTableMetadata): Metadata used to evaluate the synthetic data.
+        candidates (list[dict]): ``{"synthesizer_type": ..., "hyperparameters": {...}}`` entries.
+        csv_path (str): Source CSV of ``data``, used to key the synthesizer cache.
+        variant (str): Preprocessing variant of ``data``, used to key the synthesizer cache.
+        max_workers (int): Maximum number of worker processes.
+
+    Returns:
+        list[dict]: Leaderboard entries sorted from best to worst, with per-stage timings.
+    """
+    shared = SharedFrame.create(data)
+    metadata_dict = evaluation_metadata.to_dict()
+    try:
+        context = multiprocessing.get_context("spawn")
+        workers = max(1, min(max_workers, len(candidates)))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = [
+                executor.submit(_run_candidate, shared.name, shared.size, candidate, metadata_dict, csv_path, variant)
+                for candidate in candidates
+            ]
+            entries = []
+            for candidate, future in zip(candidates, futures):
+                try:
+                    entries.append(future.result())
+                except Exception as e:
+                    logger.error(f"Candidate {candidate} failed: {e}")
+                    entries.append({**candidate, "scores": None, "timings": {}, "error": str(e)})
+    finally:
+        shared.close()
+
+    leaderboard = sorted(
+        entries,
+        key=lambda entry: entry["scores"]["Overall Score"] if entry["scores"] else float("-inf"),
+        reverse=True,
+    )
+    for rank, entry in enumerate(leaderboard, start=1):
+        entry["rank"] = rank
+    return leaderboard
+
+
+def _run_candidate(shm_name: str, shm_size: int, candidate: dict, metadata_dict: dict, csv_path: str,
+                   variant: str) -> dict:
+    from sdv.metadata import SingleTableMetadata
+
+    timings = {}
+    started = time.perf_counter()
+
+    data = SharedFrame.read(shm_name, shm_size)
+    timings["attach"] = time.perf_counter() - started
+
+    synthesizer_type = SynthesizerType(candidate["synthesizer_type"])
+    hyperparameters = candidate.get("hyperparameters") or {}
+    factory = SynthesizerFactory()
+    cache = SynthesizerCache(factory, settings.synthesizer_cache_dir, settings.synthesizer_cache_max_bytes,
+                             settings.synthesizer_cache_max_memory_entries)
+
+    def fit():
+        metadata = SingleTableMetadata()
+        metadata.detect_from_dataframe(data)
+        synthesizer = factory.get_synthesizer(synthesizer_type, metadata, **hyperparameters)
+        synthesizer.fit(data)
+        return synthesizer
+
+    stage_started = time.perf_counter()
+    synthesizer = cache.get_or_fit(csv_path, variant, synthesizer_type, hyperparameters, fit)
+    timings["fit"] = time.perf_counter() - stage_started
+
+    stage_started = time.perf_counter()
+    synthetic_data = synthesizer.sample(num_rows=len(data))
+    timings["sample"] = time.perf_counter() - stage_started
+
+    stage_started = time.perf_counter()
+    scores = Evaluator.evaluate_data_quality(synthetic_data, data, SingleTableMetadata.load_from_dict(metadata_dict))
+    timings["evaluate"] = time.perf_counter() - stage_started
+    timings["total"] = time.perf_counter() - started
+
+    return {
+        "synthesizer_type": synthesizer_type.value,
+        "hyperparameters": hyperparameters,
+        "scores": {name: float(score) for name, score in scores.items()},
+        "timings": timings,
+        "error": None,
+    }
@@ -1,19 +1,31 @@
-from app.entities.task_status import TaskStatusEnum
-from app.persistence.repositories.task_status_repository import TaskStatusRepository
+import datetime
+
+from app.core.config import settings
+from app.entities.task_status import JobType, TaskStatusEnum
+from app.persistence.repositories.async_task_status_repository import AsyncTaskStatusRepository
 
 
 class TaskStatusService:
-    def __init__(self, task_repository: TaskStatusRepository):
+    def __init__(self, task_repository: AsyncTaskStatusRepository):
         self.task_repository = task_repository
 
-    def create_task(self, description: str):
-        return self.task_repository.create_task(description)
+    async def create_task(self, description: str):
+        return await self.task_repository.create_task(description, datetime.datetime.utcnow())
+
+    async def enqueue_job(self, description: str, job_type: JobType, payload: dict):
+        """
+        Create a task that will be picked up and executed by a worker process.
+        """
+        return await self.task_repository.enqueue_job(description, job_type, payload, settings.job_max_attempts)
+
+    async def update_task_status(self, task_id: int, status: TaskStatusEnum, accuracy=None, error=None):
+        await self.task_repository.update_task_status(task_id, status, accuracy, error)
 
-    def update_task_status(self, task_id: int, status: TaskStatusEnum, accuracy=None, error=None):
-        self.task_repository.update_task_status(task_id, status, accuracy, error)
+    async def get_task(self, task_id: int):
+        return await self.task_repository.get_task(task_id)
 
-    def get_task_status(self, task_id: int):
+    async def get_task_status(self, task_id: int):
         """
         Get the current status of the task.
         """
-        return self.task_repository.get_task_status(task_id)
+        return await self.task_repository.get_task_status(task_id)
@@ -1,31 +1,118 @@
+import json
 import logging
 
+from app.core.config import settings
+from app.entities.evaluation import EvaluationOptions
 from app.entities.synthetic_data import SynthesizerType
-from app.entities.task_status import TaskStatusEnum
-from app.persistence.repositories.result_repository import ResultRepository
+from app.entities.task_status import JobType, ProgressStage, TaskStatusEnum
+from app.entities.training import TrainingOptions
 from app.persistence.repositories.task_status_repository import TaskStatusRepository
 from app.use_cases.services.data_service import DataService
+from app.use_cases.services.progress import TaskProgressPublisher
+from app.utils.stage_profiler import StageProfiler
 
 logger = logging.getLogger(__name__)
 
-result_repository =  ResultRepository()
-
 class DataTask:
+    """
+        Job handlers executed by the worker process.
+
+        Handlers only report success; failures are propagated to the worker, which decides whether
+        the job is retried or marked as failed. A result is only stored while ``worker_id`` still holds
+        the job's lock, so a worker that stalled and lost its job cannot overwrite the new attempt.
+        Progress of the job is published as it runs, and its completion once the result is stored. The stage
+        timings recorded by ``profiler`` are stored with the result.
+    """
 
+    @staticmethod
     def run_augment_and_train_task(
-            task_id: int, synthesizer_type: SynthesizerType, augmentation_factor: int, data_service: DataService,
-            task_repository: TaskStatusRepository,
+            task_id: int, payload: dict, data_service: DataService, task_repository: TaskStatusRepository,
+            worker_id: str, profiler: StageProfiler,
+    ):
+        synthesizer_type = SynthesizerType(payload["synthesizer_type"])
+        augmentation_factor = int(payload["augmentation_factor"])
+        training_options = TrainingOptions(**payload.get("training_options") or {})
+
+        progress = TaskProgressPublisher(task_id)
+
+        accuracy = data_service.augment_and_train(synthesizer_type, augmentation_factor, task_id=task_id,
+                                                  training_options=training_options, progress=progress,
+                                                  profiler=profiler)
+        cross_validation = data_service.cross_validate_augmentation(synthesizer_type, augmentation_factor,
+                                                                    training_options=training_options,
+                                                                    progress=progress, profiler=profiler)
+
+        # Save the result, with the cross-validated scores next to the holdout accuracy
+        DataTask._complete(task_id, worker_id, task_repository, progress, profiler, accuracy,
+                           json.dumps(cross_validation) if cross_validation else None)
+
+    @staticmethod
+    def run_compare_synthesizers_task(
+            task_id: int, payload: dict, data_service: DataService, task_repository: TaskStatusRepository,
+            worker_id: str, profiler: StageProfiler,
+    ):
+        progress = TaskProgressPublisher(task_id)
+
+        comparison = data_service.compare_synthesizers(payload["candidates"], progress=progress, profiler=profiler)
+
+        # The leaderboard is the result; there is no model accuracy for a comparison
+        DataTask._complete(task_id, worker_id, task_repository, progress, profiler, None, json.dumps(comparison))
+
+    @staticmethod
+    def run_generate_batch_task(
+            task_id: int, payload: dict, data_service: DataService, task_repository: TaskStatusRepository,
+            worker_id: str, profiler: StageProfiler,
+    ):
+        progress = TaskProgressPublisher(task_id)
+
+        synthetic_data_ids = data_service.generate_synthetic_data_batch(
+            SynthesizerType(payload["synthesizer_type"]), payload["samples"], payload.get("hyperparameters"),
+            progress=progress, profiler=profiler,
+        )
+
+        # The IDs of the datasets are the result, with the evaluation jobs queued for them
+        evaluation_task_ids = [
+            DataTask.enqueue_evaluation(task_repository, synthetic_data_id)
+            for synthetic_data_id in synthetic_data_ids
+        ] if payload.get("evaluate") else []
+        DataTask._complete(task_id, worker_id, task_repository, progress, profiler, None,
+                           json.dumps({"synthetic_data_ids": synthetic_data_ids,
+                                       "evaluation_task_ids": evaluation_task_ids}))
+
+    @staticmethod
+    def run_evaluate_task(
+            task_id: int, payload: dict, data_service: DataService, task_repository: TaskStatusRepository,
+            worker_id: str, profiler: StageProfiler,
     ):
-        try:
-            task_repository.update_task_status(task_id, TaskStatusEnum.IN_PROGRESS)
+        progress = TaskProgressPublisher(task_id)
+        progress(ProgressStage.EVALUATING)
 
-            accuracy = data_service.augment_and_train(synthesizer_type, augmentation_factor)
+        scores = data_service.evaluate_synthetic_data(
+            int(payload["synthetic_data_id"]), EvaluationOptions(**payload.get("options") or {}),
+            refresh=bool(payload.get("refresh")), profiler=profiler,
+        )
 
-            # Save the result
-            result_repository.create_result(task_id, accuracy)
+        # The scores are stored with the other evaluations; the overall score is the task's accuracy
+        DataTask._complete(task_id, worker_id, task_repository, progress, profiler, scores["Overall Score"],
+                           json.dumps({"synthetic_data_id": payload["synthetic_data_id"]}))
 
-            task_repository.update_task_status(task_id, TaskStatusEnum.COMPLETED, accuracy=accuracy)
+    @staticmethod
+    def enqueue_evaluation(task_repository: TaskStatusRepository, synthetic_data_id: int,
+                           options: EvaluationOptions | None = None) -> int:
+        """Queue a job precomputing the evaluation of a stored synthetic dataset; returns its task ID."""
+        return task_repository.enqueue_job(
+            f"Evaluation of synthetic data {synthetic_data_id}",
+            JobType.EVALUATE,
+            {"synthetic_data_id": synthetic_data_id,
+             "options": (options or EvaluationOptions()).model_dump(mode="json")},
+            settings.job_max_attempts,
+        )
 
-        except Exception as e:
-            logger.error(f"Error during data augmentation and training: {e}")
-            task_repository.update_task_status(task_id, TaskStatusEnum.FAILED, error=str(e))
+    @staticmethod
+    def _complete(task_id: int, worker_id: str, task_repository: TaskStatusRepository,
+                  progress: TaskProgressPublisher, profiler: StageProfiler, accuracy: float | None = None,
+                  details: str | None = None):
+        if not task_repository.complete_job(task_id, worker_id, accuracy, details, profiler.timings()):
+            logger.warning(f"Worker {worker_id} lost the lock on job {task_id}, discarding its result")
+            return
+        progress.status(TaskStatusEnum.COMPLETED)
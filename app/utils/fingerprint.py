@@ -0,0 +1,55 @@
+import hashlib
+import os
+import threading
+
+import pandas as pd
+
+_CHUNK_SIZE = 1024 * 1024
+
+_lock = threading.Lock()
+_fingerprints: dict[str, tuple[int, int, str]] = {}
+
+
+def file_fingerprint(path: str) -> str:
+    """
+    Returns the SHA-256 content hash of a file.
+
+    The digest is memoized per path together with the file's mtime and size, so the file is only
+    re-read when it has actually been touched.
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+
+    with _lock:
+        cached = _fingerprints.get(abs_path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    digest = hashlib.sha256()
+    with open(abs_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    fingerprint = digest.hexdigest()
+
+    with _lock:
+        _fingerprints[abs_path] = (stat.st_mtime_ns, stat.st_size, fingerprint)
+    return fingerprint
+
+
+def source_id(path: str) -> str:
+    """Returns a short, stable identifier for a data source based on its absolute path."""
+    return hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:12]
+
+
+def row_block_hashes(data: pd.DataFrame, block_rows: int) -> list[str]:
+    """
+    Returns one hash per block of ``block_rows`` consecutive rows of ``data``, the last block possibly shorter.
+
+    Rows are hashed by value, ignoring the index, so the hashes of the first blocks of a table do not change
+    when rows are appended to it.
+    """
+    row_hashes = pd.util.hash_pandas_object(data, index=False).to_numpy()
+    return [
+        hashlib.sha256(row_hashes[start:start + block_rows].tobytes()).hexdigest()[:16]
+        for start in range(0, len(row_hashes), block_rows)
+    ]
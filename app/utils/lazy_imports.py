@@ -0,0 +1,45 @@
+import importlib
+import logging
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+# Modules the services import on first use; sdv.single_table pulls in torch through CTGAN
+ML_MODULES = (
+    "sdv.single_table",
+    "sdv.metadata",
+    "sdv.sampling",
+    "sdmetrics.reports.single_table",
+    "sdmetrics.column_pairs",
+    "sdmetrics.single_column",
+    "sklearn.ensemble",
+    "sklearn.metrics",
+    "sklearn.model_selection",
+)
+
+# Top-level packages that must not be loaded by merely importing the application
+ML_PACKAGES = ("sdv", "sdmetrics", "ctgan", "copulas", "rdt", "torch", "sklearn")
+
+
+def loaded_ml_packages() -> list[str]:
+    """The packages of ``ML_PACKAGES`` already imported in this process."""
+    return [package for package in ML_PACKAGES if package in sys.modules]
+
+
+def preload_ml_modules(modules: tuple[str, ...] = ML_MODULES) -> float:
+    """
+    Import the ML libraries now, so that the first job of a process does not pay for them.
+
+    Meant for processes that run fits, samples or evaluations (e.g. job workers); processes that only
+    serve auth and status calls should leave them to be imported on first use.
+
+    Returns:
+        float: Seconds spent importing.
+    """
+    started = time.perf_counter()
+    for module in modules:
+        importlib.import_module(module)
+    elapsed = time.perf_counter() - started
+    logger.info(f"Preloaded {len(modules)} ML modules in {elapsed:.2f}s")
+    return elapsed
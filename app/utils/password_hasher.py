@@ -1,12 +1,27 @@
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
 
 class PasswordHasher:
-    def __init__(self, schemes: list[str] = ["bcrypt"], deprecated: str = "auto"):
-        self.pwd_context = CryptContext(schemes=schemes, deprecated=deprecated)
+    """
+    Password hashing with passlib.
+
+    ``bcrypt_rounds`` (``settings.bcrypt_rounds`` by default) sets the cost of new hashes. With ``deprecated="auto"``, hashes made with another
+    scheme or a different cost are reported by ``verify_and_update`` so they can be replaced on login.
+    """
+    def __init__(self, schemes: list[str] = ["bcrypt"], deprecated: str = "auto", bcrypt_rounds: int | None = None):
+        options = {}
+        if "bcrypt" in schemes:
+            options["bcrypt__rounds"] = bcrypt_rounds or settings.bcrypt_rounds
+        self.pwd_context = CryptContext(schemes=schemes, deprecated=deprecated, **options)
 
     def hash_password(self, password: str) -> str:
         return self.pwd_context.hash(password)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return self.pwd_context.verify(plain_password, hashed_password)
+
+    def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """Verify a password and return a replacement hash when the stored one is deprecated."""
+        return self.pwd_context.verify_and_update(plain_password, hashed_password)
@@ -0,0 +1,61 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import pandas as pd
+import pyarrow as pa
+
+
+class SharedFrame:
+    """
+    A DataFrame published once in shared memory as an Arrow IPC stream.
+
+    Other processes attach to it by name with ``SharedFrame.read`` instead of receiving a pickled
+    copy with every task. The creating process owns the block and must call ``close`` when done.
+    """
+
+    def __init__(self, shm: SharedMemory, size: int):
+        self._shm = shm
+        self.size = size
+
+    @classmethod
+    def create(cls, data: pd.DataFrame) -> "SharedFrame":
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        buffer = sink.getvalue()
+
+        shm = SharedMemory(create=True, size=max(buffer.size, 1))
+        try:
+            # Arrow buffers are exposed as signed bytes, the shared block as unsigned ones
+            shm.buf[:buffer.size] = memoryview(buffer).cast('B')
+        except Exception:
+            shm.close()
+            shm.unlink()
+            raise
+        return cls(shm, buffer.size)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @staticmethod
+    def read(name: str, size: int) -> pd.DataFrame:
+        """Attach to a shared frame by name and return a private, writable copy of it."""
+        # Spawned readers share the creator's resource tracker, so attaching only re-registers the block
+        # and the creator's unlink() remains the single place it is released
+        shm = SharedMemory(name=name)
+        try:
+            table = pa.ipc.open_stream(pa.py_buffer(shm.buf[:size])).read_all()
+            data = table.to_pandas().copy(deep=True)
+            del table
+            return data
+        finally:
+            try:
+                shm.close()
+            except BufferError:
+                # A view is still alive somewhere; the mapping is released when the process exits
+                pass
+
+    def close(self):
+        self._shm.close()
+        self._shm.unlink()
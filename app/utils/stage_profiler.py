@@ -0,0 +1,112 @@
+import cProfile
+import functools
+import logging
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from app.core.config import settings
+from app.core.metrics import PIPELINE_PEAK_RSS_BYTES, PIPELINE_STAGE_CPU_SECONDS, PIPELINE_STAGE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def peak_rss_bytes() -> int:
+    """High-water mark of the resident memory of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def profile_path(name: str) -> str:
+    """Where the cProfile dump of a run called ``name`` is written."""
+    return os.path.join(settings.profile_dir, f"{name}-{time.strftime('%Y%m%dT%H%M%S')}.prof")
+
+
+class StageProfiler:
+    """
+    Records the wall time, CPU time and memory of each stage of one pipeline run.
+
+    Stages entered more than once (e.g. one sampling stage per batch) are summed. CPU time is the
+    process's, so it includes the threads a stage starts (e.g. a forest trained with ``n_jobs``) and
+    can exceed the wall time. Memory is the process's peak RSS at the end of the stage, together with
+    how much the stage raised it. Stage durations are also exported as Prometheus histograms.
+
+    When ``profile_path`` is given, ``profile()`` also runs the pipeline under cProfile and dumps the
+    stats there, to be read with ``pstats`` or snakeviz.
+
+    Methods:
+        stage(name): Context manager measuring one stage.
+        profile(): Context manager wrapping the whole run, profiling it when requested.
+        timings(): Returns the measurements of every stage, in the order they first ran.
+    """
+
+    def __init__(self, pipeline: str, profile_path: str | None = None):
+        self.pipeline = pipeline
+        self.profile_path = profile_path
+        self._stages: dict[str, dict] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        peak_before = peak_rss_bytes()
+        wall_started, cpu_started = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_started
+            cpu = time.process_time() - cpu_started
+            peak_after = peak_rss_bytes()
+
+            timing = self._stages.setdefault(name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "calls": 0,
+                                                    "peak_rss_bytes": 0, "rss_growth_bytes": 0})
+            timing["wall_seconds"] += wall
+            timing["cpu_seconds"] += cpu
+            timing["calls"] += 1
+            timing["peak_rss_bytes"] = peak_after
+            timing["rss_growth_bytes"] += peak_after - peak_before
+
+            PIPELINE_STAGE_SECONDS.labels(pipeline=self.pipeline, stage=name).observe(wall)
+            PIPELINE_STAGE_CPU_SECONDS.labels(pipeline=self.pipeline, stage=name).observe(cpu)
+            PIPELINE_PEAK_RSS_BYTES.labels(pipeline=self.pipeline).set(peak_after)
+
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        if self.profile_path is None:
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            os.makedirs(os.path.dirname(os.path.abspath(self.profile_path)), exist_ok=True)
+            profiler.dump_stats(self.profile_path)
+            logger.info(f"Profile of {self.pipeline} written to {self.profile_path}")
+
+    def timings(self) -> dict[str, dict]:
+        return {name: dict(timing) for name, timing in self._stages.items()}
+
+
+def profiled(pipeline: str):
+    """
+    Decorator of the pipeline methods of a service.
+
+    The method gets a ``profiler`` keyword argument: the caller's ``StageProfiler``, to read the timings
+    afterwards, or a new one. The whole call runs under ``profiler.profile()`` and the timings are logged.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, profiler: StageProfiler | None = None, **kwargs):
+            profiler = profiler or StageProfiler(pipeline)
+            with profiler.profile():
+                result = method(self, *args, profiler=profiler, **kwargs)
+            summary = ", ".join(f"{name} {timing['wall_seconds']:.3f}s" for name, timing in profiler.timings().items())
+            logger.info(f"{pipeline} stages: {summary}")
+            return result
+        return wrapper
+    return decorator
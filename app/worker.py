@@ -0,0 +1,160 @@
+"""
+Worker entry point executing jobs queued in the ``task_status`` table.
+
+Run with ``python -m app.worker [--concurrency N]``. The supervisor starts N job-executing
+processes, restarts the ones that die and periodically requeues jobs orphaned by crashed workers.
+"""
+import argparse
+import datetime
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+
+from app.core.config import settings
+from app.core.logger import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+def run_job_loop(worker_id: str, stop_event):
+    """Claim and execute jobs one at a time until ``stop_event`` is set."""
+    configure_logging()
+    # The supervisor handles shutdown; children only stop between jobs
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    from app.entities.task_status import JobType, TaskStatusEnum
+    from app.persistence.repositories.task_status_repository import TaskStatusRepository
+    from app.persistence.unit_of_work import UnitOfWork
+    from app.use_cases.evaluators.evaluators import Evaluator
+    from app.use_cases.factories.factories import SynthesizerFactory
+    from app.use_cases.services.data_service import DataService
+    from app.use_cases.services.progress import TaskProgressPublisher
+    from app.utils.lazy_imports import preload_ml_modules
+    from app.utils.stage_profiler import StageProfiler, profile_path
+    from app.use_cases.tasks.data_tasks import DataTask
+
+    if settings.worker_preload_ml_modules:
+        # Every job fits, samples or evaluates, so the imports are paid once before claiming any
+        preload_ml_modules()
+
+    handlers = {
+        JobType.AUGMENT_AND_TRAIN: DataTask.run_augment_and_train_task,
+        JobType.COMPARE_SYNTHESIZERS: DataTask.run_compare_synthesizers_task,
+        JobType.GENERATE_BATCH: DataTask.run_generate_batch_task,
+        JobType.EVALUATE: DataTask.run_evaluate_task,
+    }
+    task_repository = TaskStatusRepository()
+    data_service = DataService(SynthesizerFactory(), Evaluator(), settings.csv)
+
+    logger.info(f"Worker {worker_id} started")
+    while not stop_event.is_set():
+        job = task_repository.claim_next_job(worker_id)
+        if job is None:
+            stop_event.wait(settings.worker_poll_interval_seconds)
+            continue
+
+        logger.info(f"Worker {worker_id} running job {job.id} ({job.job_type.value}), attempt {job.attempts}/{job.max_attempts}")
+        heartbeat_stop = threading.Event()
+        heartbeat = threading.Thread(target=_send_heartbeats, args=(job.id, worker_id, heartbeat_stop), daemon=True)
+        heartbeat.start()
+        progress = TaskProgressPublisher(job.id)
+        progress.status(TaskStatusEnum.IN_PROGRESS, f"attempt {job.attempts}/{job.max_attempts}")
+        profiler = StageProfiler(
+            job.job_type.value,
+            profile_path(f"{job.job_type.value}-task{job.id}-attempt{job.attempts}") if job.payload.get("profile") else None,
+        )
+        try:
+            # One session per job: a failed job's transaction is rolled back and discarded with it
+            with UnitOfWork() as uow:
+                handlers[job.job_type](job.id, job.payload, data_service, uow.tasks, worker_id, profiler)
+            logger.info(f"Worker {worker_id} completed job {job.id}")
+        except Exception as e:
+            status = task_repository.retry_or_fail(job.id, worker_id, str(e), profiler.timings())
+            logger.error(f"Worker {worker_id} failed job {job.id}: {e} (now {status})")
+            if status is not None:
+                progress.status(status, str(e))
+        finally:
+            heartbeat_stop.set()
+            heartbeat.join()
+
+    logger.info(f"Worker {worker_id} stopped")
+
+
+def _send_heartbeats(task_id: int, worker_id: str, stop_event: threading.Event):
+    from app.persistence.repositories.task_status_repository import TaskStatusRepository
+
+    # Not bound to the job's unit of work, so every heartbeat runs in a short session of its own
+    repository = TaskStatusRepository()
+    try:
+        while not stop_event.wait(settings.job_heartbeat_interval_seconds):
+            if not repository.heartbeat(task_id, worker_id):
+                # The job keeps running, but complete_job() will refuse to store its result
+                logger.warning(f"Worker {worker_id} lost the lock on job {task_id}")
+                return
+    except Exception as e:
+        logger.error(f"Heartbeat for job {task_id} failed: {e}")
+
+
+def recover_orphaned_jobs():
+    from app.persistence.repositories.task_status_repository import TaskStatusRepository
+
+    recovered = TaskStatusRepository().recover_orphaned_jobs(
+        datetime.timedelta(seconds=settings.job_heartbeat_timeout_seconds)
+    )
+    if recovered:
+        logger.warning(f"Requeued {recovered} orphaned job(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the job worker pool.")
+    parser.add_argument("--concurrency", type=int, default=settings.worker_concurrency,
+                        help="Number of job-executing processes.")
+    args = parser.parse_args()
+
+    configure_logging()
+    # Spawned children re-import the application instead of inheriting the parent's DB connections
+    context = multiprocessing.get_context("spawn")
+    stop_event = context.Event()
+    host = f"{socket.gethostname()}-{os.getpid()}"
+
+    def shutdown(signum, frame):
+        logger.info("Shutting down worker pool")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    processes: dict[int, multiprocessing.Process] = {}
+    recovery_interval = settings.job_heartbeat_timeout_seconds / 2
+    last_recovery = 0.0
+
+    while not stop_event.is_set():
+        for slot in range(args.concurrency):
+            process = processes.get(slot)
+            if process is None or not process.is_alive():
+                if process is not None:
+                    logger.warning(f"Worker process {process.name} exited with code {process.exitcode}, restarting")
+                process = context.Process(target=run_job_loop, args=(f"{host}-{slot}", stop_event),
+                                          name=f"worker-{slot}")
+                process.start()
+                processes[slot] = process
+
+        if time.monotonic() - last_recovery >= recovery_interval:
+            try:
+                recover_orphaned_jobs()
+            except Exception as e:
+                logger.error(f"Orphaned job recovery failed: {e}")
+            last_recovery = time.monotonic()
+
+        stop_event.wait(1.0)
+
+    for process in processes.values():
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Measures requests per second of authenticated GET /task-status/{id} through the auth middleware.
+
+Compares the previous BaseHTTPMiddleware implementation with the pure ASGI one and its token cache.
+Requests are sent straight to the ASGI app, with a stub endpoint, so only the middleware stack is timed.
+
+Usage:
+    python benchmarks/bench_auth_middleware.py --requests 20000
+
+The application settings are loaded, so DATABASE_URL and SECRET_KEY must be set (any value will do).
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from fastapi import HTTPException
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.middleware.auth_middleware import AuthMiddleware, jwt_service  # noqa: E402
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    """The previous implementation, without its print() calls."""
+    async def dispatch(self, request: Request, call_next):
+        public_paths = ["/favicon.ico", "/docs", "/openapi.json", "/auth/token", "/auth/login", "/auth/register"]
+        if any(request.url.path.startswith(path) for path in public_paths):
+            return await call_next(request)
+
+        auth_header = request.headers.get("Authorization")
+        if auth_header:
+            token_type, token = auth_header.split(" ")
+            if token_type.lower() != "bearer":
+                raise HTTPException(status_code=401, detail="Invalid token type")
+            payload = jwt_service.verify_token(token)
+            if payload is None:
+                raise HTTPException(status_code=401, detail="Invalid or expired token")
+            request.state.user = payload
+        else:
+            request.state.user = None
+        return await call_next(request)
+
+
+async def task_status(request: Request):
+    return JSONResponse({"task_id": int(request.path_params["task_id"]), "status": "in-progress"})
+
+
+def make_app(middleware_class) -> Starlette:
+    app = Starlette(routes=[Route("/task-status/{task_id}", task_status)])
+    app.add_middleware(middleware_class)
+    return app
+
+
+async def run(app, requests: int, token: str) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/task-status/1", "raw_path": b"/task-status/1", "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"testserver"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 1234), "server": ("testserver", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return requests / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--output", help="Optional path of a JSON file to write the results to.")
+    args = parser.parse_args()
+
+    token = jwt_service.create_access_token({"sub": "1", "username": "benchmark"})
+    results = {}
+    for name, middleware_class in [("base_http_middleware", LegacyAuthMiddleware), ("asgi_cached", AuthMiddleware)]:
+        app = make_app(middleware_class)
+        asyncio.run(run(app, min(1_000, args.requests), token))  # warm-up
+        results[name] = asyncio.run(run(app, args.requests, token))
+        print(f"{name}: {results[name]:.0f} requests/s")
+    results["speedup"] = results["asgi_cached"] / results["base_http_middleware"]
+    print(f"speedup: {results['speedup']:.2f}x")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
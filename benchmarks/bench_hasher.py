@@ -0,0 +1,79 @@
+"""
+Compares the batched Hasher against the original per-cell anonymization.
+
+Usage:
+    python benchmarks/bench_hasher.py --rows 1000000 --cardinality 0.1 0.5 1.0
+
+The application settings are loaded, so DATABASE_URL and SECRET_KEY must be set (any value will do).
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.use_cases.services.hasher import Hasher  # noqa: E402
+
+
+def anonymize_per_cell(data: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """The previous implementation: one sha256 call per cell through Series.apply."""
+    for column in columns:
+        if column in data.columns:
+            data[column] = data[column].apply(lambda x: hashlib.sha256(str(x).encode()).hexdigest())
+    return data
+
+
+def make_frame(rows: int, cardinality: float, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    distinct = max(1, int(rows * cardinality))
+    values = np.char.add("passenger-", rng.integers(0, distinct, size=rows).astype(str))
+    return pd.DataFrame({"name": values.astype(object)})
+
+
+def timed(fn, data: pd.DataFrame) -> float:
+    started = time.perf_counter()
+    fn(data.copy(), ["name"])
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--cardinality", type=float, nargs="+", default=[0.01, 0.5, 1.0],
+                        help="Ratio of distinct values to rows.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Optional path of a JSON file to write the results to.")
+    args = parser.parse_args()
+
+    implementations = {
+        "per_cell": anonymize_per_cell,
+        "batched": Hasher(max_workers=1).anonymize_data,
+        "batched_hmac": Hasher(key="benchmark", max_workers=1).anonymize_data,
+        "batched_parallel": Hasher(max_workers=args.workers, parallel_threshold=1).anonymize_data,
+    }
+
+    results = []
+    for cardinality in args.cardinality:
+        data = make_frame(args.rows, cardinality, args.seed)
+        row = {"rows": args.rows, "cardinality": cardinality}
+        for name, fn in implementations.items():
+            row[name] = timed(fn, data)
+        row["speedup"] = row["per_cell"] / min(row["batched"], row["batched_parallel"])
+        results.append(row)
+        print(" | ".join(f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                         for key, value in row.items()))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Import time and memory of the application entry points, in fresh interpreters.
+
+Each module is imported ``--repeat`` times, each time in a new Python process, which reports how long the
+import took, its peak RSS and which ML packages (sdv, sdmetrics, torch, sklearn, ...) it loaded. The API and
+service modules must not load any of them: they are imported on first use, or up front by the job workers
+through ``preload_ml_modules``, whose cost is measured as the ``preload`` case.
+
+A module that loads an ML package is reported as a regression. With ``--baseline``, the median import time
+and the peak RSS are also compared with a previous run, and a metric that got worse by more than
+``--tolerance`` is reported as a regression (exit code 1).
+
+Usage:
+    python benchmarks/bench_import_time.py --output imports.json
+    python benchmarks/bench_import_time.py --baseline imports.json --tolerance 0.25
+
+The application settings are loaded, so DATABASE_URL and SECRET_KEY must be set (any value will do).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+DEFAULT_MODULES = [
+    "app.core.config",
+    "app.persistence.repositories.synthetic_data_repository",
+    "app.use_cases.services.data_service",
+    "app.use_cases.tasks.data_tasks",
+    "app.presentation.controllers.auth_controller",
+    "app.presentation.controllers.synthetic_data_controller",
+]
+
+# Run in the child process: import the module, then report what it cost
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - started
+from app.utils.lazy_imports import loaded_ml_packages
+from app.utils.stage_profiler import peak_rss_bytes
+print(json.dumps({{"seconds": seconds, "peak_rss_bytes": peak_rss_bytes(), "ml_packages": loaded_ml_packages(),
+                  "modules": len(sys.modules)}}))
+"""
+
+PRELOAD_STATEMENT = "from app.utils.lazy_imports import preload_ml_modules; preload_ml_modules()"
+
+# Metrics compared with the baseline; lower is better for both
+COMPARED_METRICS = ("median_seconds", "peak_rss_bytes")
+
+
+def measure(statement: str, repeat: int) -> dict:
+    runs = []
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, "-c", PROBE.format(root=ROOT, statement=statement)],
+                                   capture_output=True, text=True, cwd=ROOT)
+        if completed.returncode != 0:
+            return {"error": completed.stderr.strip().splitlines()[-1]}
+        runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return {
+        "median_seconds": statistics.median(run["seconds"] for run in runs),
+        "max_seconds": max(run["seconds"] for run in runs),
+        "peak_rss_bytes": max(run["peak_rss_bytes"] for run in runs),
+        "modules": runs[-1]["modules"],
+        "ml_packages": runs[-1]["ml_packages"],
+    }
+
+
+def find_regressions(results: dict, baseline: dict | None, tolerance: float) -> list[str]:
+    regressions = [
+        f"{case} loads {', '.join(metrics['ml_packages'])} at import"
+        for case, metrics in results["cases"].items()
+        if case != "preload" and metrics.get("ml_packages")
+    ]
+    for case, metrics in results["cases"].items():
+        previous = (baseline or {}).get("cases", {}).get(case)
+        if previous is None or "error" in metrics or "error" in previous:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = previous.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > tolerance:
+                regressions.append(f"{case} {metric}: {old:.4g} -> {new:.4g} ({change:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-preload", action="store_true", help="Skip measuring preload_ml_modules.")
+    parser.add_argument("--output", help="Optional path of a JSON file to write the results to.")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Relative change of a metric reported as a regression.")
+    args = parser.parse_args()
+
+    cases = {module: f"import {module}" for module in args.modules}
+    if not args.no_preload:
+        cases["preload"] = PRELOAD_STATEMENT
+
+    results = {"python": sys.version.split()[0], "repeat": args.repeat, "cases": {}}
+    for case, statement in cases.items():
+        results["cases"][case] = measure(statement, args.repeat)
+        print(f"{case}: {json.dumps(results['cases'][case])}", flush=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
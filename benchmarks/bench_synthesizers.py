@@ -0,0 +1,244 @@
+"""
+Fit, sample and evaluation throughput of every synthesizer type, on tested.csv scaled up and widened.
+
+For each scale factor (rows = factor x the rows of tested.csv, with jittered numerical values) and each
+number of extra columns, the dataset goes through the same cleaning and anonymization as the API. Then every
+SynthesizerType from SynthesizerFactory is fitted, sampled and evaluated. Each case runs in a fresh process,
+so the peak RSS reported for it is its own. GAN synthesizers are fitted for ``--epochs`` epochs to keep
+large scales tractable.
+
+Optionally, ``--base-url`` also measures end-to-end latency of a running API. Start it against a
+throwaway database, e.g. DATABASE_URL=sqlite:///bench.db or a local Postgres.
+
+Results are written as JSON. With ``--baseline``, they are compared with a previous run, and a metric that
+got worse by more than ``--tolerance`` is reported as a regression (exit code 1).
+
+Usage:
+    python benchmarks/bench_synthesizers.py --scales 1 10 100 1000 --extra-columns 0 20 --output bench.json
+    python benchmarks/bench_synthesizers.py --scales 1 10 --baseline bench.json
+    python benchmarks/bench_synthesizers.py --scales 1 --base-url http://localhost:8000 --token $TOKEN
+
+The application settings are loaded, so DATABASE_URL and SECRET_KEY must be set (any value will do).
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.config import settings  # noqa: E402
+from app.entities.evaluation import EvaluationMode, EvaluationOptions  # noqa: E402
+from app.entities.synthetic_data import SynthesizerType  # noqa: E402
+
+GAN_SYNTHESIZERS = {SynthesizerType.ctgan, SynthesizerType.copulagan}
+
+# Metrics compared with the baseline, and whether higher is better
+COMPARED_METRICS = {
+    "preprocess_seconds": False,
+    "fit_seconds": False,
+    "sample_rows_per_second": True,
+    "evaluate_seconds": False,
+    "peak_rss_bytes": False,
+}
+
+
+def make_dataset(source: pd.DataFrame, scale: int, extra_columns: int, seed: int) -> pd.DataFrame:
+    """``scale`` copies of the source rows with jittered numbers, plus ``extra_columns`` synthetic columns."""
+    rng = np.random.default_rng(seed)
+    data = pd.concat([source] * scale, ignore_index=True)
+    if scale > 1:
+        for column in ("Age", "Fare"):
+            noise = rng.normal(0, data[column].std() * 0.05, len(data))
+            data[column] = (data[column] + noise).clip(lower=0).round(2)
+    if "PassengerId" in data.columns:
+        data["PassengerId"] = np.arange(1, len(data) + 1)
+
+    for index in range(extra_columns):
+        if index % 2 == 0:
+            data[f"extra_num_{index}"] = rng.normal(index, 1.0 + index, len(data)).round(3)
+        else:
+            data[f"extra_cat_{index}"] = rng.choice([f"c{value}" for value in range(5 + index)], len(data))
+    return data
+
+
+def run_case(csv_path: str, synthesizer_type: str, sample_rows: int, epochs: int, evaluation_mode: str,
+             seed: int) -> dict:
+    """One fit / sample / evaluate run; executed in a fresh process."""
+    from sdv.metadata import SingleTableMetadata
+
+    from app.persistence.repositories.synthetic_data_repository import SyntheticDataRepository
+    from app.use_cases.evaluators.evaluators import Evaluator
+    from app.use_cases.factories.factories import SynthesizerFactory
+    from app.use_cases.services.dataset_registry import DatasetRegistry, DatasetVariant
+    from app.use_cases.services.hasher import Hasher
+    from app.utils.stage_profiler import StageProfiler
+
+    synthesizer_type = SynthesizerType(synthesizer_type)
+    np.random.seed(seed)
+    try:
+        import torch
+        torch.manual_seed(seed)
+    except ImportError:
+        pass
+    profiler = StageProfiler("benchmark")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        registry = DatasetRegistry(SyntheticDataRepository().get_all_data_records_from_csv, Hasher(), cache_dir)
+        with profiler.stage("preprocess"):
+            data = registry.get_frame(csv_path, DatasetVariant.ANONYMIZED)
+
+    with profiler.stage("detect_metadata"):
+        metadata = SingleTableMetadata()
+        metadata.detect_from_dataframe(data)
+
+    hyperparameters = {"epochs": epochs} if synthesizer_type in GAN_SYNTHESIZERS else {}
+    synthesizer = SynthesizerFactory.get_synthesizer(synthesizer_type, metadata, **hyperparameters)
+    with profiler.stage("fit"):
+        synthesizer.fit(data)
+    with profiler.stage("sample"):
+        synthetic_data = synthesizer.sample(num_rows=sample_rows)
+
+    options = EvaluationOptions(mode=EvaluationMode(evaluation_mode), seed=seed)
+    with profiler.stage("evaluate"):
+        scores = Evaluator.evaluate_data_quality(synthetic_data, data, metadata, options)
+
+    timings = profiler.timings()
+    return {
+        "rows": len(data),
+        "columns": len(data.columns),
+        "preprocess_seconds": timings["preprocess"]["wall_seconds"],
+        "detect_metadata_seconds": timings["detect_metadata"]["wall_seconds"],
+        "fit_seconds": timings["fit"]["wall_seconds"],
+        "fit_cpu_seconds": timings["fit"]["cpu_seconds"],
+        "sample_rows_per_second": sample_rows / timings["sample"]["wall_seconds"],
+        "evaluate_seconds": timings["evaluate"]["wall_seconds"],
+        "overall_score": float(scores["Overall Score"]),
+        "peak_rss_bytes": max(timing["peak_rss_bytes"] for timing in timings.values()),
+    }
+
+
+def run_api(base_url: str, token: str | None, synthesizer_type: SynthesizerType, requests: int) -> dict:
+    """Latency of POST /generate/ followed by POST /evaluate/ on a running API."""
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    def post(path: str) -> dict:
+        request = urllib.request.Request(f"{base_url.rstrip('/')}{path}", data=b"", headers=headers, method="POST")
+        with urllib.request.urlopen(request, timeout=3600) as response:
+            return json.loads(response.read())
+
+    latencies = {"generate": [], "evaluate": []}
+    for _ in range(requests):
+        started = time.perf_counter()
+        synthetic_data_id = post(f"/generate/?synthesizer_type={synthesizer_type.value}")["id"]
+        latencies["generate"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        post(f"/evaluate/?synthetic_data_id={synthetic_data_id}&mode=sampled")
+        latencies["evaluate"].append(time.perf_counter() - started)
+
+    return {
+        f"{endpoint}_{name}_seconds": value
+        for endpoint, values in latencies.items()
+        for name, value in (("median", statistics.median(values)), ("max", max(values)))
+    }
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for case, metrics in results["cases"].items():
+        previous = baseline.get("cases", {}).get(case)
+        if previous is None or "error" in metrics or "error" in previous:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = previous.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(f"{case} {metric}: {old:.4g} -> {new:.4g} ({change:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default=settings.csv, help="Source dataset, tested.csv by default.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--extra-columns", type=int, nargs="+", default=[0])
+    parser.add_argument("--synthesizers", nargs="+", default=[t.value for t in SynthesizerType],
+                        choices=[t.value for t in SynthesizerType])
+    parser.add_argument("--sample-rows", type=int, default=10_000)
+    parser.add_argument("--epochs", type=int, default=10, help="Epochs of the GAN synthesizers.")
+    parser.add_argument("--evaluation-mode", choices=[m.value for m in EvaluationMode],
+                        default=EvaluationMode.SAMPLED.value)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--base-url", help="Also measure end-to-end latency of the API running at this URL.")
+    parser.add_argument("--token", help="Bearer token sent to the API.")
+    parser.add_argument("--api-requests", type=int, default=5)
+    parser.add_argument("--output", help="Optional path of a JSON file to write the results to.")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Relative change of a metric reported as a regression.")
+    args = parser.parse_args()
+
+    source = pd.read_csv(args.csv)
+    results = {
+        "environment": {"python": platform.python_version(), "platform": platform.platform(),
+                        "cpus": os.cpu_count()},
+        "parameters": {key: value for key, value in vars(args).items()
+                       if key not in ("token", "output", "baseline")},
+        "cases": {},
+    }
+    context = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        for scale in args.scales:
+            for extra_columns in args.extra_columns:
+                csv_path = os.path.join(data_dir, f"tested-x{scale}-w{extra_columns}.csv")
+                make_dataset(source, scale, extra_columns, args.seed).to_csv(csv_path, index=False)
+
+                for synthesizer_type in args.synthesizers:
+                    case = f"{synthesizer_type}/x{scale}/w{extra_columns}"
+                    # A process per case, so that each peak RSS is measured from a clean interpreter
+                    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                        try:
+                            metrics = executor.submit(run_case, csv_path, synthesizer_type, args.sample_rows,
+                                                      args.epochs, args.evaluation_mode, args.seed).result()
+                        except Exception as e:
+                            metrics = {"error": repr(e)}
+                    results["cases"][case] = metrics
+                    print(f"{case}: {json.dumps(metrics)}", flush=True)
+
+    if args.base_url:
+        results["api"] = {
+            synthesizer_type: run_api(args.base_url, args.token, SynthesizerType(synthesizer_type),
+                                      args.api_requests)
+            for synthesizer_type in args.synthesizers
+        }
+        print(f"api: {json.dumps(results['api'])}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
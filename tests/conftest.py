@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The settings require these at import time; the tests that need a database bring their own
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
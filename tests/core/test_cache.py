@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+from app.core.cache import InMemoryCache
+from app.core.metrics import CACHE_REQUESTS
+
+
+def lookups(cache: str, result: str) -> float:
+    return CACHE_REQUESTS.labels(cache=cache, result=result)._value.get()
+
+
+def test_in_memory_cache_evicts_the_least_recently_used_entry():
+    cache = InMemoryCache("test-lru", max_entries=2)
+
+    async def scenario():
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")
+        await cache.set("c", "3")
+        return [await cache.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(scenario()) == ["1", None, "3"]
+
+
+def test_entries_expire_and_can_be_deleted():
+    cache = InMemoryCache("test-expiry", max_entries=10)
+
+    async def scenario():
+        await cache.set("short", "1", ttl_seconds=0.01)
+        await cache.set("forever", "2")
+        await cache.set("deleted", "3")
+        await cache.delete("deleted")
+        time.sleep(0.02)
+        return [await cache.get(key) for key in ("short", "forever", "deleted")]
+
+    assert asyncio.run(scenario()) == [None, "2", None]
+
+
+def test_hits_and_misses_are_counted():
+    cache = InMemoryCache("test-metrics", max_entries=10)
+
+    async def scenario():
+        await cache.get("key")
+        await cache.set("key", "value")
+        await cache.get("key")
+        await cache.get("key")
+
+    asyncio.run(scenario())
+    assert (lookups("test-metrics", "hit"), lookups("test-metrics", "miss")) == (2, 1)
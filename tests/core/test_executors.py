@@ -0,0 +1,23 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.executors import BoundedExecutor, ExecutorSaturatedError
+
+
+def test_calls_beyond_the_queue_limit_are_rejected():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.create_task(executor.run("wait", release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run("wait", release.wait)
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+        # Slots are released once the calls complete
+        assert await executor.run("add", sum, [1, 2]) == 3
+
+    asyncio.run(scenario())
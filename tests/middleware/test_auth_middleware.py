@@ -0,0 +1,68 @@
+import time
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.middleware import auth_middleware
+from app.middleware.auth_middleware import AuthMiddleware, VerifiedTokenCache, jwt_service
+
+
+async def whoami(request: Request):
+    return JSONResponse({"user": request.state.user})
+
+
+async def login(request: Request):
+    return JSONResponse({})
+
+
+@pytest.fixture
+def client():
+    app = Starlette(routes=[Route("/task-status/1", whoami), Route("/auth/login", login)])
+    app.add_middleware(AuthMiddleware)
+    return TestClient(app)
+
+
+def test_verified_tokens_are_decoded_once(client, monkeypatch):
+    calls = []
+    verify_token = jwt_service.verify_token
+    monkeypatch.setattr(auth_middleware.jwt_service, "verify_token", 
+                        lambda token: calls.append(token) or verify_token(token))
+    token = jwt_service.create_access_token({"sub": "1", "username": "alice"})
+
+    for _ in range(3):
+        response = client.get("/task-status/1", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        assert response.json()["user"]["username"] == "alice"
+    assert len(calls) == 1
+
+
+def test_invalid_tokens_are_rejected_with_401(client):
+    assert client.get("/task-status/1", headers={"Authorization": "Bearer nope"}).status_code == 401
+    assert client.get("/task-status/1", headers={"Authorization": "Basic abc"}).status_code == 401
+
+
+def test_public_paths_and_anonymous_requests_pass_through(client):
+    assert client.get("/auth/login", headers={"Authorization": "Bearer nope"}).status_code == 200
+    assert client.get("/task-status/1").json() == {"user": None}
+
+
+def test_cached_tokens_expire_with_their_exp_claim():
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=3600)
+    cache.put("expired", {"exp": time.time() - 1})
+    cache.put("expiring", {"exp": time.time() + 0.05})
+    assert cache.get("expired") is None
+    assert cache.get("expiring") is not None
+    time.sleep(0.06)
+    assert cache.get("expiring") is None
+
+
+def test_cache_is_bounded():
+    cache = VerifiedTokenCache(max_entries=2, ttl_seconds=3600)
+    for token in ["a", "b", "c"]:
+        cache.put(token, {})
+    assert cache.get("a") is None
+    assert cache.get("c") == {}
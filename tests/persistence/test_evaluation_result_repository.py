@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from app.db.base import Base
+from app.db.session import engine
+from app.persistence.repositories.evaluation_result_repository import EvaluationResultRepository
+from app.persistence.repositories.synthetic_data_repository import SyntheticDataRepository
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    Base.metadata.create_all(engine)
+    yield
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def synthetic_data_id():
+    data = pd.DataFrame({"age": [1.0, 2.0], "sex": ["f", "m"]})
+    return SyntheticDataRepository().save_synthetic_data("gaussiancopula", data, "[]").id
+
+
+def test_evaluations_are_keyed_by_data_suite_and_options(synthetic_data_id):
+    repository = EvaluationResultRepository()
+    identity = (synthetic_data_id, "abc:anonymized", "1+sdmetrics-0.15.1", '{"mode":"full"}')
+    details = {"Column Shapes": [{"Column": "age", "Metric": "KSComplement", "Score": None}]}
+
+    assert repository.get_evaluation_result(*identity) is None
+    repository.save_evaluation_result(*identity, {"Overall Score": 0.8}, details, 1.5)
+
+    stored = repository.get_evaluation_result(*identity)
+    assert stored.scores == {"Overall Score": 0.8}
+    assert stored.details == details
+    assert stored.options == {"mode": "full"}
+    assert repository.get_evaluation_result(synthetic_data_id, "def:anonymized", *identity[2:]) is None
+    assert repository.get_evaluation_result(*identity[:2], "2+sdmetrics-0.15.1", identity[3]) is None
+
+
+def test_saving_again_replaces_the_evaluation(synthetic_data_id):
+    repository = EvaluationResultRepository()
+    identity = (synthetic_data_id, "abc:anonymized", "1+sdmetrics-0.15.1", '{"mode":"full"}')
+
+    repository.save_evaluation_result(*identity, {"Overall Score": 0.8}, {})
+    repository.save_evaluation_result(*identity, {"Overall Score": 0.9}, {})
+
+    assert repository.get_evaluation_result(*identity).scores == {"Overall Score": 0.9}
@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from app.db.base import Base
+from app.db.session import engine
+from app.persistence.repositories.synthetic_data_repository import SyntheticDataRepository
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    Base.metadata.create_all(engine)
+    yield
+    Base.metadata.drop_all(engine)
+
+
+def test_batch_save_returns_ids_in_order_and_round_trips(monkeypatch):
+    monkeypatch.setattr("app.core.config.settings.synthetic_data_chunk_rows", 2)
+    datasets = [pd.DataFrame({"age": [float(i)] * (i + 1), "sex": ["f"] * (i + 1)}) for i in range(4)]
+    repository = SyntheticDataRepository()
+
+    ids = repository.save_synthetic_data_batch("gaussiancopula", datasets, "[]")
+
+    assert len(ids) == len(set(ids)) == 4
+    for synthetic_data_id, expected in zip(ids, datasets):
+        assert repository.get_synthetic_data_by_id(synthetic_data_id).row_count == len(expected)
+        pd.testing.assert_frame_equal(repository.get_synthetic_dataframe(synthetic_data_id), expected)
+
+
+@pytest.fixture
+def stored_dataset(monkeypatch):
+    monkeypatch.setattr("app.core.config.settings.synthetic_data_chunk_rows", 3)
+    data = pd.DataFrame({"pclass": [1, 3, 1, 2, 1, 1, 3, 1], "age": [float(i) for i in range(8)],
+                         "sex": list("fmfmffmf")})
+    synthetic_data_id = SyntheticDataRepository().save_synthetic_data("ctgan", data, "[]").id
+    return synthetic_data_id, data
+
+
+def test_metadata_lists_the_columns_without_reading_rows(stored_dataset):
+    synthetic_data_id, data = stored_dataset
+    metadata = SyntheticDataRepository().get_synthetic_data_metadata(synthetic_data_id)
+    assert metadata.row_count == 8
+    assert [column["name"] for column in metadata.columns] == list(data.columns)
+    assert SyntheticDataRepository().get_synthetic_data_metadata(synthetic_data_id + 1) is None
+
+
+def test_filtered_reads_paginate_over_the_matching_rows(stored_dataset):
+    synthetic_data_id, data = stored_dataset
+    matching = data[(data.pclass == 1) & (data.age >= 2)][["age"]].reset_index(drop=True)
+
+    page = SyntheticDataRepository().get_filtered_dataframe(
+        synthetic_data_id, [("pclass", "eq", "1"), ("age", "ge", "2")], columns=["age"], offset=1, limit=2
+    )
+    pd.testing.assert_frame_equal(page, matching.iloc[1:3].reset_index(drop=True))
+
+
+def test_invalid_filters_are_rejected(stored_dataset):
+    synthetic_data_id, _ = stored_dataset
+    with pytest.raises(ValueError):
+        SyntheticDataRepository().get_filtered_dataframe(synthetic_data_id, [("pclass", "eq", "first")])
@@ -0,0 +1,58 @@
+import datetime
+
+import pytest
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.models import DBTaskStatus
+from app.db.session import engine
+from app.entities.task_status import JobType, TaskStatusEnum
+from app.persistence.repositories.result_repository import ResultRepository
+from app.persistence.repositories.task_status_repository import TaskStatusRepository
+
+
+@pytest.fixture
+def repository():
+    Base.metadata.create_all(engine)
+    yield TaskStatusRepository()
+    Base.metadata.drop_all(engine)
+
+
+def test_complete_job_stores_the_result_of_the_lock_holder(repository):
+    task_id = repository.enqueue_job("train", JobType.AUGMENT_AND_TRAIN, {}, max_attempts=3)
+    repository.claim_next_job("worker-1")
+
+    assert repository.complete_job(task_id, "worker-1", 0.8)
+
+    task = repository.get_task(task_id)
+    assert task.status == TaskStatusEnum.COMPLETED
+    assert task.locked_by is None
+    assert ResultRepository().get_result_by_task_id(task_id).accuracy == 0.8
+
+
+def test_complete_job_is_refused_after_the_lock_was_lost(repository):
+    task_id = repository.enqueue_job("train", JobType.AUGMENT_AND_TRAIN, {}, max_attempts=3)
+    repository.claim_next_job("worker-1")
+    repository.recover_orphaned_jobs(datetime.timedelta(seconds=-1))
+
+    assert not repository.complete_job(task_id, "worker-1", 0.8)
+    assert repository.get_task(task_id).status == TaskStatusEnum.QUEUED
+    assert ResultRepository().get_result_by_task_id(task_id) is None
+
+
+def test_release_backs_off_exponentially_then_fails():
+    task = DBTaskStatus(attempts=1, max_attempts=3, locked_by="worker-1")
+
+    started = datetime.datetime.utcnow()
+    assert TaskStatusRepository._release(task, "boom") == TaskStatusEnum.QUEUED
+    assert task.locked_by is None
+    assert task.available_at - started >= datetime.timedelta(seconds=settings.job_retry_backoff_seconds)
+
+    task.attempts = 2
+    started = datetime.datetime.utcnow()
+    TaskStatusRepository._release(task, "boom")
+    assert task.available_at - started >= datetime.timedelta(seconds=2 * settings.job_retry_backoff_seconds)
+
+    task.attempts = 3
+    assert TaskStatusRepository._release(task, "boom") == TaskStatusEnum.FAILED
+    assert task.error == "boom"
@@ -0,0 +1,33 @@
+import pytest
+
+from app.db.base import Base
+from app.db.session import engine
+from app.entities.task_status import TaskStatusEnum
+from app.persistence.repositories.task_status_repository import TaskStatusRepository
+from app.persistence.unit_of_work import UnitOfWork
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    Base.metadata.create_all(engine)
+    yield
+    Base.metadata.drop_all(engine)
+
+
+def test_unit_of_work_rolls_back_uncommitted_changes_when_it_raises():
+    task_id = TaskStatusRepository().create_task("train")
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork() as uow:
+            uow.tasks.get_task(task_id).status = TaskStatusEnum.FAILED
+            uow.session.flush()
+            raise RuntimeError("job failed")
+
+    assert TaskStatusRepository().get_task_status(task_id) == TaskStatusEnum.QUEUED
+
+
+def test_repositories_of_a_unit_of_work_share_its_session():
+    with UnitOfWork() as uow:
+        task_id = uow.tasks.create_task("train")
+        uow.results.create_result(task_id, 0.5)
+        assert uow.results.get_result_by_task_id(task_id) in uow.session
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.use_cases.services.augmentation_evaluation import cross_validate_augmentation, synthetic_rows_needed
+
+
+def make_rows(count: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    age = rng.uniform(0, 80, count)
+    pclass = rng.integers(1, 4, count)
+    return pd.DataFrame({"age": age, "pclass": pclass, "survived": ((age < 30) ^ (pclass == 3)).astype(int)})
+
+
+REAL = make_rows(60, seed=1)
+SYNTHETIC = make_rows(synthetic_rows_needed(len(REAL), [0, 2], tstr=True), seed=2)
+
+
+def test_folds_hold_out_real_rows_only():
+    scores = cross_validate_augmentation(REAL, SYNTHETIC, "survived", [0, 2], folds=3, tstr=True, n_jobs=1)
+
+    for summary in [*scores["augmentation"].values(), scores["tstr"]]:
+        assert [fold["fold"] for fold in summary["folds"]] == [0, 1, 2]
+        assert sum(fold["test_rows"] for fold in summary["folds"]) == len(REAL)
+        assert summary["mean"] == pytest.approx(np.mean([fold["accuracy"] for fold in summary["folds"]]))
+        assert all(fold["fit_seconds"] >= 0 for fold in summary["folds"])
+
+    baseline, augmented = scores["augmentation"]["0"]["folds"][0], scores["augmentation"]["2"]["folds"][0]
+    assert baseline["synthetic_rows"] == 0
+    assert augmented["synthetic_rows"] == 2 * augmented["real_train_rows"]
+    tstr = scores["tstr"]["folds"][0]
+    assert tstr["real_train_rows"] == 0 and tstr["synthetic_rows"] == baseline["real_train_rows"]
+
+
+def test_parallel_folds_give_the_same_scores():
+    sequential = cross_validate_augmentation(REAL, SYNTHETIC, "survived", [0, 2], folds=3, tstr=True, n_jobs=1)
+    parallel = cross_validate_augmentation(REAL, SYNTHETIC, "survived", [0, 2], folds=3, tstr=True, n_jobs=2)
+
+    def accuracies(scores):
+        return {name: [fold["accuracy"] for fold in summary["folds"]]
+                for name, summary in [*scores["augmentation"].items(), ("tstr", scores["tstr"])]}
+
+    assert accuracies(parallel) == accuracies(sequential)
+
+
+def test_too_few_synthetic_rows_are_rejected():
+    with pytest.raises(ValueError, match="synthetic rows"):
+        cross_validate_augmentation(REAL, SYNTHETIC.iloc[:10], "survived", [2], folds=3, tstr=False, n_jobs=1)
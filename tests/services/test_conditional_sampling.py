@@ -0,0 +1,29 @@
+import pandas as pd
+import pytest
+
+from app.use_cases.services.conditional_sampling import group_slices, slice_counts
+
+COLUMNS = ["pclass", "sex", "age"]
+
+
+def test_identical_slices_are_grouped_and_their_quotas_added():
+    slices = [
+        {"conditions": {"pclass": 1, "sex": "female"}, "num_rows": 10},
+        {"conditions": {"Sex": "female", "PClass": 1}, "num_rows": 5},
+        {"conditions": {"pclass": 3}, "num_rows": 7},
+    ]
+    assert group_slices(slices, COLUMNS) == [
+        {"conditions": {"pclass": 1, "sex": "female"}, "num_rows": 15},
+        {"conditions": {"pclass": 3}, "num_rows": 7},
+    ]
+
+
+def test_unknown_condition_columns_are_rejected():
+    with pytest.raises(ValueError, match="cabin"):
+        group_slices([{"conditions": {"cabin": "C85"}, "num_rows": 1}], COLUMNS)
+
+
+def test_slice_counts_report_the_rows_matching_each_slice():
+    data = pd.DataFrame({"pclass": [1, 1, 3, 1], "sex": ["female", "male", "female", "female"]})
+    groups = [{"conditions": {"pclass": 1, "sex": "female"}, "num_rows": 3}, {"conditions": {"pclass": 2}, "num_rows": 1}]
+    assert [group["sampled_rows"] for group in slice_counts(data, groups)] == [2, 0]
@@ -0,0 +1,58 @@
+import os
+
+import pandas as pd
+
+from app.use_cases.services.dataset_registry import DatasetRegistry, DatasetVariant
+from app.use_cases.services.hasher import Hasher
+
+
+def make_registry(tmp_path) -> DatasetRegistry:
+    return DatasetRegistry(pd.read_csv, Hasher(key="", max_workers=1), str(tmp_path / "cache"))
+
+
+def write_csv(path, ages):
+    pd.DataFrame({"PassengerId": range(len(ages)), "Age": ages, "Name": ["a"] * len(ages)}).to_csv(path, index=False)
+
+
+def test_view_of_numeric_columns_is_backed_by_the_mapped_file(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    write_csv(csv_path, [1.5, 2.5, 3.5])
+    registry = make_registry(tmp_path)
+
+    view = registry.get_view(str(csv_path), DatasetVariant.ANONYMIZED)
+    frame = registry.get_frame(str(csv_path), DatasetVariant.ANONYMIZED)
+
+    assert not view["age"].to_numpy().flags.writeable
+    assert frame["age"].to_numpy().flags.writeable
+    pd.testing.assert_frame_equal(view, frame)
+
+
+def test_variants_are_rebuilt_when_the_source_changes(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    write_csv(csv_path, [1.0, 2.0])
+    registry = make_registry(tmp_path)
+    assert list(registry.get_view(str(csv_path), DatasetVariant.RAW)["age"]) == [1.0, 2.0]
+
+    write_csv(csv_path, [1.0, 2.0, 3.0])
+    assert list(registry.get_view(str(csv_path), DatasetVariant.RAW)["age"]) == [1.0, 2.0, 3.0]
+    # The variant of the previous content is removed
+    assert len([name for name in os.listdir(tmp_path / "cache") if name.endswith("-raw.feather")]) == 1
+
+
+def test_anonymized_variant_is_keyed_by_the_anonymization_key(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    write_csv(csv_path, [1.0])
+    cache_dir = str(tmp_path / "cache")
+    plain = DatasetRegistry(pd.read_csv, Hasher(key="", max_workers=1), cache_dir)
+    keyed = DatasetRegistry(pd.read_csv, Hasher(key="secret", max_workers=1), cache_dir)
+
+    assert plain.variant_tag(DatasetVariant.ANONYMIZED) != keyed.variant_tag(DatasetVariant.ANONYMIZED)
+    assert "secret" not in keyed.variant_tag(DatasetVariant.ANONYMIZED)
+    assert plain.variant_tag(DatasetVariant.ENCODED) == keyed.variant_tag(DatasetVariant.ENCODED)
+
+    plain.get_table(str(csv_path), DatasetVariant.ANONYMIZED)
+    keyed.get_table(str(csv_path), DatasetVariant.ANONYMIZED)
+    # The variant built with the previous key is replaced
+    files = [name for name in os.listdir(cache_dir) if "-anonymized" in name]
+    assert len(files) == 1
+    assert files[0].endswith(f"-{keyed.variant_tag(DatasetVariant.ANONYMIZED)}.feather")
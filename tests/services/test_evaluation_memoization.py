@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+from app.db.base import Base
+from app.db.session import engine
+from app.entities.evaluation import EvaluationMode, EvaluationOptions
+from app.persistence.repositories.synthetic_data_repository import SyntheticDataRepository
+from app.use_cases.services.data_service import DataService
+from app.use_cases.services.dataset_registry import DatasetRegistry
+from app.use_cases.services.hasher import Hasher
+
+
+@pytest.fixture(autouse=True)
+def tables():
+    Base.metadata.create_all(engine)
+    yield
+    Base.metadata.drop_all(engine)
+
+
+class CountingEvaluator:
+    def __init__(self):
+        self.calls = 0
+
+    @staticmethod
+    def suite_version() -> str:
+        return "test"
+
+    def evaluate_data_quality(self, synthetic_data, real_data, metadata, options=None, real_data_key=None):
+        self.calls += 1
+        return {"Overall Score": 0.5 + self.calls / 10,
+                "Details": {"Column Shapes": [{"Column": "age", "Metric": "KSComplement", "Score": 0.9}]}}
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    csv_path = tmp_path / "data.csv"
+    pd.DataFrame({"PassengerId": [1, 2], "Age": [20.0, 30.0], "Sex": ["f", "m"]}).to_csv(csv_path, index=False)
+    registry = DatasetRegistry(pd.read_csv, Hasher(key="", max_workers=1), str(tmp_path / "datasets"))
+    # The evaluation metadata comes from sdv, which the fake evaluator does not need
+    monkeypatch.setattr(DataService, "_evaluation_metadata", staticmethod(lambda columns: None))
+    return DataService(None, CountingEvaluator(), str(csv_path), synthesizer_cache=object(),
+                       dataset_registry=registry, model_registry=object())
+
+
+def test_evaluations_are_computed_once_and_then_served_from_the_store(service):
+    data = pd.DataFrame({"age": [21.0, 29.0], "sex": ["m", "f"]})
+    synthetic_data_id = SyntheticDataRepository().save_synthetic_data("gaussiancopula", data, "[]").id
+
+    first = service.evaluate_synthetic_data(synthetic_data_id)
+    second = service.evaluate_synthetic_data(synthetic_data_id)
+
+    assert service.evaluator.calls == 1
+    assert first == second == {"Overall Score": 0.6, "Details": {"Column Shapes": [
+        {"Column": "age", "Metric": "KSComplement", "Score": 0.9}]}}
+
+    # Other options are another evaluation, and refresh recomputes a stored one
+    service.evaluate_synthetic_data(synthetic_data_id, EvaluationOptions(mode=EvaluationMode.SAMPLED))
+    assert service.evaluate_synthetic_data(synthetic_data_id, refresh=True)["Overall Score"] == 0.8
+    assert service.evaluate_synthetic_data(synthetic_data_id)["Overall Score"] == 0.8
+    assert service.evaluator.calls == 3
+
+
+def test_missing_synthetic_data_is_not_stored(service):
+    with pytest.raises(ValueError):
+        service.evaluate_synthetic_data(404)
+    with pytest.raises(ValueError):
+        service.evaluate_synthetic_data(404)
+    assert service.evaluator.calls == 0
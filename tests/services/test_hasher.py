@@ -0,0 +1,38 @@
+import hashlib
+import hmac
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.use_cases.services.hasher import Hasher
+
+SERIES = [
+    pd.Series([1, 1.0, True, None, np.nan, "1", "a", "a"], dtype=object),
+    pd.Series([0.0, -0.0, 1.5, np.nan, 1e16]),
+    pd.Series([3, 1, 3, 2]),
+    pd.Series(["x", None, "y", "x"]),
+]
+
+
+def per_cell(series: pd.Series) -> list[str]:
+    """The previous implementation: sha256 of str() of every cell."""
+    return [hashlib.sha256(str(value).encode()).hexdigest() for value in series]
+
+
+@pytest.mark.parametrize("series", SERIES)
+def test_hash_series_matches_the_per_cell_digests(series):
+    assert list(Hasher(key="", max_workers=1).hash_series(series)) == per_cell(series)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_hashing_matches_the_serial_digests(executor):
+    series = pd.Series([f"passenger-{i % 500}" for i in range(2_000)])
+    hasher = Hasher(key="", max_workers=2, parallel_threshold=1, executor=executor)
+    assert list(hasher.hash_series(series)) == per_cell(series)
+
+
+def test_keyed_hashing_uses_hmac():
+    series = pd.Series(["a", "b", "a"])
+    expected = [hmac.new(b"secret", value.encode(), hashlib.sha256).hexdigest() for value in series]
+    assert list(Hasher(key="secret", max_workers=1).hash_series(series)) == expected
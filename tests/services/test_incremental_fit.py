@@ -0,0 +1,108 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.entities.synthetic_data import SynthesizerType
+from app.use_cases.services.incremental_fit import (
+    _correlation, _extend_lineage, _lineage, _merge_moments, _moment_parameters, _moments, _score_statistics,
+    _merge_score_statistics, appended_rows,
+)
+from app.use_cases.services.synthesizer_cache import SynthesizerCache
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"age": rng.normal(30, 5, rows), "sex": rng.choice(["f", "m"], rows)})
+
+
+def test_appended_rows_are_detected_by_block_hashes():
+    data = make_frame(25)
+    lineage = _lineage(data.iloc[:17], block_rows=5)
+
+    assert appended_rows(lineage, data).equals(data.iloc[17:])
+    assert appended_rows(lineage, data.iloc[:17]).empty
+    assert _extend_lineage(lineage, data) == _lineage(data, block_rows=5)
+
+    modified = data.copy()
+    modified.loc[3, "age"] += 1
+    assert appended_rows(lineage, modified) is None
+    assert appended_rows(lineage, data.iloc[:10]) is None
+    assert appended_rows(lineage, data.rename(columns={"age": "AGE"})) is None
+
+
+def test_pooled_statistics_match_the_whole_data():
+    values = make_frame(1000)[["age"]].assign(fare=lambda frame: frame["age"] * 2 + 1)
+    moments = _merge_moments(_moments(values.iloc[:700]), _moments(values.iloc[700:]))
+    expected = _moments(values)
+    for name in expected:
+        np.testing.assert_allclose(moments[name], expected[name])
+
+    scores = values.to_numpy()
+    pooled = _merge_score_statistics(_score_statistics(scores[:700]), _score_statistics(scores[700:]))
+    np.testing.assert_allclose(_correlation(pooled), np.corrcoef(scores, rowvar=False), atol=1e-9)
+
+
+@pytest.mark.parametrize("kind", ["gaussian.GaussianUnivariate", "beta.BetaUnivariate", "gamma.GammaUnivariate",
+                                  "truncated_gaussian.TruncatedGaussian", "uniform.UniformUnivariate"])
+def test_moment_parameters_of_supported_marginals(kind):
+    univariate = {"type": f"copulas.univariate.{kind}", "loc": 0.0, "scale": 1.0}
+    parameters = _moment_parameters(univariate, count=100, mean=2.0, m2=100.0, low=0.5, high=5.0)
+
+    assert parameters["type"] == univariate["type"]
+    assert parameters["scale"] > 0
+    if kind.startswith("gaussian"):
+        assert parameters == {**univariate, "loc": 2.0, "scale": 1.0}
+
+
+def test_moment_parameters_refuse_non_parametric_marginals():
+    univariate = {"type": "copulas.univariate.gaussian_kde.GaussianKDE", "dataset": [1.0, 2.0]}
+    assert _moment_parameters(univariate, count=100, mean=2.0, m2=100.0, low=0.5, high=5.0) is None
+
+
+class FakeSynthesizer:
+    def __init__(self, rows: int):
+        self.rows = rows
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+
+class FakeFactory:
+    @staticmethod
+    def load_synthesizer(synthesizer_type, path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def test_cache_refits_from_the_previous_version_of_the_source(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    cache = SynthesizerCache(FakeFactory(), str(tmp_path / "cache"), max_bytes=10 ** 9, max_memory_entries=4)
+    fits, refits = [], []
+
+    def get(rows: int):
+        csv_path.write_text("x\n" * rows)
+
+        def fit():
+            fits.append(rows)
+            return FakeSynthesizer(rows)
+
+        def refit(synthesizer, state):
+            refits.append((synthesizer.rows, state["rows"]))
+            synthesizer.rows = rows
+            return {"rows": rows}
+
+        return cache.get_or_fit(str(csv_path), "raw", SynthesizerType.gaussiancopula, None, fit,
+                                refit_fn=refit, state_fn=lambda synthesizer: {"rows": synthesizer.rows})
+
+    assert get(10).rows == 10
+    assert get(15).rows == 15
+    assert get(20).rows == 20
+
+    assert fits == [10]
+    assert refits == [(10, 10), (15, 15)]
+    # Only the entry of the current version is left
+    assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+import pandas as pd
+
+from app.entities.task_status import ProgressEvent, ProgressStage, TaskStatusEnum
+from app.use_cases.services.progress import EpochProgressMonitor, TaskProgressPublisher
+from app.use_cases.services.progress_broker import ProgressBroker, listen_dsn
+
+
+def test_broker_fans_events_out_to_the_subscribers_of_the_task():
+    async def scenario():
+        broker = ProgressBroker(None, "task_progress", queue_size=10)
+        async with broker.subscribe(1) as first, broker.subscribe(1) as second, broker.subscribe(2) as other:
+            broker.publish(ProgressEvent(task_id=1, stage=ProgressStage.TRAINING))
+            assert (await first.get()).stage == ProgressStage.TRAINING
+            assert (await second.get()).stage == ProgressStage.TRAINING
+            assert other.empty()
+        assert broker.latest(1).stage == ProgressStage.TRAINING
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscribers_lose_their_oldest_events():
+    async def scenario():
+        broker = ProgressBroker(None, "task_progress", queue_size=2)
+        async with broker.subscribe(1) as queue:
+            for epoch in range(1, 4):
+                broker.publish(ProgressEvent(task_id=1, stage=ProgressStage.FIT_EPOCH, epoch=epoch))
+            return [queue.get_nowait().epoch for _ in range(queue.qsize())]
+
+    assert asyncio.run(scenario()) == [2, 3]
+
+
+def test_listen_dsn_only_for_postgresql():
+    assert listen_dsn("sqlite://") is None
+    assert listen_dsn("postgresql+psycopg2://user:pw@db/app") == "postgresql://user:pw@db/app"
+
+
+def test_publisher_builds_events_of_its_task():
+    published = []
+    progress = TaskProgressPublisher(7, published.append)
+    progress(ProgressStage.SAMPLING, progress=0.5)
+    progress.status(TaskStatusEnum.FAILED, "boom")
+
+    assert [(e.task_id, e.stage, e.progress, e.status) for e in published] == [
+        (7, ProgressStage.SAMPLING, 0.5, None),
+        (7, ProgressStage.STATUS, None, TaskStatusEnum.FAILED),
+    ]
+
+
+class FakeGANSynthesizer:
+    """Mimics an SDV GAN synthesizer whose model logs one loss row per epoch."""
+
+    class Model:
+        loss_values = pd.DataFrame()
+
+    def __init__(self, epochs: int):
+        self.epochs = epochs
+
+    def get_parameters(self):
+        return {"epochs": self.epochs}
+
+    def fit(self):
+        self._model = self.Model()
+        for epoch in range(self.epochs):
+            self._model.loss_values = pd.DataFrame({"Epoch": range(epoch + 1)})
+            time.sleep(0.03)
+
+
+def test_epoch_monitor_reports_the_epochs_of_the_fit():
+    events = []
+    synthesizer = FakeGANSynthesizer(epochs=3)
+    with EpochProgressMonitor(synthesizer, lambda stage, **details: events.append(details), interval_seconds=0.01):
+        synthesizer.fit()
+        time.sleep(0.05)
+
+    epochs = [event["epoch"] for event in events]
+    assert epochs == sorted(set(epochs)) and epochs[-1] == 3
+    assert events[-1]["progress"] == 1.0 and events[-1]["total_epochs"] == 3
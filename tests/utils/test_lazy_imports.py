@@ -0,0 +1,28 @@
+import json
+import os
+import subprocess
+import sys
+
+from app.utils.lazy_imports import loaded_ml_packages, preload_ml_modules
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def test_service_modules_do_not_import_ml_packages():
+    # A fresh interpreter, since other tests may already have imported them
+    probe = (
+        "import json, sys; sys.path.insert(0, %r)\n"
+        "import app.use_cases.services.data_service, app.use_cases.tasks.data_tasks\n"
+        "from app.utils.lazy_imports import loaded_ml_packages\n"
+        "print(json.dumps(loaded_ml_packages()))" % ROOT
+    )
+    env = {**os.environ, "DATABASE_URL": "sqlite://", "SECRET_KEY": "test-secret"}
+    completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, env=env, check=True)
+
+    assert json.loads(completed.stdout) == []
+
+
+def test_preload_imports_the_given_modules():
+    assert preload_ml_modules(("json", "sqlite3")) >= 0
+    assert "sqlite3" in sys.modules
+    assert isinstance(loaded_ml_packages(), list)
@@ -0,0 +1,12 @@
+from app.utils.password_hasher import PasswordHasher
+
+
+def test_hashes_with_a_lower_cost_are_upgraded_on_verification():
+    old_hash = PasswordHasher(bcrypt_rounds=4).hash_password("secret")
+    hasher = PasswordHasher(bcrypt_rounds=5)
+
+    verified, new_hash = hasher.verify_and_update("secret", old_hash)
+    assert verified
+    assert new_hash is not None and hasher.verify_password("secret", new_hash)
+    assert hasher.verify_and_update("secret", new_hash) == (True, None)
+    assert hasher.verify_and_update("wrong", old_hash) == (False, None)
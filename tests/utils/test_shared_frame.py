@@ -0,0 +1,24 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from app.utils.shared_frame import SharedFrame
+
+CSV_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "tested.csv")
+
+
+def test_shared_frame_round_trips_through_a_spawn_pool():
+    data = pd.read_csv(CSV_PATH)
+    shared = SharedFrame.create(data)
+    try:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+            frames = list(pool.map(SharedFrame.read, [shared.name] * 2, [shared.size] * 2))
+    finally:
+        shared.close()
+
+    for frame in frames:
+        pd.testing.assert_frame_equal(frame.fillna(np.nan), data)
@@ -0,0 +1,52 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_for_a_key_share_one_execution():
+    single_flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "scores"
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(single_flight.do, 1, compute)
+        started.wait(5)
+        followers = [executor.submit(single_flight.do, 1, compute) for _ in range(3)]
+        other_key = executor.submit(single_flight.do, 2, lambda: "other")
+        assert other_key.result(5) == "other"
+        release.set()
+
+        assert leader.result(5) == "scores"
+        assert [follower.result(5) for follower in followers] == ["scores"] * 3
+    assert len(calls) == 1
+
+    # Nothing is cached once the call has finished
+    assert single_flight.do(1, lambda: "again") == "again"
+
+
+def test_followers_get_the_exception_of_the_leader():
+    single_flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("Synthetic data not found")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, 1, fail)
+        started.wait(5)
+        follower = executor.submit(single_flight.do, 1, fail)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result(5)
@@ -0,0 +1,48 @@
+import pstats
+import time
+
+from app.utils.stage_profiler import StageProfiler, profiled
+
+
+def test_repeated_stages_are_summed_in_first_run_order():
+    profiler = StageProfiler("test")
+    for _ in range(2):
+        with profiler.stage("sample"):
+            time.sleep(0.01)
+        with profiler.stage("train"):
+            sum(range(100_000))
+
+    timings = profiler.timings()
+    assert list(timings) == ["sample", "train"]
+    assert timings["sample"]["calls"] == 2
+    assert timings["sample"]["wall_seconds"] >= 0.02
+    assert timings["train"]["cpu_seconds"] > 0
+    assert timings["train"]["peak_rss_bytes"] > 0
+
+
+def test_failed_stages_are_recorded():
+    profiler = StageProfiler("test")
+    try:
+        with profiler.stage("fit"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert profiler.timings()["fit"]["calls"] == 1
+
+
+class Service:
+    @profiled("run")
+    def run(self, value, profiler=None):
+        with profiler.stage("double"):
+            return value * 2
+
+
+def test_profiled_methods_record_into_the_callers_profiler(tmp_path):
+    path = tmp_path / "run.prof"
+    profiler = StageProfiler("run", str(path))
+
+    assert Service().run(21, profiler=profiler) == 42
+    assert list(profiler.timings()) == ["double"]
+    assert pstats.Stats(str(path)).total_calls > 0
+    # Without a profiler, the method gets a fresh one
+    assert Service().run(1) == 2